@@ -11,16 +11,44 @@ DEFAULT_LOG_MAX_BYTES = 5 * 1024 * 1024  # 5MB default
 DEFAULT_MAX_WORKERS = 4  # Default number of concurrent workers
 DEFAULT_ISSUE_NUMBER_PADDING = 4  # Default padding for issue numbers
 DEFAULT_DB_CACHE_SIZE_MB = 64  # Default SQLite cache size in MB
+# Directories that never hold comics (NAS metadata, recycle bins, OS folders), skipped
+# when walking the watched directory. Hidden (dot) directories are always skipped.
+DEFAULT_SKIP_DIRS = frozenset({
+    '@eaDir', '@Recycle', '#recycle', '#snapshot', '__MACOSX', '$RECYCLE.BIN',
+    'System Volume Information', 'lost+found', 'node_modules',
+})
 DEFAULT_GITHUB_TOKEN = ''  # Default GitHub token
 DEFAULT_GITHUB_REPOSITORY = 'mleenorris/ComicMaintainer'  # Default GitHub repository
 DEFAULT_GITHUB_ISSUE_ASSIGNEE = 'copilot'  # Default GitHub issue assignee
 
+# Parsed config keyed by the config file's identity, see get_config()
+_config_cache = None
+
 def get_config():
-    """Get the current configuration"""
-    if os.path.exists(CONFIG_FILE):
+    """Get the current configuration
+    
+    The watcher checks settings on every file event and the web app on most
+    requests. The parsed file is cached and only re-read when its inode, mtime
+    or size changes, so an unchanged config costs one stat() instead of an
+    open/read/parse. save_config() replaces the file, which changes the inode,
+    so saves from any process are picked up. Callers get their own copy.
+    """
+    global _config_cache
+    try:
+        st = os.stat(CONFIG_FILE)
+    except OSError:
+        st = None
+    
+    if st is not None:
+        key = (CONFIG_FILE, st.st_ino, st.st_mtime_ns, st.st_size)
+        cached = _config_cache
+        if cached is not None and cached[0] == key:
+            return dict(cached[1])
         try:
             with open(CONFIG_FILE, 'r') as f:
-                return json.load(f)
+                config = json.load(f)
+            _config_cache = (key, config)
+            return dict(config)
         except Exception as e:
             logging.error(f"Error reading config file: {e}")
     
@@ -32,15 +60,26 @@ def get_config():
     }
 
 def save_config(config):
-    """Save configuration to file"""
+    """Save configuration to file
+    
+    Writes to a temporary file and renames it over the config file, so readers in
+    other processes (web workers, watcher) never see a partially written file and
+    a crash mid-write cannot leave a corrupt config behind.
+    """
+    tmp_file = f"{CONFIG_FILE}.tmp.{os.getpid()}"
     try:
         # Ensure config directory exists
         os.makedirs(CONFIG_DIR, exist_ok=True)
-        with open(CONFIG_FILE, 'w') as f:
+        with open(tmp_file, 'w') as f:
             json.dump(config, f, indent=2)
+        os.replace(tmp_file, CONFIG_FILE)
         return True
     except Exception as e:
         logging.error(f"Error saving config file: {e}")
+        try:
+            os.remove(tmp_file)
+        except OSError:
+            pass
         return False
 
 def get_filename_format():
@@ -134,6 +173,16 @@ def get_db_cache_size_mb():
     
     # Fall back to default
     return DEFAULT_DB_CACHE_SIZE_MB
+
+def get_skip_dirs():
+    """Get the directory names skipped while walking the watched directory
+    
+    COMIC_SKIP_DIRS adds comma-separated names to DEFAULT_SKIP_DIRS.
+    """
+    env_value = os.environ.get('COMIC_SKIP_DIRS', '')
+    extra = {name.strip() for name in env_value.split(',') if name.strip()}
+    return DEFAULT_SKIP_DIRS | extra
+
 def get_github_token():
     """Get the GitHub token setting"""
     # Check environment variable first
@@ -31,6 +31,7 @@ def validate_env_vars() -> Tuple[bool, List[str]]:
         'PROCESS_SCRIPT': ('/app/process_file.py', 'Script to run for processing'),
         'WEB_PORT': ('5000', 'Port for the web interface'),
         'GUNICORN_WORKERS': ('2', 'Number of Gunicorn worker processes'),
+        'GUNICORN_THREADS': ('8', 'Number of request threads per Gunicorn worker'),
         'PUID': ('99', 'User ID to run as'),
         'PGID': ('100', 'Group ID to run as'),
         'MAX_WORKERS': ('4', 'Number of concurrent worker threads'),
@@ -62,6 +63,7 @@ def validate_env_vars() -> Tuple[bool, List[str]]:
     numeric_vars = {
         'WEB_PORT': (1, 65535),
         'GUNICORN_WORKERS': (1, 32),
+        'GUNICORN_THREADS': (1, 64),
         'PUID': (0, 65535),
         'PGID': (0, 65535),
         'MAX_WORKERS': (1, 64),
@@ -135,6 +137,7 @@ def print_env_summary():
         'DUPLICATE_DIR': os.environ.get('DUPLICATE_DIR', 'NOT SET'),
         'WEB_PORT': os.environ.get('WEB_PORT', '5000'),
         'GUNICORN_WORKERS': os.environ.get('GUNICORN_WORKERS', '2'),
+        'GUNICORN_THREADS': os.environ.get('GUNICORN_THREADS', '8'),
         'MAX_WORKERS': os.environ.get('MAX_WORKERS', '4'),
         'PUID': os.environ.get('PUID', '99'),
         'PGID': os.environ.get('PGID', '100'),
@@ -15,8 +15,8 @@ import json
 import logging
 import threading
 from queue import Queue, Empty
-from typing import Dict, Any, Set, Optional
-from dataclasses import dataclass, asdict
+from typing import Dict, Any, FrozenSet, Optional
+from dataclasses import dataclass, asdict, field
 
 
 @dataclass
@@ -25,19 +25,23 @@ class Event:
     type: str
     data: Dict[str, Any]
     timestamp: float = None
+    # Encoded SSE message, built on first use and shared by every client
+    _sse: Optional[str] = field(default=None, init=False, repr=False, compare=False)
     
     def __post_init__(self):
         if self.timestamp is None:
             self.timestamp = time.time()
     
     def to_sse_format(self) -> str:
-        """Convert event to SSE format"""
-        event_data = {
-            'type': self.type,
-            'data': self.data,
-            'timestamp': self.timestamp
-        }
-        return f"data: {json.dumps(event_data)}\n\n"
+        """Convert event to SSE format (encoded once, not once per client)"""
+        if self._sse is None:
+            event_data = {
+                'type': self.type,
+                'data': self.data,
+                'timestamp': self.timestamp
+            }
+            self._sse = f"data: {json.dumps(event_data)}\n\n"
+        return self._sse
 
 
 class EventBroadcaster:
@@ -62,7 +66,9 @@ class EventBroadcaster:
             return
         
         self._initialized = True
-        self._clients: Set[Queue] = set()
+        # Copy-on-write: writers swap in a new frozenset under the lock, so
+        # broadcast() iterates a snapshot without taking it
+        self._clients: FrozenSet[Queue] = frozenset()
         self._clients_lock = threading.Lock()
         self._event_count = 0
         # Store last event of each type. For job_updated events, key is (event_type, job_id)
@@ -81,7 +87,7 @@ class EventBroadcaster:
         client_queue = Queue(maxsize=100)  # Buffer up to 100 events
         
         with self._clients_lock:
-            self._clients.add(client_queue)
+            self._clients = self._clients | {client_queue}
             client_count = len(self._clients)
         
         logging.info(f"Client subscribed to events (total: {client_count})")
@@ -103,7 +109,7 @@ class EventBroadcaster:
             client_queue: The client's event queue
         """
         with self._clients_lock:
-            self._clients.discard(client_queue)
+            self._clients = self._clients - {client_queue}
             client_count = len(self._clients)
         
         logging.info(f"Client unsubscribed from events (remaining: {client_count})")
@@ -128,30 +134,29 @@ class EventBroadcaster:
         
         self._last_events[storage_key] = event
         
-        with self._clients_lock:
-            dead_clients = set()
-            
-            for client_queue in self._clients:
-                try:
-                    # Non-blocking put - drop event if queue is full
-                    client_queue.put_nowait(event)
-                except:
-                    # Queue is full or client is dead
-                    dead_clients.add(client_queue)
-            
-            # Clean up dead clients
-            for dead_client in dead_clients:
-                self._clients.discard(dead_client)
-            
-            active_clients = len(self._clients)
+        dead_clients = set()
+        
+        for client_queue in self._clients:
+            try:
+                # Non-blocking put - drop event if queue is full
+                client_queue.put_nowait(event)
+            except:
+                # Queue is full or client is dead
+                dead_clients.add(client_queue)
+        
+        # Clean up dead clients
+        if dead_clients:
+            with self._clients_lock:
+                self._clients = self._clients - dead_clients
+        
+        active_clients = len(self._clients)
         
         self._event_count += 1
         logging.debug(f"Broadcast event '{event_type}' to {active_clients} clients (total events: {self._event_count})")
     
     def get_client_count(self) -> int:
         """Get the number of active subscribed clients"""
-        with self._clients_lock:
-            return len(self._clients)
+        return len(self._clients)
     
     def get_event_count(self) -> int:
         """Get the total number of events broadcast"""
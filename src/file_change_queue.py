@@ -0,0 +1,146 @@
+"""
+Debounced queue of file store changes.
+
+Bulk web operations and bursts of watcher events (e.g. deleting a whole series
+folder) can record thousands of add/remove/rename changes in quick succession.
+Applying each one immediately costs one SQLite commit per file. This module
+buffers changes in memory and applies them in a single transaction via
+unified_store.apply_file_changes(), either from a background flusher thread
+or explicitly before the store is read.
+
+Each process uses one shared queue (get_file_change_queue()), so changes made
+by process_file() inside the web app land in the same batches as the web app's
+own changes.
+"""
+
+import atexit
+import collections
+import logging
+import threading
+from typing import Optional
+
+import file_store
+
+# Debounce window in seconds
+DEFAULT_FLUSH_INTERVAL = 0.05
+# Flush early once this many changes are queued
+DEFAULT_FLUSH_THRESHOLD = 512
+
+
+class FileChangeQueue:
+    """
+    Thread-safe queue of (change_type, old_path, new_path) tuples applied in batches.
+
+    Each process owns its own queue; changes reach other processes through the
+    shared SQLite store once flushed.
+    """
+
+    def __init__(self, flush_interval: float = DEFAULT_FLUSH_INTERVAL,
+                 flush_threshold: int = DEFAULT_FLUSH_THRESHOLD,
+                 name: str = "file-change-flusher"):
+        self.flush_interval = flush_interval
+        self.flush_threshold = flush_threshold
+        self.name = name
+        self._queue = collections.deque()
+        self._lock = threading.Lock()
+        # Held across dequeue and apply so batches land in order
+        self._flush_lock = threading.Lock()
+        self._pending = threading.Event()
+        self._full = threading.Event()
+        self._started = False
+
+    @property
+    def started(self) -> bool:
+        """Whether the background flusher is running"""
+        return self._started
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._queue)
+
+    def record(self, change_type: str, old_path: Optional[str] = None, new_path: Optional[str] = None):
+        """
+        Queue a file change for the file store.
+
+        Args:
+            change_type: 'add', 'remove', or 'rename'
+            old_path: Original file path (for 'remove' and 'rename')
+            new_path: New file path (for 'add' and 'rename')
+        """
+        with self._lock:
+            self._queue.append((change_type, old_path, new_path))
+            pending = len(self._queue)
+
+        self._pending.set()
+        if pending > self.flush_threshold:
+            self._full.set()
+
+    def flush(self) -> int:
+        """
+        Apply all queued file changes to the file store in one transaction.
+
+        Returns:
+            Number of changes applied
+        """
+        # Idle fast path (every /api/files request flushes): nothing queued and
+        # no batch in flight, so there is nothing to wait for. The queue is checked
+        # first; a batch dequeued before that check holds _flush_lock until applied.
+        if not self._queue and not self._flush_lock.locked():
+            return 0
+        
+        with self._flush_lock:
+            with self._lock:
+                if not self._queue:
+                    return 0
+                changes = list(self._queue)
+                self._queue.clear()
+
+            try:
+                applied = file_store.apply_file_changes(changes)
+                logging.info(f"Applied {applied} queued file change(s) to store")
+                return applied
+            except Exception as e:
+                logging.error(f"Error recording file changes, will retry: {e}")
+                # Put the batch back ahead of anything queued meanwhile so it is
+                # retried (in order) by the next flush instead of being lost
+                with self._lock:
+                    self._queue.extendleft(reversed(changes))
+                self._pending.set()
+                return 0
+
+    def start(self):
+        """Start the background flusher thread (once per queue)"""
+        with self._lock:
+            if self._started:
+                return
+            self._started = True
+
+        flusher = threading.Thread(target=self._run, name=self.name, daemon=True)
+        flusher.start()
+        # Apply anything still queued when the process exits
+        atexit.register(self.flush)
+        logging.info("File change flusher started")
+
+    def _run(self):
+        """Background thread that drains the queue (event-based, not polling)"""
+        while True:
+            self._pending.wait()
+            # Debounce: let a burst accumulate, but flush early once the queue is full
+            self._full.wait(self.flush_interval)
+            self._pending.clear()
+            self._full.clear()
+            self.flush()
+
+
+_default_queue = None
+_default_queue_lock = threading.Lock()
+
+
+def get_file_change_queue() -> FileChangeQueue:
+    """Get the process-wide file change queue (created on first use)"""
+    global _default_queue
+    if _default_queue is None:
+        with _default_queue_lock:
+            if _default_queue is None:
+                _default_queue = FileChangeQueue()
+    return _default_queue
@@ -18,10 +18,13 @@ from unified_store import (
     clear_all_files,
     batch_add_files,
     batch_remove_files,
+    apply_file_changes,
     sync_with_filesystem,
+    sync_with_filesystem_if_stale,
     set_metadata,
     get_metadata,
     get_last_sync_timestamp,
+    get_store_version,
     migrate_from_old_databases,
     get_files_paginated,
     get_unmarked_file_count
@@ -45,10 +48,13 @@ __all__ = [
     'clear_all_files',
     'batch_add_files',
     'batch_remove_files',
+    'apply_file_changes',
     'sync_with_filesystem',
+    'sync_with_filesystem_if_stale',
     'set_metadata',
     'get_metadata',
     'get_last_sync_timestamp',
+    'get_store_version',
     'get_files_paginated',
     'get_unmarked_file_count',
     'CONFIG_DIR',
@@ -295,6 +295,8 @@ def get_job(job_id: str) -> Optional[Dict[str, Any]]:
             ''', (job_id,))
             results = cursor.fetchall()
             
+            failed_items = [r['item'] for r in results if not r['success']]
+            
             # Build response
             job = {
                 'job_id': job_row['job_id'],
@@ -311,6 +313,10 @@ def get_job(job_id: str) -> Optional[Dict[str, Any]]:
                     }
                     for r in results
                 ],
+                # True only once every item has been processed without an error
+                'success': (job_row['status'] == 'completed' and not failed_items
+                            and len(results) == job_row['total_items']),
+                'failed_items': failed_items,
                 'error': job_row['error'],
                 'created_at': job_row['created_at'],
                 'started_at': job_row['started_at'],
@@ -10,9 +10,12 @@ from unified_store import (
     add_marker,
     remove_marker,
     has_marker,
+    get_file_markers,
     get_markers,
     get_all_markers_by_type,
     cleanup_markers,
+    apply_marker_changes,
+    get_store_version,
     migrate_from_old_databases
 )
 
@@ -22,9 +25,12 @@ __all__ = [
     'add_marker',
     'remove_marker',
     'has_marker',
+    'get_file_markers',
     'get_markers',
     'get_all_markers_by_type',
     'cleanup_markers',
+    'apply_marker_changes',
+    'get_store_version',
 ]
 
 # Trigger migration on first import
@@ -8,6 +8,9 @@ Key Features:
 - WAL mode enables concurrent reads and writes
 - More efficient storage and retrieval
 - Better scalability for large file collections
+- Shared by all web workers and the watcher: each process caches marker sets
+  in memory and revalidates them against the store's markers_version counter,
+  which triggers bump on every marker write from any process
 
 Migration from JSON:
 If JSON marker files exist, they will be automatically imported on first use.
@@ -18,8 +21,13 @@ import os
 import json
 import logging
 import threading
-from typing import Set, Optional
-from marker_store import add_marker, remove_marker, has_marker, get_markers, cleanup_markers, get_all_markers_by_type
+import contextlib
+import contextvars
+from typing import Dict, FrozenSet, List, Set, Optional, Tuple
+from marker_store import (
+    add_marker, remove_marker, has_marker, get_file_markers, get_markers, cleanup_markers,
+    get_all_markers_by_type, apply_marker_changes, get_store_version
+)
 
 # Marker storage configuration (for legacy JSON migration)
 CONFIG_DIR = os.environ.get('CONFIG_DIR', '/Config')
@@ -42,12 +50,141 @@ _web_modified_lock = threading.Lock()
 _migration_lock = threading.Lock()
 _migrated = set()  # Track which marker types have been migrated
 
+# Marker sets per type, tagged with the store's markers_version when loaded.
+# Triggers bump the version on every marker write from any process, so a
+# matching version means the cached set is still current. Entries are
+# immutable (version, frozenset) tuples replaced whole, so no lock is needed.
+_marker_cache: Dict[str, Tuple[int, FrozenSet[str]]] = {}
+
+# Flush a marker batch early once this many changes are buffered
+MARKER_BATCH_FLUSH_THRESHOLD = 100
+
+
+class MarkerBatch:
+    """
+    Buffer of processed/duplicate marker changes applied in one transaction.
+    
+    Shared between the worker threads of a bulk operation: each worker joins the
+    batch with batched_markers(batch), and the owner calls flush() when done.
+    Buffered changes are not visible to is_file_*() until flushed. Web modified
+    markers are never buffered, since the watcher must see them before the
+    processed file changes on disk.
+    """
+    
+    def __init__(self, flush_threshold: int = MARKER_BATCH_FLUSH_THRESHOLD):
+        self.flush_threshold = flush_threshold
+        self._changes: List[Tuple[str, str, str]] = []
+        self._lock = threading.Lock()
+    
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._changes)
+    
+    def record(self, changes: List[Tuple[str, str, str]]):
+        """Buffer (operation, filepath, marker_type) changes, flushing once the batch is full"""
+        with self._lock:
+            self._changes.extend(changes)
+            full = len(self._changes) >= self.flush_threshold
+        if full:
+            self.flush()
+    
+    def flush(self) -> int:
+        """Apply all buffered changes in one transaction, returning the number applied"""
+        with self._lock:
+            changes = self._changes
+            self._changes = []
+        if not changes:
+            return 0
+        try:
+            return apply_marker_changes(changes)
+        except Exception as e:
+            logging.error(f"Error applying {len(changes)} batched marker change(s): {e}")
+            return 0
+
+
+_current_batch: contextvars.ContextVar = contextvars.ContextVar('marker_batch', default=None)
+
+
+@contextlib.contextmanager
+def batched_markers(batch: Optional[MarkerBatch] = None):
+    """
+    Buffer processed/duplicate marker writes made in this context.
+    
+    Without arguments a new batch is created and flushed on exit. Pass an
+    existing batch to join it (e.g. from a worker thread); the owner flushes it.
+    
+    Example:
+        with batched_markers():
+            for path in files:
+                mark_file_processed(path)
+    """
+    owner = batch is None
+    if owner:
+        batch = MarkerBatch()
+    token = _current_batch.set(batch)
+    try:
+        yield batch
+    finally:
+        _current_batch.reset(token)
+        if owner:
+            batch.flush()
+
+
+def _write_marker_changes(changes: List[Tuple[str, str, str]]):
+    """Apply marker changes now, or buffer them if a marker batch is active"""
+    batch = _current_batch.get()
+    if batch is not None:
+        batch.record(changes)
+    elif len(changes) == 1:
+        operation, filepath, marker_type = changes[0]
+        if operation == 'add':
+            add_marker(filepath, marker_type)
+        else:
+            remove_marker(filepath, marker_type)
+    else:
+        apply_marker_changes(changes)
+
+
+def _get_cached_markers(marker_types: List[str]) -> Dict[str, FrozenSet[str]]:
+    """
+    Get the marker sets for the given types, reloading only those that changed.
+    
+    Costs one version lookup when nothing changed since the last load.
+    """
+    versions = get_store_version()
+    if versions is None:
+        data = get_all_markers_by_type(marker_types)
+        return {marker_type: frozenset(data.get(marker_type, ())) for marker_type in marker_types}
+    
+    # Read before loading: a write landing in between only makes the tag stale,
+    # which costs one extra reload, never a stale hit
+    markers_version = versions[1]
+    result = {}
+    for marker_type in marker_types:
+        cached = _marker_cache.get(marker_type)
+        if cached is not None and cached[0] == markers_version:
+            result[marker_type] = cached[1]
+    
+    missing = [marker_type for marker_type in marker_types if marker_type not in result]
+    if missing:
+        data = get_all_markers_by_type(missing)
+        for marker_type in missing:
+            markers = frozenset(data.get(marker_type, ()))
+            _marker_cache[marker_type] = (markers_version, markers)
+            result[marker_type] = markers
+    
+    return result
+
 
 def _migrate_json_markers(marker_file: str, marker_type: str):
     """
     Migrate markers from legacy JSON file to SQLite database.
     This is called once per marker type on first access.
     """
+    # Fast path: every marker check calls this, so skip the lock once migrated
+    if marker_type in _migrated:
+        return
+    
     with _migration_lock:
         # Check if already migrated
         if marker_type in _migrated:
@@ -132,23 +269,64 @@ def mark_file_processed(filepath: str, original_filepath: Optional[str] = None):
     _migrate_json_markers(PROCESSED_MARKER_FILE, MARKER_TYPE_PROCESSED)
     abs_path = os.path.abspath(filepath)
     
-    # If file was renamed, remove the old path
+    # If file was renamed, swap the old path for the new one in a single transaction
     if original_filepath and original_filepath != filepath:
         old_abs_path = os.path.abspath(original_filepath)
         if has_marker(old_abs_path, MARKER_TYPE_PROCESSED):
-            remove_marker(old_abs_path, MARKER_TYPE_PROCESSED)
-            logging.info(f"Removed old path '{original_filepath}' from processed marker after rename")
+            _write_marker_changes([
+                ('remove', old_abs_path, MARKER_TYPE_PROCESSED),
+                ('add', abs_path, MARKER_TYPE_PROCESSED),
+            ])
+            logging.info("Removed old path '%s' from processed marker after rename", original_filepath)
+            logging.info("Marked %s as processed", filepath)
+            return
     
     # Add current file
-    add_marker(abs_path, MARKER_TYPE_PROCESSED)
-    logging.info(f"Marked {filepath} as processed")
+    _write_marker_changes([('add', abs_path, MARKER_TYPE_PROCESSED)])
+    logging.info("Marked %s as processed", filepath)
+
+
+def get_processed_files() -> FrozenSet[str]:
+    """
+    Get the absolute paths of all processed files with a single query.
+    
+    Use this instead of is_file_processed() when checking many files at once.
+    """
+    _migrate_json_markers(PROCESSED_MARKER_FILE, MARKER_TYPE_PROCESSED)
+    return _get_cached_markers([MARKER_TYPE_PROCESSED])[MARKER_TYPE_PROCESSED]
 
 
 def unmark_file_processed(filepath: str):
     """Remove a file from the processed marker (e.g., when deleted)"""
     _migrate_json_markers(PROCESSED_MARKER_FILE, MARKER_TYPE_PROCESSED)
     abs_path = os.path.abspath(filepath)
-    remove_marker(abs_path, MARKER_TYPE_PROCESSED)
+    _write_marker_changes([('remove', abs_path, MARKER_TYPE_PROCESSED)])
+
+
+def clear_file_markers(filepath: str):
+    """Remove the processed and duplicate markers for a file in one transaction (e.g., when deleted)"""
+    _migrate_json_markers(PROCESSED_MARKER_FILE, MARKER_TYPE_PROCESSED)
+    _migrate_json_markers(DUPLICATE_MARKER_FILE, MARKER_TYPE_DUPLICATE)
+    abs_path = os.path.abspath(filepath)
+    _write_marker_changes([
+        ('remove', abs_path, MARKER_TYPE_PROCESSED),
+        ('remove', abs_path, MARKER_TYPE_DUPLICATE),
+    ])
+
+
+def get_file_marker_types(filepath: str) -> Set[str]:
+    """
+    Get every marker type set on a file with a single lookup.
+    
+    Use this instead of separate is_file_*() calls when several markers of the
+    same file are needed (e.g. the watcher checks web modified and processed
+    for every event).
+    """
+    _migrate_json_markers(PROCESSED_MARKER_FILE, MARKER_TYPE_PROCESSED)
+    _migrate_json_markers(DUPLICATE_MARKER_FILE, MARKER_TYPE_DUPLICATE)
+    _migrate_json_markers(WEB_MODIFIED_MARKER_FILE, MARKER_TYPE_WEB_MODIFIED)
+    abs_path = os.path.abspath(filepath)
+    return get_file_markers(abs_path)
 
 
 # Duplicate files marker functions
@@ -163,15 +341,15 @@ def mark_file_duplicate(filepath: str):
     """Mark a file as a duplicate"""
     _migrate_json_markers(DUPLICATE_MARKER_FILE, MARKER_TYPE_DUPLICATE)
     abs_path = os.path.abspath(filepath)
-    add_marker(abs_path, MARKER_TYPE_DUPLICATE)
-    logging.info(f"Marked {filepath} as duplicate")
+    _write_marker_changes([('add', abs_path, MARKER_TYPE_DUPLICATE)])
+    logging.info("Marked %s as duplicate", filepath)
 
 
 def unmark_file_duplicate(filepath: str):
     """Remove a file from the duplicate marker"""
     _migrate_json_markers(DUPLICATE_MARKER_FILE, MARKER_TYPE_DUPLICATE)
     abs_path = os.path.abspath(filepath)
-    remove_marker(abs_path, MARKER_TYPE_DUPLICATE)
+    _write_marker_changes([('remove', abs_path, MARKER_TYPE_DUPLICATE)])
 
 
 # Web modified files marker functions
@@ -195,7 +373,7 @@ def clear_file_web_modified(filepath: str):
     abs_path = os.path.abspath(filepath)
     if has_marker(abs_path, MARKER_TYPE_WEB_MODIFIED):
         remove_marker(abs_path, MARKER_TYPE_WEB_MODIFIED)
-        logging.info(f"Cleared web modified marker for {filepath}")
+        logging.info("Cleared web modified marker for %s", filepath)
         return True
     return False
 
@@ -212,14 +390,15 @@ def cleanup_web_modified_markers(max_files: int = 100):
 def get_all_marker_data():
     """
     Get all marker data (processed and duplicate) in a single batch query.
-    This is much faster than checking each file individually.
+    This is much faster than checking each file individually. The sets are
+    cached until the markers change, so repeated calls cost one version lookup.
     
     Returns:
-        Dict with 'processed' and 'duplicate' keys, each containing a set of filepaths
+        Dict with 'processed' and 'duplicate' keys, each containing a frozenset of filepaths
     """
     # Ensure migrations are done
     _migrate_json_markers(PROCESSED_MARKER_FILE, MARKER_TYPE_PROCESSED)
     _migrate_json_markers(DUPLICATE_MARKER_FILE, MARKER_TYPE_DUPLICATE)
     
-    # Get all markers in one query
-    return get_all_markers_by_type([MARKER_TYPE_PROCESSED, MARKER_TYPE_DUPLICATE])
+    # Get all markers in one query, or from the cache if unchanged
+    return _get_cached_markers([MARKER_TYPE_PROCESSED, MARKER_TYPE_DUPLICATE])
@@ -2,6 +2,7 @@ import sys
 import os
 import re
 import logging
+import threading
 from comicapi.comicarchive import ComicArchive
 from config import get_filename_format, get_issue_number_padding
 from markers import mark_file_duplicate, mark_file_processed
@@ -10,6 +11,7 @@ from error_handler import (
     log_function_entry, log_function_exit
 )
 import file_store
+from file_change_queue import get_file_change_queue
 from unified_store import add_processing_history
 
 CONFIG_DIR = os.environ.get('CONFIG_DIR', '/Config')
@@ -35,8 +37,15 @@ log_debug("process_file module initialized")
 # Initialize file store
 file_store.init_db()
 
+# Serializes the duplicate check and rename in process_file()
+_rename_lock = threading.Lock()
+
 def record_file_change(change_type, old_path=None, new_path=None):
-    """Record a file change directly in the file store
+    """Record a file change in the file store
+    
+    Inside a process with a running file change flusher (the web app), the change
+    is queued so renames from concurrent bulk workers are applied in one
+    transaction. Otherwise (run as a script by the watcher) it is applied at once.
     
     Args:
         change_type: 'add', 'remove', or 'rename'
@@ -46,15 +55,15 @@ def record_file_change(change_type, old_path=None, new_path=None):
     log_function_entry("record_file_change", change_type=change_type, old_path=old_path, new_path=new_path)
     
     try:
-        if change_type == 'add' and new_path:
-            file_store.add_file(new_path)
-            logging.info(f"Added file to store: {new_path}")
-        elif change_type == 'remove' and old_path:
-            file_store.remove_file(old_path)
-            logging.info(f"Removed file from store: {old_path}")
-        elif change_type == 'rename' and old_path and new_path:
-            file_store.rename_file(old_path, new_path)
-            logging.info(f"Renamed file in store: {old_path} -> {new_path}")
+        queue = get_file_change_queue()
+        queue.record(change_type, old_path=old_path, new_path=new_path)
+        if not queue.started:
+            queue.flush()
+        
+        if change_type == 'rename':
+            logging.info("Recorded rename in store: %s -> %s", old_path, new_path)
+        else:
+            logging.info("Recorded %s in store: %s", change_type, new_path or old_path)
         
         log_function_exit("record_file_change", result="success")
     except Exception as e:
@@ -63,7 +72,7 @@ def record_file_change(change_type, old_path=None, new_path=None):
             context=f"Recording file change in process_file: {change_type}",
             additional_info={"old_path": old_path, "new_path": new_path}
         )
-        logging.error(f"Error recording file change: {e}")
+        logging.error("Error recording file change: %s", e)
 
 # mark_file_duplicate is now imported from markers module
 
@@ -169,18 +178,22 @@ def format_filename(template, tags, issue_number, original_extension='.cbz'):
     
     return result
 
-def is_file_already_normalized(filepath, fixtitle=True, fixseries=True, fixfilename=True, comicfolder=None):
+def is_file_already_normalized(filepath, fixtitle=True, fixseries=True, fixfilename=True, comicfolder=None, tags=None):
     """
     Check if a file is already normalized (metadata and filename match expected format).
     Returns True if the file doesn't need any changes.
+    
+    Pass tags already read from the archive to check without opening it again.
     """
     log_function_entry("is_file_already_normalized", filepath=filepath, fixtitle=fixtitle, fixseries=fixseries, fixfilename=fixfilename)
+    current_filename = os.path.basename(filepath)
     
     try:
-        log_debug("Opening comic archive", filepath=filepath)
-        ca = ComicArchive(filepath)
-        tags = ca.read_tags('cr')
-        log_debug("Read tags from archive", filepath=filepath, has_tags=tags is not None)
+        if tags is None:
+            log_debug("Opening comic archive", filepath=filepath)
+            ca = ComicArchive(filepath)
+            tags = ca.read_tags('cr')
+            log_debug("Read tags from archive", filepath=filepath, has_tags=tags is not None)
         
         # Check title normalization if requested
         if fixtitle:
@@ -194,7 +207,7 @@ def is_file_already_normalized(filepath, fixtitle=True, fixseries=True, fixfilen
                 pass
             
             if not issue_number:
-                issue_number = parse_chapter_number(os.path.basename(filepath))
+                issue_number = parse_chapter_number(current_filename)
             
             if issue_number:
                 expected_title = f"Chapter {issue_number}"
@@ -246,7 +259,6 @@ def is_file_already_normalized(filepath, fixtitle=True, fixseries=True, fixfilen
             original_ext = os.path.splitext(filepath)[1].lower()
             filename_template = get_filename_format()
             expected_filename = format_filename(filename_template, tags, tags.issue or '', original_extension=original_ext)
-            current_filename = os.path.basename(filepath)
             
             log_debug("Checking filename", current=current_filename, expected=expected_filename)
             if current_filename != expected_filename:
@@ -263,22 +275,15 @@ def is_file_already_normalized(filepath, fixtitle=True, fixseries=True, fixfilen
             context=f"Checking if file is normalized: {filepath}",
             additional_info={"filepath": filepath, "fixtitle": fixtitle, "fixseries": fixseries, "fixfilename": fixfilename}
         )
-        logging.error(f"Error checking if file is normalized: {e}")
+        logging.error("Error checking if file is normalized: %s", e)
         return False
 
 def process_file(filepath, fixtitle=True, fixseries=True, fixfilename=True, comicfolder=None):
     log_function_entry("process_file", filepath=filepath, fixtitle=fixtitle, fixseries=fixseries, fixfilename=fixfilename)
-    logging.info(f"Processing file: {filepath}")
-    
-    # Check if file is already normalized
-    if is_file_already_normalized(filepath, fixtitle=fixtitle, fixseries=fixseries, fixfilename=fixfilename, comicfolder=comicfolder):
-        logging.info(f"File {os.path.basename(filepath)} is already normalized. Skipping processing.")
-        log_function_exit("process_file", result=filepath)
-        return filepath
-    
-    log_debug("File needs normalization, proceeding with processing", filepath=filepath)
+    logging.info("Processing file: %s", filepath)
     
-    # Capture "before" state for history tracking
+    # Capture "before" state for history tracking (filepath is never reassigned,
+    # so before_filename also stands in for its basename throughout)
     before_filename = os.path.basename(filepath)
     before_title = None
     before_series = None
@@ -308,6 +313,15 @@ def process_file(filepath, fixtitle=True, fixseries=True, fixfilename=True, comi
             additional_info={"filepath": filepath}
         )
         raise
+    
+    # Check if file is already normalized, reusing the tags read above so the
+    # archive is opened once per call
+    if is_file_already_normalized(filepath, fixtitle=fixtitle, fixseries=fixseries, fixfilename=fixfilename, comicfolder=comicfolder, tags=tags):
+        logging.info("File %s is already normalized. Skipping processing.", before_filename)
+        log_function_exit("process_file", result=filepath)
+        return filepath
+    
+    log_debug("File needs normalization, proceeding with processing", filepath=filepath)
 
     # Title and issue logic
     if fixtitle:
@@ -319,40 +333,40 @@ def process_file(filepath, fixtitle=True, fixseries=True, fixfilename=True, comi
                 log_debug("Found issue tag", issue_number=issue_number)
         except Exception as e:
             log_debug("Error reading issue tag", error=str(e))
-            logging.info(f"No issue tag found for {os.path.basename(filepath)}, will attempt to parse from filename...")
+            logging.info("No issue tag found for %s, will attempt to parse from filename...", before_filename)
         
         if issue_number:
-            logging.info(f"Issue number: {issue_number}")
+            logging.info("Issue number: %s", issue_number)
             title = tags.title
-            logging.info(f"Current title: {title}")
+            logging.info("Current title: %s", title)
             log_debug("Checking title format", current_title=title, issue_number=issue_number)
             
             if title == f"Chapter {issue_number}":
-                logging.info(f"Already tagged title as Chapter {issue_number}, skipping {os.path.basename(filepath)}...")
+                logging.info("Already tagged title as Chapter %s, skipping %s...", issue_number, before_filename)
                 log_debug("Title already correct", filepath=filepath)
             else:
-                logging.info(f"Updating title to: Chapter {issue_number}")
+                logging.info("Updating title to: Chapter %s", issue_number)
                 log_debug("Updating title", old_title=title, new_title=f"Chapter {issue_number}")
                 tags.title = f"Chapter {issue_number}"
                 tagschanged = True
         else:
             log_debug("No issue tag found, parsing from filename", filepath=filepath)
-            issue_number = parse_chapter_number(os.path.basename(filepath))
+            issue_number = parse_chapter_number(before_filename)
             
             if issue_number:
-                logging.info(f"Parsed chapter number: {issue_number}")
+                logging.info("Parsed chapter number: %s", issue_number)
                 log_debug("Successfully parsed chapter number", issue_number=issue_number)
                 title = tags.title
             
                 if title == f"Chapter {issue_number}":
-                    logging.info(f"Already tagged title as Chapter {issue_number}, skipping {os.path.basename(filepath)}...")
+                    logging.info("Already tagged title as Chapter %s, skipping %s...", issue_number, before_filename)
                 else:
                     log_debug("Setting title and issue", issue_number=issue_number)
                     tags.title = f"Chapter {issue_number}"
                     tags.issue = issue_number
                     tagschanged = True
             else:
-                logging.info(f"Could not parse chapter number from filename for {os.path.basename(filepath)}. Skipping...")
+                logging.info("Could not parse chapter number from filename for %s. Skipping...", before_filename)
                 log_debug("Failed to parse chapter number", filepath=filepath)
 
     # Series logic
@@ -363,7 +377,7 @@ def process_file(filepath, fixtitle=True, fixseries=True, fixfilename=True, comi
         
         seriesname = os.path.basename(comicfolder)
         seriesname = seriesname.replace('_', ':')
-        logging.info(f"Series name: {seriesname}")
+        logging.info("Series name: %s", seriesname)
         log_debug("Derived series name from folder", folder=comicfolder, series=seriesname)
         
         seriesnamecompare = seriesname.replace("'", "\u0027")
@@ -375,15 +389,15 @@ def process_file(filepath, fixtitle=True, fixseries=True, fixfilename=True, comi
         if(series_name_tag):
             tags_series_compare = re.sub(r"\(\*\)|\[\*\]", "", series_name_tag if series_name_tag else "")
             if tags_series_compare.strip() == seriesnamecompare.strip():
-                logging.info(f"Series name already correct for {os.path.basename(filepath)}, skipping...")
+                logging.info("Series name already correct for %s, skipping...", before_filename)
                 log_debug("Series already correct", filepath=filepath)
             else:
-                logging.info(f"Fixing series name to: {seriesname}")
+                logging.info("Fixing series name to: %s", seriesname)
                 log_debug("Updating series", old_series=series_name_tag, new_series=seriesname)
                 tags.series = seriesname
                 tagschanged = True
         else:
-            logging.info(f"Fixing series name to: {seriesname}")
+            logging.info("Fixing series name to: %s", seriesname)
             log_debug("Setting series (was empty)", new_series=seriesname)
             tags.series = seriesname
             tagschanged = True
@@ -394,6 +408,8 @@ def process_file(filepath, fixtitle=True, fixseries=True, fixfilename=True, comi
         try:
             ca.write_tags(tags, 'cr')
             log_debug("Successfully wrote tags", filepath=filepath)
+            # Read back what was stored; used for the filename and the history entry
+            tags = ca.read_tags('cr')
         except Exception as e:
             log_error_with_context(
                 e,
@@ -411,7 +427,6 @@ def process_file(filepath, fixtitle=True, fixseries=True, fixfilename=True, comi
     if fixfilename:
         log_debug("Processing filename", filepath=filepath)
         try:
-            tags = ca.read_tags('cr')
             # Get filename format template
             filename_template = get_filename_format()
             log_debug("Got filename template", template=filename_template)
@@ -422,59 +437,63 @@ def process_file(filepath, fixtitle=True, fixseries=True, fixfilename=True, comi
             
             # Format the new filename
             newFileName = format_filename(filename_template, tags, tags.issue or '', original_extension=original_ext)
-            log_debug("Formatted new filename", old=os.path.basename(filepath), new=newFileName)
+            log_debug("Formatted new filename", old=before_filename, new=newFileName)
             
             newFilePath = os.path.join(os.path.dirname(filepath), newFileName)
             if os.path.abspath(filepath) != os.path.abspath(newFilePath):
                 log_debug("File needs to be renamed", old_path=filepath, new_path=newFilePath)
                 
-                if os.path.exists(newFilePath):
-                    log_debug("Target filename already exists - duplicate detected", target=newFilePath)
-                    # Mark the file as a duplicate
-                    mark_file_duplicate(filepath)
-                    
-                    duplicate_dir = os.environ.get('DUPLICATE_DIR')
-                    if duplicate_dir:
-                        # Place under DUPLICATE_DIR/original_parent_folder/filename
-                        original_parent = os.path.basename(os.path.dirname(filepath))
-                        target_dir = os.path.join(duplicate_dir, original_parent)
-                        log_debug("Moving duplicate to duplicate directory", target_dir=target_dir)
+                # Bulk web operations run process_file() on worker threads. Hold the
+                # lock from the exists check to the rename so two files that format to
+                # the same name cannot both pass the check and overwrite each other
+                with _rename_lock:
+                    if os.path.exists(newFilePath):
+                        log_debug("Target filename already exists - duplicate detected", target=newFilePath)
+                        # Mark the file as a duplicate
+                        mark_file_duplicate(filepath)
+                        
+                        duplicate_dir = os.environ.get('DUPLICATE_DIR')
+                        if duplicate_dir:
+                            # Place under DUPLICATE_DIR/original_parent_folder/filename
+                            original_parent = os.path.basename(os.path.dirname(filepath))
+                            target_dir = os.path.join(duplicate_dir, original_parent)
+                            log_debug("Moving duplicate to duplicate directory", target_dir=target_dir)
+                            
+                            try:
+                                os.makedirs(target_dir, exist_ok=True)
+                                dest_path = os.path.join(target_dir, before_filename)
+                                logging.info("Duplicate detected. Moving %s to %s", filepath, dest_path)
+                                log_debug("Duplicate move destination", dest=dest_path)
+                                #os.rename(filepath, dest_path)
+                            except Exception as e:
+                                log_error_with_context(
+                                    e,
+                                    context=f"Moving duplicate file: {filepath}",
+                                    additional_info={"filepath": filepath, "dest_path": dest_path}
+                                )
+                                logging.info("Error moving duplicate file %s: %s", before_filename, e)
+                        else:
+                            logging.info("A file with the name %s already exists. Skipping rename for %s. DUPLICATE_DIR not set.", newFileName, before_filename)
+                            log_debug("DUPLICATE_DIR not set, skipping duplicate move", filepath=filepath)
+                    else:
+                        logging.info("Renaming file to: %s", newFileName)
+                        log_debug("Attempting to rename file", old=filepath, new=newFilePath)
                         
                         try:
-                            os.makedirs(target_dir, exist_ok=True)
-                            dest_path = os.path.join(target_dir, os.path.basename(filepath))
-                            logging.info(f"Duplicate detected. Moving {filepath} to {dest_path}")
-                            log_debug("Duplicate move destination", dest=dest_path)
-                            #os.rename(filepath, dest_path)
+                            os.rename(filepath, newFilePath)
+                            final_filepath = newFilePath
+                            log_debug("Successfully renamed file", new_path=final_filepath)
+                            # Record the rename in file store
+                            record_file_change('rename', old_path=filepath, new_path=newFilePath)
                         except Exception as e:
                             log_error_with_context(
                                 e,
-                                context=f"Moving duplicate file: {filepath}",
-                                additional_info={"filepath": filepath, "dest_path": dest_path}
+                                context=f"Renaming file: {filepath} to {newFilePath}",
+                                additional_info={"old_path": filepath, "new_path": newFilePath}
                             )
-                            logging.info(f"Error moving duplicate file {os.path.basename(filepath)}: {e}")
-                    else:
-                        logging.info(f"A file with the name {newFileName} already exists. Skipping rename for {os.path.basename(filepath)}. DUPLICATE_DIR not set.")
-                        log_debug("DUPLICATE_DIR not set, skipping duplicate move", filepath=filepath)
-                else:
-                    logging.info(f"Renaming file to: {newFileName}")
-                    log_debug("Attempting to rename file", old=filepath, new=newFilePath)
-                    
-                    try:
-                        os.rename(filepath, newFilePath)
-                        final_filepath = newFilePath
-                        log_debug("Successfully renamed file", new_path=final_filepath)
-                        # Record the rename in file store
-                        record_file_change('rename', old_path=filepath, new_path=newFilePath)
-                    except Exception as e:
-                        log_error_with_context(
-                            e,
-                            context=f"Renaming file: {filepath} to {newFilePath}",
-                            additional_info={"old_path": filepath, "new_path": newFilePath}
-                        )
-                        logging.info(f"Error renaming file {os.path.basename(filepath)}: {e}")
+                            logging.info("Error renaming file %s: %s", before_filename, e)
             else:
-                logging.info(f"Filename already correct for {os.path.basename(filepath)}, skipping rename.")
+                logging.info("Filename already correct for %s, skipping rename.", before_filename)
                 log_debug("Filename already correct, no rename needed", filepath=filepath)
         except Exception as e:
             log_error_with_context(
@@ -482,12 +501,12 @@ def process_file(filepath, fixtitle=True, fixseries=True, fixfilename=True, comi
                 context=f"Processing filename for file: {filepath}",
                 additional_info={"filepath": filepath, "fixfilename": fixfilename}
             )
-            logging.info(f"Could not format filename for {os.path.basename(filepath)}. Skipping rename... {e}")
+            logging.info("Could not format filename for %s. Skipping rename... %s", before_filename, e)
     
-    # Record processing history if any changes were made
+    # Record processing history if any changes were made. Renaming does not
+    # change the archive contents, so the tags in hand are the final state
     try:
-        ca_final = ComicArchive(final_filepath)
-        tags_final = ca_final.read_tags('cr')
+        tags_final = tags
         
         # Capture "after" state
         after_filename = os.path.basename(final_filepath)
@@ -541,8 +560,11 @@ def process_file(filepath, fixtitle=True, fixseries=True, fixfilename=True, comi
 if __name__ == "__main__":
     log_debug("process_file script started", args=sys.argv)
     
-    if len(sys.argv) < 2:
-        print("Usage: process_file.py <filepath>")
+    # Several files can be passed to one run, so batch callers pay for the
+    # interpreter start and module imports once instead of once per file
+    filepaths = [arg for arg in sys.argv[1:] if not arg.startswith('--')]
+    if not filepaths:
+        print("Usage: process_file.py <filepath> [<filepath> ...]")
         log_debug("Insufficient arguments provided")
         sys.exit(1)
     
@@ -551,25 +573,31 @@ if __name__ == "__main__":
     fixfilename = '--fixfilename' in sys.argv
     comicfolder = None
     
-    for arg in sys.argv[2:]:
+    for arg in sys.argv[1:]:
         if arg.startswith('--comicfolder='):
             comicfolder = arg.split('=', 1)[1]
     
-    original_filepath = sys.argv[1]
-    log_debug("Processing file from command line", filepath=original_filepath, fixtitle=fixtitle, fixseries=fixseries, fixfilename=fixfilename)
-    
-    try:
-        final_filepath = process_file(original_filepath, fixtitle=fixtitle or True, fixseries=fixseries or True, fixfilename=fixfilename or True, comicfolder=comicfolder)
-        
-        # Mark as processed using the final filepath (after any rename)
-        log_debug("Marking file as processed", final_path=final_filepath, original_path=original_filepath)
-        mark_file_processed(final_filepath, original_filepath=original_filepath)
+    failed = 0
+    for original_filepath in filepaths:
+        log_debug("Processing file from command line", filepath=original_filepath, fixtitle=fixtitle, fixseries=fixseries, fixfilename=fixfilename)
         
-        log_debug("process_file script completed successfully", final_filepath=final_filepath)
-    except Exception as e:
-        log_error_with_context(
-            e,
-            context=f"Running process_file script on: {original_filepath}",
-            additional_info={"filepath": original_filepath, "args": sys.argv}
-        )
-        raise
\ No newline at end of file
+        try:
+            final_filepath = process_file(original_filepath, fixtitle=fixtitle or True, fixseries=fixseries or True, fixfilename=fixfilename or True, comicfolder=comicfolder)
+            
+            # Mark as processed using the final filepath (after any rename)
+            log_debug("Marking file as processed", final_path=final_filepath, original_path=original_filepath)
+            mark_file_processed(final_filepath, original_filepath=original_filepath)
+            
+            log_debug("process_file script completed successfully", final_filepath=final_filepath)
+        except Exception as e:
+            # Keep going so one bad archive does not stop the rest of the batch
+            failed += 1
+            log_error_with_context(
+                e,
+                context=f"Running process_file script on: {original_filepath}",
+                additional_info={"filepath": original_filepath, "args": sys.argv}
+            )
+    
+    if failed:
+        logging.error("Failed to process %s of %s file(s)", failed, len(filepaths))
+        sys.exit(1)
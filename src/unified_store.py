@@ -3,19 +3,42 @@ Unified SQLite-based storage for both file tracking and marker management.
 Combines the functionality of file_store and marker_store into a single database.
 """
 import sqlite3
+import collections
+import fcntl
+import itertools
 import logging
 import threading
 import os
 import time
-from typing import List, Optional, Set, Tuple, Dict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Set, Tuple
 from contextlib import contextmanager
-from config import get_db_cache_size_mb
+from config import get_db_cache_size_mb, get_skip_dirs
 
 # Database configuration
 CONFIG_DIR = os.environ.get('CONFIG_DIR', '/Config')
 STORE_DIR = os.path.join(CONFIG_DIR, 'store')
 DB_PATH = os.path.join(STORE_DIR, 'comicmaintainer.db')
 
+# Maximum threads used to walk the watched directory during sync
+SCAN_MAX_WORKERS = 8
+# Directory names that are never walked into (see config.DEFAULT_SKIP_DIRS)
+SKIP_DIRS = get_skip_dirs()
+# os.scandir() accepts a directory file descriptor (not on Windows)
+_SCANDIR_FD = os.scandir in os.supports_fd and hasattr(os, 'O_DIRECTORY')
+
+# Incremental syncs trust unchanged directory mtimes; do a full walk at least this often
+FULL_SYNC_INTERVAL = 24 * 3600
+
+# Directory mtimes newer than this (ns) may still change within the same timestamp
+# tick after the directory is listed, so they are recorded as unknown
+DIR_MTIME_SETTLE_NS = 2_000_000_000
+# Recorded mtime that never matches, so the directory is listed by the next sync
+DIR_MTIME_UNKNOWN = -1
+
+# Number of most recent processing failures kept in processing_failures
+PROCESSING_FAILURES_MAX = 256
+
 # Thread-local storage for database connections
 _thread_local = threading.local()
 
@@ -56,6 +79,15 @@ def _init_db_schema(conn):
         )
     ''')
     
+    # Directories table - mtime of each watched directory at the last sync, so
+    # incremental syncs only list directories whose entries changed
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS directories (
+            dirpath TEXT PRIMARY KEY NOT NULL,
+            mtime_ns INTEGER NOT NULL
+        )
+    ''')
+    
     # Processing history table - tracks before/after changes for each file processing
     cursor.execute('''
         CREATE TABLE IF NOT EXISTS processing_history (
@@ -80,6 +112,17 @@ def _init_db_schema(conn):
         )
     ''')
     
+    # Recent per-file processing failures (bounded, see add_processing_failure), so the
+    # web interface can show files the watcher failed to process
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS processing_failures (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            filepath TEXT NOT NULL,
+            error TEXT,
+            timestamp REAL NOT NULL
+        )
+    ''')
+    
     # Create indexes for faster queries
     cursor.execute('''
         CREATE INDEX IF NOT EXISTS idx_files_last_modified 
@@ -97,10 +140,20 @@ def _init_db_schema(conn):
     ''')
     
     cursor.execute('''
-        CREATE INDEX IF NOT EXISTS idx_markers_type 
-        ON markers(marker_type)
+        CREATE INDEX IF NOT EXISTS idx_files_file_size
+        ON files(file_size)
     ''')
     
+    # Marker filters ('marked', 'duplicates') select by type and join on filepath,
+    # so (marker_type, filepath) lets SQLite answer them from the index alone
+    cursor.execute('''
+        CREATE INDEX IF NOT EXISTS idx_markers_type_filepath
+        ON markers(marker_type, filepath)
+    ''')
+    # Its marker_type prefix covers lookups by type alone, so the old
+    # single-column index only slows down marker writes
+    cursor.execute('DROP INDEX IF EXISTS idx_markers_type')
+    
     cursor.execute('''
         CREATE INDEX IF NOT EXISTS idx_processing_history_filepath 
         ON processing_history(filepath)
@@ -111,9 +164,101 @@ def _init_db_schema(conn):
         ON processing_history(timestamp DESC)
     ''')
     
+    # Version counters bumped by triggers on every change to files/markers, so any
+    # process can detect changes with one O(1) read instead of comparing file lists
+    for table, key in (('files', 'files_version'), ('markers', 'markers_version')):
+        cursor.execute('''
+            INSERT OR IGNORE INTO metadata (key, value) VALUES (?, '0')
+        ''', (key,))
+        for event in ('INSERT', 'UPDATE', 'DELETE'):
+            cursor.execute(f'''
+                CREATE TRIGGER IF NOT EXISTS trg_{table}_{event.lower()}_version
+                AFTER {event} ON {table}
+                BEGIN
+                    UPDATE metadata SET value = CAST(value AS INTEGER) + 1 WHERE key = '{key}';
+                END
+            ''')
+    
+    _init_count_triggers(cursor)
+    
     conn.commit()
 
 
+def _init_count_triggers(cursor):
+    """
+    Keep file_count and processed_file_count in the metadata table up to date.
+    
+    The counts back get_file_count() and get_unmarked_file_count(), so the
+    dashboard reads two values instead of counting the files table. Files are
+    written with INSERT OR REPLACE, which does not fire delete triggers for the
+    replaced row, so inserts only count when the row does not exist yet.
+    """
+    processed_exists = "EXISTS (SELECT 1 FROM markers WHERE filepath = {0}.filepath AND marker_type = 'processed')"
+    file_exists = "EXISTS (SELECT 1 FROM files WHERE filepath = {0}.filepath)"
+    
+    def bump(key, delta, condition='1'):
+        return f"UPDATE metadata SET value = CAST(value AS INTEGER) + ({delta}) WHERE key = '{key}' AND {condition};"
+    
+    triggers = {
+        'trg_files_insert_count': f'''
+            BEFORE INSERT ON files
+            WHEN NOT {file_exists.format('NEW')}
+            BEGIN
+                {bump('file_count', 1)}
+                {bump('processed_file_count', 1, processed_exists.format('NEW'))}
+            END''',
+        'trg_files_delete_count': f'''
+            AFTER DELETE ON files
+            BEGIN
+                {bump('file_count', -1)}
+                {bump('processed_file_count', -1, processed_exists.format('OLD'))}
+            END''',
+        'trg_files_rename_count': f'''
+            AFTER UPDATE OF filepath ON files
+            WHEN OLD.filepath != NEW.filepath
+            BEGIN
+                {bump('processed_file_count', -1, processed_exists.format('OLD'))}
+                {bump('processed_file_count', 1, processed_exists.format('NEW'))}
+            END''',
+        'trg_markers_insert_count': f'''
+            BEFORE INSERT ON markers
+            WHEN NEW.marker_type = 'processed'
+                AND NOT EXISTS (SELECT 1 FROM markers WHERE filepath = NEW.filepath AND marker_type = 'processed')
+                AND {file_exists.format('NEW')}
+            BEGIN
+                {bump('processed_file_count', 1)}
+            END''',
+        'trg_markers_delete_count': f'''
+            AFTER DELETE ON markers
+            WHEN OLD.marker_type = 'processed' AND {file_exists.format('OLD')}
+            BEGIN
+                {bump('processed_file_count', -1)}
+            END''',
+        'trg_markers_update_count': f'''
+            AFTER UPDATE ON markers
+            BEGIN
+                {bump('processed_file_count', -1, f"OLD.marker_type = 'processed' AND {file_exists.format('OLD')}")}
+                {bump('processed_file_count', 1, f"NEW.marker_type = 'processed' AND {file_exists.format('NEW')}")}
+            END''',
+    }
+    for name, body in triggers.items():
+        cursor.execute(f'CREATE TRIGGER IF NOT EXISTS {name} {body}')
+    
+    # Seed the counts once, after the triggers exist: writes from other processes
+    # before the seed are included in it, writes after it go through the triggers
+    cursor.execute("SELECT 1 FROM metadata WHERE key = 'processed_file_count'")
+    if cursor.fetchone() is None:
+        cursor.execute('''
+            INSERT OR IGNORE INTO metadata (key, value)
+            SELECT 'file_count', COUNT(*) FROM files
+        ''')
+        cursor.execute('''
+            INSERT OR IGNORE INTO metadata (key, value)
+            SELECT 'processed_file_count', COUNT(*) FROM files
+            WHERE filepath IN (SELECT filepath FROM markers WHERE marker_type = 'processed')
+        ''')
+
+
 @contextmanager
 def get_db_connection():
     """
@@ -212,7 +357,7 @@ def add_file(filepath: str, last_modified: float = None, file_size: int = None)
                 VALUES (?, ?, ?, ?)
             ''', (filepath, last_modified, file_size, time.time()))
             conn.commit()
-            logging.debug(f"Added file to store: {filepath}")
+            logging.debug("Added file to store: %s", filepath)
             return True
     except Exception as e:
         logging.error(f"Error adding file {filepath} to store: {e}")
@@ -239,7 +384,7 @@ def remove_file(filepath: str) -> bool:
             deleted = cursor.rowcount > 0
             conn.commit()
             if deleted:
-                logging.debug(f"Removed file from store: {filepath}")
+                logging.debug("Removed file from store: %s", filepath)
             return deleted
     except Exception as e:
         logging.error(f"Error removing file {filepath} from store: {e}")
@@ -289,7 +434,7 @@ def rename_file(old_path: str, new_path: str) -> bool:
                       old_file['added_timestamp']))
                 
                 conn.commit()
-                logging.debug(f"Renamed file in store: {old_path} -> {new_path}")
+                logging.debug("Renamed file in store: %s -> %s", old_path, new_path)
                 return True
             else:
                 # Old path doesn't exist, just add new path
@@ -371,6 +516,11 @@ def get_all_files_with_metadata() -> List[Dict]:
         return []
 
 
+def _escape_like(text: str) -> str:
+    """Escape LIKE wildcards so user text matches literally (used with ESCAPE '\\')"""
+    return text.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_')
+
+
 def get_files_paginated(
     limit: int = 100,
     offset: int = 0,
@@ -388,11 +538,13 @@ def get_files_paginated(
         offset: Number of files to skip
         sort_by: Sort field ('name', 'date', 'size')
         sort_direction: Sort direction ('asc', 'desc')
-        search_query: Optional search query to filter by filename
+        search_query: Optional search query to filter by filename; each
+            whitespace-separated term must appear (case-insensitive)
         filter_mode: Filter by marker status ('all', 'marked', 'unmarked', 'duplicates')
     
     Returns:
-        Tuple of (list of file dictionaries, total count matching criteria)
+        Tuple of (list of file dictionaries, total count matching criteria).
+        Each dictionary includes 'processed' and 'duplicate' marker flags.
     """
     try:
         with get_db_connection() as conn:
@@ -402,10 +554,13 @@ def get_files_paginated(
             where_clauses = []
             params = []
             
-            # Add search filter
+            # Add search filter: every whitespace-separated term must appear in the
+            # path. All terms are matched by SQLite in the same pass over the rows,
+            # and LIKE is case-insensitive so nothing is lowercased per request.
             if search_query:
-                where_clauses.append("f.filepath LIKE ?")
-                params.append(f"%{search_query}%")
+                for term in search_query.split():
+                    where_clauses.append("f.filepath LIKE ? ESCAPE '\\'")
+                    params.append(f"%{_escape_like(term)}%")
             
             # Build base query depending on filter mode
             if filter_mode == 'marked':
@@ -458,8 +613,14 @@ def get_files_paginated(
                 limit_clause = f"LIMIT {limit} OFFSET {offset}"
                 
             # Execute query
+            # Marker flags are looked up for the returned page only, via the
+            # markers primary key, so callers never load every marker to enrich it
             query = f'''
-                SELECT f.filepath, f.last_modified, f.file_size, f.added_timestamp
+                SELECT f.filepath, f.last_modified, f.file_size, f.added_timestamp,
+                    EXISTS (SELECT 1 FROM markers p
+                            WHERE p.filepath = f.filepath AND p.marker_type = 'processed') AS processed,
+                    EXISTS (SELECT 1 FROM markers d
+                            WHERE d.filepath = f.filepath AND d.marker_type = 'duplicate') AS duplicate
                 FROM {from_clause}
                 {where_clause}
                 ORDER BY {order_by} {direction}
@@ -467,14 +628,20 @@ def get_files_paginated(
             '''
             cursor.execute(query, params)
             
-            results = []
-            for row in cursor.fetchall():
-                results.append({
-                    'filepath': row['filepath'],
-                    'last_modified': row['last_modified'],
-                    'file_size': row['file_size'],
-                    'added_timestamp': row['added_timestamp']
-                })
+            # Unpack rows positionally: with limit=-1 this loop runs once per file,
+            # and name lookups on sqlite3.Row dominate its cost
+            results = [
+                {
+                    'filepath': filepath,
+                    'last_modified': last_modified,
+                    'file_size': file_size,
+                    'added_timestamp': added_timestamp,
+                    'processed': bool(processed),
+                    'duplicate': bool(duplicate)
+                }
+                for filepath, last_modified, file_size, added_timestamp, processed, duplicate
+                in cursor.fetchall()
+            ]
             
             return results, total_count
     except Exception as e:
@@ -492,8 +659,9 @@ def get_file_count() -> int:
     try:
         with get_db_connection() as conn:
             cursor = conn.cursor()
-            cursor.execute('SELECT COUNT(*) as count FROM files')
-            return cursor.fetchone()['count']
+            # Maintained by triggers, see _init_count_triggers()
+            cursor.execute("SELECT value FROM metadata WHERE key = 'file_count'")
+            return int(cursor.fetchone()['value'])
     except Exception as e:
         logging.error(f"Error getting file count from store: {e}")
         return 0
@@ -511,6 +679,8 @@ def clear_all_files() -> int:
             cursor = conn.cursor()
             cursor.execute('DELETE FROM files')
             deleted = cursor.rowcount
+            # Directory mtimes vouch for the stored files; without them the next sync walks everything
+            cursor.execute('DELETE FROM directories')
             conn.commit()
             logging.info(f"Cleared {deleted} files from store")
             return deleted
@@ -601,39 +771,294 @@ def batch_remove_files(filepaths: List[str]) -> int:
         return 0
 
 
-def sync_with_filesystem(watched_dir: str, extensions: List[str] = None) -> Tuple[int, int, int]:
+def apply_file_changes(changes: List[Tuple[str, Optional[str], Optional[str]]]) -> int:
+    """
+    Apply a batch of file changes in a single transaction.
+    Much faster than calling add_file()/remove_file()/rename_file() once per change.
+
+    Args:
+        changes: List of (change_type, old_path, new_path) tuples where change_type
+                 is 'add', 'remove', or 'rename', applied in order
+
+    Returns:
+        Number of changes applied
+    """
+    if not changes:
+        return 0
+
+    applied = 0
+
+    try:
+        with get_db_connection() as conn:
+            cursor = conn.cursor()
+
+            for change_type, old_path, new_path in changes:
+                if change_type == 'add' and new_path:
+                    try:
+                        stat = os.stat(new_path)
+                        last_modified, file_size = stat.st_mtime, stat.st_size
+                    except OSError:
+                        last_modified, file_size = time.time(), 0
+                    cursor.execute('''
+                        INSERT OR REPLACE INTO files (filepath, last_modified, file_size, added_timestamp)
+                        VALUES (?, ?, ?, ?)
+                    ''', (new_path, last_modified, file_size, time.time()))
+                    applied += 1
+                elif change_type == 'remove' and old_path:
+                    cursor.execute('DELETE FROM files WHERE filepath = ?', (old_path,))
+                    applied += 1
+                elif change_type == 'rename' and old_path and new_path:
+                    cursor.execute('SELECT * FROM files WHERE filepath = ?', (old_path,))
+                    old_file = cursor.fetchone()
+                    try:
+                        stat = os.stat(new_path)
+                        last_modified, file_size = stat.st_mtime, stat.st_size
+                    except OSError:
+                        last_modified, file_size = None, None
+
+                    if old_file:
+                        cursor.execute('DELETE FROM files WHERE filepath = ?', (old_path,))
+                        added_timestamp = old_file['added_timestamp']
+                        last_modified = last_modified or old_file['last_modified']
+                        file_size = file_size or old_file['file_size']
+                    else:
+                        added_timestamp = time.time()
+                        last_modified = last_modified or time.time()
+                        file_size = file_size or 0
+
+                    cursor.execute('''
+                        INSERT OR REPLACE INTO files (filepath, last_modified, file_size, added_timestamp)
+                        VALUES (?, ?, ?, ?)
+                    ''', (new_path, last_modified, file_size, added_timestamp))
+                    applied += 1
+
+            conn.commit()
+            logging.debug(f"Applied {applied} file changes to store in one transaction")
+    except Exception as e:
+        logging.error(f"Error applying batch of {len(changes)} file changes: {e}")
+        return 0
+
+    return applied
+
+
+def _suffix_variants(extensions: List[str]) -> Tuple[str, ...]:
+    """
+    Spell out every upper/lower-case combination of each extension.
+    
+    Matching names against these with str.endswith() is case-insensitive without
+    lowercasing every directory entry, which on a large library means one less
+    throwaway string per file scanned.
+    """
+    return tuple({
+        ''.join(chars)
+        for ext in extensions
+        for chars in itertools.product(*({c.lower(), c.upper()} for c in ext))
+    })
+
+
+def _scan_directory(directory: str, suffixes: Tuple[str, ...]) -> Tuple[List[Tuple[str, os.stat_result]], List[str]]:
+    """
+    List one directory, returning its matching files (with stats) and its subdirectories.
+    
+    Where the platform allows it the directory is listed through an open file
+    descriptor, as os.fwalk() does, so each file's stat is an fstatat() relative to
+    that descriptor instead of the kernel resolving the full path again per file.
+    """
+    files = []
+    subdirs = []
+    dir_fd = None
+    try:
+        if _SCANDIR_FD:
+            dir_fd = os.open(directory, os.O_RDONLY | os.O_DIRECTORY)
+        with os.scandir(directory if dir_fd is None else dir_fd) as entries:
+            for entry in entries:
+                name = entry.name
+                if name.startswith('.'):
+                    continue
+                try:
+                    if entry.is_dir():
+                        if name not in SKIP_DIRS:
+                            subdirs.append(os.path.join(directory, name))
+                    elif name.endswith(suffixes) and entry.is_file():
+                        files.append((os.path.join(directory, name), entry.stat()))
+                except OSError:
+                    continue
+    except OSError as e:
+        logging.warning(f"Could not scan directory {directory}: {e}")
+    finally:
+        if dir_fd is not None:
+            os.close(dir_fd)
+    return files, subdirs
+
+
+def _scan_changed_tree(top: str, suffixes: Tuple[str, ...], known_dirs: Dict[str, int],
+                       children: Dict[str, List[str]],
+                       ancestors: frozenset = frozenset()) -> Tuple[Dict[str, os.stat_result], Set[str], Dict[str, int]]:
+    """
+    Walk one directory tree, listing only directories whose mtime is not in known_dirs.
+    
+    Uses an iterative os.scandir walk (see _scan_directory) so file/directory
+    classification comes from the cached DirEntry type instead of a stat per entry,
+    and each file's stat result is taken during the walk, so the sync gets size and
+    mtime without a second stat per file. Extensions match case-insensitively.
+    Hidden files and directories are skipped and directories named in SKIP_DIRS
+    (NAS metadata, recycle bins) are not entered.
+    
+    Symlinked directories are followed, as a recursive glob does, so libraries built
+    from linked series folders are found. Each directory carries the (st_dev, st_ino)
+    of the directories above it; one that is its own ancestor is a symlink loop and is
+    not entered again. See scan_changed_directories for the other arguments and the
+    return value.
+    
+    Args:
+        ancestors: (st_dev, st_ino) of the directories above top
+    """
+    stats = {}
+    rescanned = set()
+    visited = {}
+    stack = [(top, ancestors)]
+    while stack:
+        directory, ancestors = stack.pop()
+        try:
+            st = os.stat(directory)
+        except OSError:
+            continue
+        dir_key = (st.st_dev, st.st_ino)
+        if dir_key in ancestors:
+            logging.debug("Not following symlink loop at %s", directory)
+            continue
+        ancestors = ancestors | {dir_key}
+        visited[directory] = st.st_mtime_ns
+        
+        if known_dirs.get(directory) == st.st_mtime_ns:
+            # Same entries as at the last sync: reuse its subdirectories without listing
+            subdirs = children.get(directory, ())
+        else:
+            files, subdirs = _scan_directory(directory, suffixes)
+            stats.update(files)
+            rescanned.add(directory)
+        stack.extend((subdir, ancestors) for subdir in subdirs)
+    return stats, rescanned, visited
+
+
+def scan_changed_directories(root: str, extensions: List[str],
+                             known_dirs: Dict[str, int]) -> Tuple[Dict[str, os.stat_result], Set[str], Dict[str, int]]:
+    """
+    Walk a directory tree, listing only the directories that changed since the last sync.
+    
+    A directory's mtime changes whenever an entry is added, removed or renamed in it,
+    so a directory whose mtime matches known_dirs still has the entries it had at the
+    last sync: it costs one stat() instead of a listing, and its recorded
+    subdirectories are visited from known_dirs. With an empty known_dirs every
+    directory is listed. The walk is bound by filesystem latency rather than CPU
+    (especially on network mounts), so the top-level subdirectories - typically
+    one per series - are walked concurrently with _scan_changed_tree().
+    
+    Args:
+        root: Directory to walk
+        extensions: File extensions to match (e.g., ['.cbz', '.cbr'])
+        known_dirs: Directory path -> st_mtime_ns recorded by the last sync
+    
+    Returns:
+        Tuple of (path -> os.stat_result for files in listed directories,
+        set of listed directories, directory path -> st_mtime_ns of every visited directory)
+    """
+    # Directories are keyed by their normalized path (no trailing slash), matching
+    # os.path.dirname() of the paths built during the walk
+    root = os.path.normpath(root)
+    suffixes = _suffix_variants(extensions)
+    children = collections.defaultdict(list)
+    for directory in known_dirs:
+        if directory != root:
+            children[os.path.dirname(directory)].append(directory)
+    
+    # Visit the root on its own, then its subdirectories in parallel
+    try:
+        root_stat = os.stat(root)
+    except OSError as e:
+        logging.warning(f"Could not scan directory {root}: {e}")
+        return {}, set(), {}
+    root_mtime = root_stat.st_mtime_ns
+    root_ancestors = frozenset({(root_stat.st_dev, root_stat.st_ino)})
+    visited = {root: root_mtime}
+    if known_dirs.get(root) == root_mtime:
+        stats, rescanned, subdirs = {}, set(), children.get(root, [])
+    else:
+        files, subdirs = _scan_directory(root, suffixes)
+        stats, rescanned = dict(files), {root}
+    
+    if subdirs:
+        with ThreadPoolExecutor(max_workers=min(SCAN_MAX_WORKERS, len(subdirs))) as executor:
+            for sub_stats, sub_rescanned, sub_visited in executor.map(
+                    lambda subdir: _scan_changed_tree(subdir, suffixes, known_dirs, children, root_ancestors), subdirs):
+                stats.update(sub_stats)
+                rescanned.update(sub_rescanned)
+                visited.update(sub_visited)
+    
+    return stats, rescanned, visited
+
+
+def get_directory_mtimes() -> Dict[str, int]:
+    """Get the directory mtimes (st_mtime_ns) recorded by the last sync"""
+    try:
+        with get_db_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute('SELECT dirpath, mtime_ns FROM directories')
+            return {row[0]: row[1] for row in cursor.fetchall()}
+    except Exception as e:
+        logging.error(f"Error getting directory mtimes: {e}")
+        return {}
+
+
+def sync_with_filesystem(watched_dir: str, extensions: List[str] = None,
+                         incremental: bool = False) -> Tuple[int, int, int]:
     """
     Synchronize the file store with the actual filesystem.
     Adds new files, removes deleted files, updates modified files.
     
+    Every sync records each directory's mtime. An incremental sync only lists the
+    directories whose mtime changed since then and keeps the stored files of the
+    others as they are; it finds added, removed and renamed files, but not files
+    modified in place inside an unchanged directory, so run a full sync regularly
+    (see sync_with_filesystem_if_stale).
+    
     Args:
         watched_dir: Directory to scan
         extensions: List of file extensions to track (e.g., ['.cbz', '.cbr'])
                    If None, defaults to ['.cbz', '.cbr', '.CBZ', '.CBR']
+        incremental: Skip listing directories whose mtime is unchanged
     
     Returns:
         Tuple of (added_count, removed_count, updated_count)
     """
     if extensions is None:
         extensions = ['.cbz', '.cbr', '.CBZ', '.CBR']
-    
-    import glob
+    # A trailing slash would stop the root matching os.path.dirname() of its files
+    watched_dir = os.path.normpath(watched_dir)
     
     try:
-        # Get all files from filesystem
-        fs_files = set()
-        for ext in extensions:
-            pattern = f'*{ext}'
-            files = glob.glob(os.path.join(watched_dir, '**', pattern), recursive=True)
-            fs_files.update(files)
+        # Directory mtimes from before the walk, so later changes are caught next time
+        scan_started_ns = time.time_ns()
+        known_dirs = get_directory_mtimes() if incremental else {}
+        
+        # Walk the filesystem once, keeping the stat from the walk
+        fs_stats, rescanned, visited = scan_changed_directories(watched_dir, extensions, known_dirs)
+        
+        # Get all files and their stored metadata from database in one query
+        db_metadata = {row['filepath']: row for row in get_all_files_with_metadata()}
+        db_files = set(db_metadata)
         
-        # Get all files from database
-        db_files = set(get_all_files())
+        # Stored files of unchanged directories are still there
+        unchanged_dirs = visited.keys() - rescanned
+        fs_files = set(fs_stats)
+        if unchanged_dirs:
+            fs_files.update(filepath for filepath in db_files
+                            if os.path.dirname(filepath) in unchanged_dirs)
         
         # Calculate differences
         files_to_add = fs_files - db_files
         files_to_remove = db_files - fs_files
-        files_to_check = fs_files & db_files  # Files in both
+        files_to_check = fs_stats.keys() & db_files  # Files in both (that were listed)
         
         added_count = 0
         removed_count = 0
@@ -645,15 +1070,12 @@ def sync_with_filesystem(watched_dir: str, extensions: List[str] = None) -> Tupl
             # Add new files
             if files_to_add:
                 for filepath in files_to_add:
-                    try:
-                        stat = os.stat(filepath)
-                        cursor.execute('''
-                            INSERT OR REPLACE INTO files (filepath, last_modified, file_size, added_timestamp)
-                            VALUES (?, ?, ?, ?)
-                        ''', (filepath, stat.st_mtime, stat.st_size, time.time()))
-                        added_count += 1
-                    except OSError:
-                        pass
+                    stat = fs_stats[filepath]
+                    cursor.execute('''
+                        INSERT OR REPLACE INTO files (filepath, last_modified, file_size, added_timestamp)
+                        VALUES (?, ?, ?, ?)
+                    ''', (filepath, stat.st_mtime, stat.st_size, time.time()))
+                    added_count += 1
             
             # Remove deleted files
             if files_to_remove:
@@ -667,30 +1089,40 @@ def sync_with_filesystem(watched_dir: str, extensions: List[str] = None) -> Tupl
             # Check for updated files (modified timestamp changed)
             if files_to_check:
                 for filepath in files_to_check:
-                    try:
-                        stat = os.stat(filepath)
+                    stat = fs_stats[filepath]
+                    row = db_metadata[filepath]
+                    if (row['last_modified'] is None or
+                            abs(row['last_modified'] - stat.st_mtime) > 0.01 or
+                            row['file_size'] != stat.st_size):
                         cursor.execute('''
-                            SELECT last_modified, file_size FROM files 
+                            UPDATE files 
+                            SET last_modified = ?, file_size = ?
                             WHERE filepath = ?
-                        ''', (filepath,))
-                        row = cursor.fetchone()
-                        if row and (abs(row['last_modified'] - stat.st_mtime) > 0.01 or 
-                                   row['file_size'] != stat.st_size):
-                            cursor.execute('''
-                                UPDATE files 
-                                SET last_modified = ?, file_size = ?
-                                WHERE filepath = ?
-                            ''', (stat.st_mtime, stat.st_size, filepath))
-                            updated_count += 1
-                    except OSError:
-                        pass
+                        ''', (stat.st_mtime, stat.st_size, filepath))
+                        updated_count += 1
+            
+            # Record directory mtimes for the next incremental sync. Every directory is
+            # kept (unchanged parents find their subdirectories here), but very recent
+            # mtimes could change again within the same tick, so those are not trusted.
+            settled_before = scan_started_ns - DIR_MTIME_SETTLE_NS
+            cursor.execute('DELETE FROM directories')
+            cursor.executemany('''
+                INSERT INTO directories (dirpath, mtime_ns) VALUES (?, ?)
+            ''', [(directory, mtime_ns if mtime_ns < settled_before else DIR_MTIME_UNKNOWN)
+                  for directory, mtime_ns in visited.items()])
             
             conn.commit()
         
-        logging.info(f"Synced file store: +{added_count} -{removed_count} ~{updated_count}")
+        if incremental:
+            logging.info(f"Synced file store: +{added_count} -{removed_count} ~{updated_count} "
+                         f"(listed {len(rescanned)} of {len(visited)} directories)")
+        else:
+            logging.info(f"Synced file store: +{added_count} -{removed_count} ~{updated_count}")
         
         # Update last sync timestamp
         set_metadata('last_sync_timestamp', str(time.time()))
+        if not incremental:
+            set_metadata('last_full_sync_timestamp', str(time.time()))
         
         return (added_count, removed_count, updated_count)
     except Exception as e:
@@ -698,6 +1130,55 @@ def sync_with_filesystem(watched_dir: str, extensions: List[str] = None) -> Tupl
         return (0, 0, 0)
 
 
+def sync_with_filesystem_if_stale(watched_dir: str, max_age: float = 300,
+                                  extensions: List[str] = None,
+                                  full_sync_interval: float = FULL_SYNC_INTERVAL) -> Optional[Tuple[int, int, int]]:
+    """
+    Synchronize the file store with the filesystem unless a recent sync already did.
+    
+    The web workers and the watcher all start at the same time and would otherwise each
+    walk the whole library. An exclusive file lock lets only one process sync at a time;
+    the lock is taken without blocking, so a process that finds another one mid-sync
+    skips its own instead of waiting (or spinning) for it. The last sync timestamp is
+    checked once the lock is held.
+    
+    The sync is incremental (only changed directories are listed) unless the last
+    full sync is older than full_sync_interval.
+    
+    Args:
+        watched_dir: Directory to scan
+        max_age: Skip the sync if the last one finished less than this many seconds
+                 before the call (0 always syncs unless another process is syncing)
+        extensions: List of file extensions to track (see sync_with_filesystem)
+        full_sync_interval: Maximum seconds between full syncs
+    
+    Returns:
+        Tuple of (added_count, removed_count, updated_count), or None if skipped
+    """
+    requested_at = time.time()
+    # Creates STORE_DIR on first use only; a no-op flag check afterwards
+    init_db()
+    
+    with open(os.path.join(STORE_DIR, 'sync.lock'), 'w') as lock_file:
+        try:
+            fcntl.flock(lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            # Every web worker checks every STORE_SYNC_CHECK_INTERVAL, so skips are
+            # routine and only logged at debug level
+            logging.debug("File store sync already running in another process, skipping sync")
+            return None
+        try:
+            last_sync = get_last_sync_timestamp()
+            if last_sync is not None and last_sync >= requested_at - max_age:
+                logging.debug("File store was synced %ss ago, skipping sync", int(time.time() - last_sync))
+                return None
+            last_full_sync = get_metadata('last_full_sync_timestamp')
+            incremental = last_full_sync is not None and float(last_full_sync) >= requested_at - full_sync_interval
+            return sync_with_filesystem(watched_dir, extensions, incremental=incremental)
+        finally:
+            fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+
 # ==============================================================================
 # MARKER STORE FUNCTIONS
 # ==============================================================================
@@ -750,6 +1231,21 @@ def has_marker(filepath: str, marker_type: str) -> bool:
         return False
 
 
+def get_file_markers(filepath: str) -> Set[str]:
+    """Get all marker types set on a file in one query (uses the primary key index)"""
+    try:
+        with get_db_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute('''
+                SELECT marker_type FROM markers 
+                WHERE filepath = ?
+            ''', (filepath,))
+            return {row['marker_type'] for row in cursor.fetchall()}
+    except Exception as e:
+        logging.error(f"Error getting markers for {filepath}: {e}")
+        return set()
+
+
 def get_markers(marker_type: str) -> Set[str]:
     """Get all files with a specific marker type"""
     try:
@@ -816,15 +1312,14 @@ def get_unmarked_file_count() -> int:
         with get_db_connection() as conn:
             cursor = conn.cursor()
             
-            # Count files that don't have a 'processed' marker
+            # Files without a 'processed' marker, from the counts maintained by
+            # triggers (see _init_count_triggers()) instead of scanning the table
             cursor.execute('''
-                SELECT COUNT(*) as count
-                FROM files
-                WHERE filepath NOT IN (
-                    SELECT filepath FROM markers WHERE marker_type = 'processed'
-                )
+                SELECT key, value FROM metadata
+                WHERE key IN ('file_count', 'processed_file_count')
             ''')
-            return cursor.fetchone()['count']
+            counts = {row['key']: int(row['value']) for row in cursor.fetchall()}
+            return counts['file_count'] - counts['processed_file_count']
     except Exception as e:
         logging.error(f"Error getting unmarked file count: {e}")
         return 0
@@ -928,6 +1423,51 @@ def batch_remove_markers(filepaths: List[str], marker_type: str) -> int:
         return 0
 
 
+def apply_marker_changes(changes: List[Tuple[str, str, str]]) -> int:
+    """
+    Apply a mixed list of marker additions and removals in a single transaction.
+    
+    Operations that update several markers for one file (e.g. a rename or a
+    delete) otherwise commit once per marker; batching them costs one commit.
+    
+    Args:
+        changes: List of (operation, filepath, marker_type) tuples where operation
+                 is 'add' or 'remove'. Changes are applied in order.
+    
+    Returns:
+        Number of marker rows changed
+    """
+    if not changes:
+        return 0
+    
+    try:
+        with get_db_connection() as conn:
+            cursor = conn.cursor()
+            changed = 0
+            
+            for operation, filepath, marker_type in changes:
+                if operation == 'add':
+                    cursor.execute('''
+                        INSERT OR IGNORE INTO markers (filepath, marker_type)
+                        VALUES (?, ?)
+                    ''', (filepath, marker_type))
+                elif operation == 'remove':
+                    cursor.execute('''
+                        DELETE FROM markers 
+                        WHERE filepath = ? AND marker_type = ?
+                    ''', (filepath, marker_type))
+                else:
+                    logging.warning(f"Unknown marker operation: {operation}")
+                    continue
+                changed += cursor.rowcount
+            
+            conn.commit()
+            return changed
+    except Exception as e:
+        logging.error(f"Error applying marker changes: {e}")
+        return 0
+
+
 # ==============================================================================
 # METADATA FUNCTIONS
 # ==============================================================================
@@ -964,6 +1504,30 @@ def get_metadata(key: str, default: str = None) -> Optional[str]:
         return default
 
 
+def get_store_version() -> Optional[Tuple[int, int]]:
+    """
+    Get the current change counters for the files and markers tables.
+    
+    The counters are incremented by triggers on every insert, update and delete, so
+    comparing two results tells whether anything changed in between, across processes.
+    
+    Returns:
+        Tuple of (files_version, markers_version), or None on error
+    """
+    try:
+        with get_db_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute('''
+                SELECT key, value FROM metadata 
+                WHERE key IN ('files_version', 'markers_version')
+            ''')
+            versions = {row['key']: int(row['value']) for row in cursor.fetchall()}
+            return (versions.get('files_version', 0), versions.get('markers_version', 0))
+    except Exception as e:
+        logging.error(f"Error getting store version: {e}")
+        return None
+
+
 def get_last_sync_timestamp() -> Optional[float]:
     """Get the timestamp of the last filesystem sync"""
     value = get_metadata('last_sync_timestamp')
@@ -1229,3 +1793,61 @@ def clear_processing_history() -> int:
     except Exception as e:
         logging.error(f"Error clearing processing history: {e}")
         return 0
+
+
+def add_processing_failure(filepath: str, error: str) -> bool:
+    """
+    Record a file that failed to process.
+    
+    Only the PROCESSING_FAILURES_MAX most recent failures are kept; older ones are
+    dropped in the same transaction, so the table works as a ring buffer.
+    
+    Args:
+        filepath: Path to the file that failed
+        error: Error message
+    
+    Returns:
+        True if successful, False otherwise
+    """
+    try:
+        with get_db_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(
+                'INSERT INTO processing_failures (filepath, error, timestamp) VALUES (?, ?, ?)',
+                (filepath, error, time.time())
+            )
+            cursor.execute(
+                'DELETE FROM processing_failures WHERE id <= ?',
+                (cursor.lastrowid - PROCESSING_FAILURES_MAX,)
+            )
+            conn.commit()
+            return True
+    except Exception as e:
+        logging.error(f"Error adding processing failure: {e}")
+        return False
+
+
+def get_processing_failures(limit: int = PROCESSING_FAILURES_MAX) -> List[Dict]:
+    """
+    Get recent processing failures, newest first.
+    
+    Args:
+        limit: Maximum number of entries to return
+    
+    Returns:
+        List of {'filepath', 'error', 'timestamp'} dictionaries
+    """
+    try:
+        with get_db_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(
+                'SELECT filepath, error, timestamp FROM processing_failures ORDER BY id DESC LIMIT ?',
+                (limit,)
+            )
+            return [
+                {'filepath': row[0], 'error': row[1], 'timestamp': row[2]}
+                for row in cursor.fetchall()
+            ]
+    except Exception as e:
+        logging.error(f"Error getting processing failures: {e}")
+        return []
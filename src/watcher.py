@@ -6,14 +6,21 @@ from watchdog.events import FileSystemEventHandler
 import subprocess
 import os
 import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from logging.handlers import RotatingFileHandler
-from config import get_watcher_enabled, get_log_max_bytes
-from markers import is_file_processed, is_file_web_modified, clear_file_web_modified
+from config import get_watcher_enabled, get_log_max_bytes, get_max_workers
+from markers import (
+    get_file_marker_types, clear_file_web_modified, mark_file_processed,
+    MARKER_TYPE_PROCESSED, MARKER_TYPE_WEB_MODIFIED
+)
 from error_handler import (
     setup_debug_logging, log_debug, log_error_with_context,
     log_function_entry, log_function_exit
 )
 import file_store
+from file_change_queue import get_file_change_queue
+from unified_store import add_processing_failure
 
 WATCHED_DIR = os.environ.get('WATCHED_DIR')
 CONFIG_DIR = os.environ.get('CONFIG_DIR', '/Config')
@@ -56,25 +63,48 @@ logging.getLogger().addHandler(log_handler)
 setup_debug_logging()
 log_debug("Watcher module initialized", watched_dir=WATCHED_DIR, process_script=PROCESS_SCRIPT)
 
+# Imported after logging is configured, so its basicConfig() call is a no-op
+import process_file
+
+# The bundled process_file.py is run in-process, saving an interpreter start and
+# module imports per file; a custom PROCESS_SCRIPT is still run as a script
+RUN_IN_PROCESS = os.path.realpath(PROCESS_SCRIPT) == os.path.realpath(process_file.__file__)
+
+def run_process_script(filepath):
+    """Process a single file and mark it as processed
+    
+    Args:
+        filepath: Path to the file
+        
+    Returns:
+        Exit code of the processing run (0 on success)
+    """
+    if not RUN_IN_PROCESS:
+        # process_file.py marks files as processed itself
+        return subprocess.run([sys.executable, PROCESS_SCRIPT, filepath]).returncode
+    
+    final_filepath = process_file.process_file(filepath)
+    mark_file_processed(final_filepath, original_filepath=filepath)
+    return 0
+
 
 # Debounce settings
 DEBOUNCE_SECONDS = 30
 
+# Store updates from watcher events are queued and applied in batches, so a burst
+# of events (e.g. a whole folder deleted) costs one SQLite commit instead of one per file
+_file_change_queue = get_file_change_queue()
+
 def record_file_change(change_type, old_path=None, new_path=None):
-    """Record a file change directly in the file store"""
+    """Queue a file change for the file store"""
     log_function_entry("record_file_change", change_type=change_type, old_path=old_path, new_path=new_path)
     
     try:
-        if change_type == 'add' and new_path:
-            file_store.add_file(new_path)
-            logging.info(f"Added file to store: {new_path}")
-        elif change_type == 'remove' and old_path:
-            file_store.remove_file(old_path)
-            logging.info(f"Removed file from store: {old_path}")
-        elif change_type == 'rename' and old_path and new_path:
-            file_store.rename_file(old_path, new_path)
-            logging.info(f"Renamed file in store: {old_path} -> {new_path}")
-        
+        _file_change_queue.record(change_type, old_path=old_path, new_path=new_path)
+        if change_type == 'rename':
+            logging.info("Queued rename in store: %s -> %s", old_path, new_path)
+        else:
+            logging.info("Queued %s in store: %s", change_type, new_path or old_path)
         log_function_exit("record_file_change", result="success")
     except Exception as e:
         log_error_with_context(
@@ -86,14 +116,22 @@ def record_file_change(change_type, old_path=None, new_path=None):
 
 
 
-def is_web_modified(filepath):
-    """Check if a file was recently modified by the web interface"""
+def is_web_modified(filepath, marker_types=None):
+    """Check if a file was recently modified by the web interface
+    
+    Args:
+        filepath: Path to the file
+        marker_types: Marker types already fetched with get_file_marker_types(),
+                      to avoid a second lookup
+    """
     log_debug("Checking if file is web modified", filepath=filepath)
     
-    if is_file_web_modified(filepath):
+    if marker_types is None:
+        marker_types = get_file_marker_types(filepath)
+    if MARKER_TYPE_WEB_MODIFIED in marker_types:
         # Clear the marker and return True
         clear_file_web_modified(filepath)
-        logging.info(f"Skipping {filepath} - modified by web interface")
+        logging.info("Skipping %s - modified by web interface", filepath)
         log_debug("File was web modified, skipping", filepath=filepath)
         return True
     
@@ -107,34 +145,22 @@ class ChangeHandler(FileSystemEventHandler):
         
         if not event.is_directory and self._should_process(event.dest_path) and self._should_process(event.src_path):
             if not get_watcher_enabled():
-                logging.debug(f"Watcher disabled, skipping: {event.dest_path}")
+                logging.debug("Watcher disabled, skipping: %s", event.dest_path)
                 return
-            if is_web_modified(event.dest_path):
+            # One marker lookup covers both the web modified and processed checks
+            marker_types = get_file_marker_types(event.dest_path)
+            if is_web_modified(event.dest_path, marker_types):
                 self.last_processed[event.dest_path] = time.time()
                 return
-            if is_file_processed(event.dest_path):
-                logging.info(f"Skipping {event.dest_path} - already processed")
+            if MARKER_TYPE_PROCESSED in marker_types:
+                logging.info("Skipping %s - already processed", event.dest_path)
                 self.last_processed[event.dest_path] = time.time()
                 return
-            if self._allowed_extension(event.dest_path) and self._is_file_stable(event.dest_path):
-                logging.info(f"File moved/renamed: {event.src_path} -> {event.dest_path}")
-                log_debug("Processing moved file", src=event.src_path, dest=event.dest_path, script=PROCESS_SCRIPT)
-                
-                try:
-                    result = subprocess.run([sys.executable, PROCESS_SCRIPT, event.dest_path])
-                    log_debug("File processing completed", dest=event.dest_path, returncode=result.returncode)
-                except Exception as e:
-                    log_error_with_context(
-                        e,
-                        context=f"Processing moved file: {event.dest_path}",
-                        additional_info={"src_path": event.src_path, "dest_path": event.dest_path}
-                    )
-                
-                # Note: process_file.py now marks files as processed itself
-                self.last_processed[event.dest_path] = time.time()
+            if self._allowed_extension(event.dest_path):
+                self._submit(event.dest_path, self._process_path, event.dest_path, f"moved/renamed from {event.src_path}")
             else:
-                logging.info(f"Moved file not stable yet: {event.dest_path}")
-                log_debug("File not stable or wrong extension", dest=event.dest_path)
+                log_debug("Moved file has wrong extension", dest=event.dest_path)
+
     def _is_file_stable(self, path, wait_time=2, checks=2):
         """Return True if file size is unchanged for wait_time*checks seconds.
         
@@ -179,12 +205,55 @@ class ChangeHandler(FileSystemEventHandler):
                 context=f"Checking file stability: {path}",
                 additional_info={"path": path, "wait_time": wait_time, "checks": checks}
             )
-            logging.info(f"Error checking file stability for {path}: {e}")
+            logging.info("Error checking file stability for %s: %s", path, e)
             return False
     def __init__(self):
         super().__init__()
         self.last_processed = {}  # {filepath: timestamp}
         self._extension_cache = {}  # Cache for file extension checks
+        # Stability waits and process_file.py runs happen on a pool, so a burst of
+        # new files (e.g. a folder copied in) is processed in parallel instead of
+        # each file waiting behind the previous one on the observer thread
+        self._executor = ThreadPoolExecutor(max_workers=get_max_workers(), thread_name_prefix="watcher")
+        self._in_flight = set()  # Paths queued or being processed
+        self._dirty = set()  # In-flight paths that had another event since being queued
+        self._in_flight_lock = threading.Lock()
+        
+    def _submit(self, path, task, *args):
+        """Run task(*args) on the processing pool unless path is already queued
+        
+        A repeat event for a queued path marks it dirty instead of queuing it twice.
+        If the file then turns out not to be stable (still being copied), the task
+        runs again, so the last event of a copy still gets a stability check. When
+        the file was processed, the repeats were (or were caused by) that run, and
+        last_processed debounces any that follow.
+        """
+        with self._in_flight_lock:
+            if path in self._in_flight:
+                log_debug("File already queued for processing", path=path)
+                self._dirty.add(path)
+                return
+            self._in_flight.add(path)
+        self._executor.submit(self._run_in_flight, path, task, *args)
+    
+    def _run_in_flight(self, path, task, *args):
+        """Run task(*args) until it processes path or no new event arrived for it
+        
+        task returns True once the file was stable and has been processed.
+        """
+        while True:
+            processed = False
+            try:
+                processed = task(*args)
+            except Exception as e:
+                log_error_with_context(e, context=f"Processing watcher event: {path}", additional_info={"path": path})
+            with self._in_flight_lock:
+                retry = not processed and path in self._dirty
+                self._dirty.discard(path)
+                if not retry:
+                    self._in_flight.discard(path)
+                    return
+            log_debug("File changed while checking stability, checking again", path=path)
         
     def _allowed_extension(self, path):
         """Check if file has allowed extension (.cbr or .cbz) with caching"""
@@ -193,7 +262,7 @@ class ChangeHandler(FileSystemEventHandler):
             return self._extension_cache[path]
         
         # Compute and cache result
-        result = path.lower().endswith('.cbr') or path.lower().endswith('.cbz')
+        result = path.lower().endswith(('.cbr', '.cbz'))
         self._extension_cache[path] = result
         
         # Limit cache size to prevent memory growth (keep last 1000 entries)
@@ -216,79 +285,80 @@ class ChangeHandler(FileSystemEventHandler):
         
         if not event.is_directory and self._should_process(event.src_path) and self._allowed_extension(event.src_path):
             if not get_watcher_enabled():
-                logging.debug(f"Watcher disabled, skipping: {event.src_path}")
+                logging.debug("Watcher disabled, skipping: %s", event.src_path)
                 return
-            if is_web_modified(event.src_path):
+            # One marker lookup covers both the web modified and processed checks
+            marker_types = get_file_marker_types(event.src_path)
+            if is_web_modified(event.src_path, marker_types):
                 self.last_processed[event.src_path] = time.time()
                 return
-            if is_file_processed(event.src_path):
-                logging.info(f"Skipping {event.src_path} - already processed")
+            if MARKER_TYPE_PROCESSED in marker_types:
+                logging.info("Skipping %s - already processed", event.src_path)
                 self.last_processed[event.src_path] = time.time()
                 return
-            if self._is_file_stable(event.src_path):
-                logging.info(f"File modified: {event.src_path}")
-                log_debug("Processing modified file", path=event.src_path, script=PROCESS_SCRIPT)
-                
-                try:
-                    result = subprocess.run([sys.executable, PROCESS_SCRIPT, event.src_path])
-                    log_debug("File processing completed", path=event.src_path, returncode=result.returncode)
-                except Exception as e:
-                    log_error_with_context(
-                        e,
-                        context=f"Processing modified file: {event.src_path}",
-                        additional_info={"path": event.src_path}
-                    )
-                
-                # Note: process_file.py now marks files as processed itself
-                self.last_processed[event.src_path] = time.time()
-            else:
-                logging.info(f"File not stable yet: {event.src_path}")
-                log_debug("Modified file not stable", path=event.src_path)
+            self._submit(event.src_path, self._process_path, event.src_path, 'modified')
     def on_created(self, event):
         log_debug("File created event detected", path=event.src_path, is_dir=event.is_directory)
         
         if not event.is_directory and self._should_process(event.src_path) and self._allowed_extension(event.src_path):
             if not get_watcher_enabled():
-                logging.debug(f"Watcher disabled, skipping: {event.src_path}")
+                logging.debug("Watcher disabled, skipping: %s", event.src_path)
                 return
-            if is_web_modified(event.src_path):
+            # One marker lookup covers both the web modified and processed checks
+            marker_types = get_file_marker_types(event.src_path)
+            if is_web_modified(event.src_path, marker_types):
                 self.last_processed[event.src_path] = time.time()
                 return
-            if is_file_processed(event.src_path):
-                logging.info(f"Skipping {event.src_path} - already processed")
+            if MARKER_TYPE_PROCESSED in marker_types:
+                logging.info("Skipping %s - already processed", event.src_path)
                 self.last_processed[event.src_path] = time.time()
                 return
-            if self._is_file_stable(event.src_path):
-                logging.info(f"File created: {event.src_path}")
-                log_debug("Processing created file", path=event.src_path, script=PROCESS_SCRIPT)
-                
-                try:
-                    result = subprocess.run([sys.executable, PROCESS_SCRIPT, event.src_path])
-                    log_debug("File processing completed", path=event.src_path, returncode=result.returncode)
-                except Exception as e:
-                    log_error_with_context(
-                        e,
-                        context=f"Processing created file: {event.src_path}",
-                        additional_info={"path": event.src_path}
-                    )
-                
-                # Note: process_file.py now marks files as processed itself
-                self.last_processed[event.src_path] = time.time()
-            else:
-                logging.info(f"File not stable yet: {event.src_path}")
-                log_debug("Created file not stable", path=event.src_path)
+            self._submit(event.src_path, self._process_path, event.src_path, 'created')
+    def _process_path(self, path, label):
+        """Process a created, modified or moved file once it is stable (runs on the processing pool)
+        
+        Args:
+            path: Path to the file
+            label: What happened to the file, for log messages (e.g. 'created')
+        
+        Returns:
+            True if the file was stable and processing ran, False if it is not stable yet
+        """
+        if self._is_file_stable(path):
+            logging.info("File %s: %s", label, path)
+            log_debug("Processing file", path=path, event=label, script=PROCESS_SCRIPT)
+            
+            try:
+                returncode = run_process_script(path)
+                log_debug("File processing completed", path=path, returncode=returncode)
+                if returncode != 0:
+                    add_processing_failure(path, f"{PROCESS_SCRIPT} exited with status {returncode}")
+            except Exception as e:
+                log_error_with_context(
+                    e,
+                    context=f"Processing file ({label}): {path}",
+                    additional_info={"path": path}
+                )
+                add_processing_failure(path, str(e))
+            
+            self.last_processed[path] = time.time()
+            return True
+        
+        logging.info("File not stable yet: %s", path)
+        log_debug("File not stable", path=path, event=label)
+        return False
     def on_deleted(self, event):
         log_debug("File deleted event detected", path=event.src_path, is_dir=event.is_directory)
         
         if not event.is_directory:
-            logging.info(f"File deleted: {event.src_path}")
+            logging.info("File deleted: %s", event.src_path)
             if event.src_path in self.last_processed:
                 del self.last_processed[event.src_path]
             
             # Skip store update if file was deleted via web interface
             if self._allowed_extension(event.src_path):
                 if is_web_modified(event.src_path):
-                    logging.info(f"Skipping file store update for {event.src_path} - deleted by web interface")
+                    logging.info("Skipping file store update for %s - deleted by web interface", event.src_path)
                     clear_file_web_modified(event.src_path)
                     return
                 
@@ -311,9 +381,14 @@ if __name__ == "__main__":
     # Perform initial filesystem sync to populate/update file store
     logging.info("Performing initial filesystem sync...")
     log_debug("Starting filesystem sync")
-    added, removed, updated = file_store.sync_with_filesystem(WATCHED_DIR)
-    logging.info(f"Initial sync complete: +{added} new files, -{removed} deleted files, ~{updated} updated files")
-    log_debug("Filesystem sync complete", added=added, removed=removed, updated=updated)
+    # max_age=0: always sync unless a web worker is already syncing
+    result = file_store.sync_with_filesystem_if_stale(WATCHED_DIR, max_age=0)
+    if result is not None:
+        added, removed, updated = result
+        logging.info(f"Initial sync complete: +{added} new files, -{removed} deleted files, ~{updated} updated files")
+        log_debug("Filesystem sync complete", added=added, removed=removed, updated=updated)
+    
+    _file_change_queue.start()
     
     event_handler = ChangeHandler()
     observer = Observer()
@@ -328,7 +403,6 @@ if __name__ == "__main__":
     # Use an Event object instead of sleep polling
     # Event.wait() blocks efficiently without consuming CPU, unlike a while True + sleep(1) loop
     # The watchdog observer runs in its own thread and handles file events asynchronously
-    import threading
     shutdown_event = threading.Event()
     
     try:
@@ -1,15 +1,19 @@
 import os
 import sys
+import collections
+import functools
 import logging
 from logging.handlers import RotatingFileHandler
-import json
 import fcntl
+import gzip
+import subprocess
 from flask import Flask, render_template, jsonify, request, send_from_directory
 from werkzeug.middleware.proxy_fix import ProxyFix
+from werkzeug.security import safe_join
 from comicapi.comicarchive import ComicArchive
-import glob
 import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from config import (
     get_filename_format, set_filename_format, DEFAULT_FILENAME_FORMAT,
     get_watcher_enabled, set_watcher_enabled,
@@ -22,13 +26,15 @@ from config import (
 )
 from version import __version__
 from markers import (
-    is_file_processed, mark_file_processed, unmark_file_processed,
-    is_file_duplicate, mark_file_duplicate, unmark_file_duplicate,
+    mark_file_processed, get_processed_files,
+    is_file_duplicate, mark_file_duplicate,
     is_file_web_modified, mark_file_web_modified, clear_file_web_modified,
-    cleanup_web_modified_markers, get_all_marker_data
+    clear_file_markers, cleanup_web_modified_markers, get_all_marker_data,
+    MarkerBatch, batched_markers
 )
 import file_store
-from job_manager import get_job_manager, JobResult
+from file_change_queue import get_file_change_queue
+from job_manager import get_job_manager, JobResult, JobStatus
 from preferences_store import (
     get_preference, set_preference, get_all_preferences,
     get_active_job, set_active_job, clear_active_job
@@ -40,6 +46,7 @@ from event_broadcaster import (
 )
 from watchdog.observers import Observer
 from watchdog.events import FileSystemEventHandler
+import orjson
 
 CONFIG_DIR = os.environ.get('CONFIG_DIR', '/Config')
 LOG_DIR = os.path.join(CONFIG_DIR, 'Log')
@@ -73,6 +80,10 @@ log_handler.setFormatter(logging.Formatter('%(asctime)s [WEBPAGE] %(levelname)s
 # Add the file handler to the root logger
 logging.getLogger().addHandler(log_handler)
 
+# Imported once logging is configured, so its basicConfig() leaves ours in place.
+# Called as process_file.process_file() so the function can be swapped at runtime.
+import process_file
+
 # Get the parent directory (project root) for templates and static files
 # web_app.py is in src/ during development, but in /app/ when deployed in Docker
 script_dir = os.path.dirname(os.path.abspath(__file__))
@@ -87,7 +98,8 @@ else:
 template_folder = os.path.join(project_root, 'templates')
 static_folder = os.path.join(project_root, 'static')
 
-app = Flask(__name__, template_folder=template_folder, static_folder=static_folder)
+# Flask's built-in static route is disabled so serve_static() (with its cache headers) handles /static
+app = Flask(__name__, template_folder=template_folder, static_folder=None)
 
 # Configure reverse proxy support
 # ProxyFix middleware handles X-Forwarded-* headers from reverse proxies
@@ -114,7 +126,44 @@ if BASE_PATH:
 app.config['JSON_SORT_KEYS'] = False  # Don't sort JSON keys (faster)
 app.config['JSONIFY_PRETTYPRINT_REGULAR'] = False  # Disable pretty-print (smaller responses)
 
+
+def dump_json(payload):
+    """Serialize payload to compact JSON bytes with orjson"""
+    return orjson.dumps(payload)
+
+
+def json_response(payload, status=200):
+    """
+    Build a JSON response, serializing with orjson.
+
+    orjson encodes large lists of dicts (e.g. file listings) several times faster
+    than the stdlib encoder used by jsonify and writes bytes directly.
+    """
+    return app.response_class(dump_json(payload), status=status, mimetype='application/json')
+
+def stream_response(chunks, mimetype):
+    """
+    Build a streaming response whose chunks reach the client as they are produced.
+
+    X-Accel-Buffering: no stops nginx (a common reverse proxy in front of this app)
+    from holding bulk progress back until the whole batch is done.
+    """
+    return app.response_class(chunks, mimetype=mimetype, headers={'X-Accel-Buffering': 'no'})
+
 WATCHED_DIR = os.environ.get('WATCHED_DIR')
+# Prefix of every path produced by walking WATCHED_DIR, for get_relative_path().
+# Request paths are relative to WATCHED_DIR and joined by concatenating onto it.
+WATCHED_DIR_PREFIX = os.path.join(WATCHED_DIR, '') if WATCHED_DIR else None
+
+def _resolve_prefixed(filepath):
+    return WATCHED_DIR_PREFIX + filepath
+
+def _resolve_identity(filepath):
+    return filepath
+
+# Full path of a request path. WATCHED_DIR is fixed for the process, so the
+# implementation is chosen once here instead of branching on every call.
+resolve_path = _resolve_prefixed if WATCHED_DIR else _resolve_identity
 
 # Initialize file store on startup
 file_store.init_db()
@@ -136,23 +185,41 @@ def mark_file_duplicate_wrapper(filepath):
     # Broadcast event to connected clients
     broadcast_file_processed(filepath, success=True)
 
-def cleanup_web_markers_scheduled():
-    """Clean up old web modified markers and reschedule"""
-    try:
-        cleanup_web_modified_markers(max_files=100)
-    except Exception as e:
-        logging.error(f"Error cleaning up web markers: {e}")
-    finally:
-        # Reschedule for next run (5 minutes)
-        cleanup_timer = threading.Timer(300.0, cleanup_web_markers_scheduled)
-        cleanup_timer.daemon = True
-        cleanup_timer.start()
+# Web modified markers are cleaned up every 5 minutes, or sooner once enough new
+# markers have been written since the last cleanup (e.g. after a bulk operation)
+WEB_MARKER_CLEANUP_INTERVAL = 300.0
+WEB_MARKER_CLEANUP_THRESHOLD = 100
+_web_marker_cleanup_event = threading.Event()
+_web_markers_since_cleanup = 0
+_web_markers_lock = threading.Lock()
+
+def mark_file_web_modified_wrapper(filepath):
+    """Mark a file as modified by the web interface"""
+    global _web_markers_since_cleanup
+    
+    mark_file_web_modified(filepath)
+    
+    # Wake the cleanup thread early once a burst of markers has accumulated
+    with _web_markers_lock:
+        _web_markers_since_cleanup += 1
+        if _web_markers_since_cleanup >= WEB_MARKER_CLEANUP_THRESHOLD:
+            _web_markers_since_cleanup = 0
+            _web_marker_cleanup_event.set()
+
+def cleanup_web_markers_loop():
+    """Clean up old web modified markers when signalled or every interval (event-based, not polling)"""
+    while True:
+        _web_marker_cleanup_event.wait(WEB_MARKER_CLEANUP_INTERVAL)
+        _web_marker_cleanup_event.clear()
+        try:
+            cleanup_web_modified_markers(max_files=100)
+        except Exception as e:
+            logging.error(f"Error cleaning up web markers: {e}")
 
-# Start cleanup timer (event-based, not polling)
-cleanup_timer = threading.Timer(300.0, cleanup_web_markers_scheduled)
-cleanup_timer.daemon = True
-cleanup_timer.start()
-logging.info("Web markers cleanup scheduled (every 5 minutes)")
+# Start cleanup thread
+cleanup_thread = threading.Thread(target=cleanup_web_markers_loop, name="web-marker-cleanup", daemon=True)
+cleanup_thread.start()
+logging.info("Web markers cleanup scheduled (every 5 minutes or after 100 new markers)")
 
 
 @app.after_request
@@ -160,10 +227,15 @@ def add_performance_headers(response):
     """Add performance-related headers to responses"""
     # Add cache control for API responses
     if request.path.startswith('/api/'):
-        # API responses should not be cached by default (dynamic data)
-        response.headers['Cache-Control'] = 'no-cache, no-store, must-revalidate'
-        response.headers['Pragma'] = 'no-cache'
-        response.headers['Expires'] = '0'
+        if response.headers.get('ETag'):
+            # Versioned responses may be stored but must be revalidated with If-None-Match
+            # (unless the endpoint chose its own freshness window)
+            response.headers.setdefault('Cache-Control', 'no-cache')
+        else:
+            # API responses should not be cached by default (dynamic data)
+            response.headers['Cache-Control'] = 'no-cache, no-store, must-revalidate'
+            response.headers['Pragma'] = 'no-cache'
+            response.headers['Expires'] = '0'
     
     # Add Vary header for better caching
     if 'Vary' not in response.headers:
@@ -182,27 +254,37 @@ def add_performance_headers(response):
     return response
 
 
+# Pending file store changes, coalesced and applied in a single transaction
+# Bulk endpoints can rename thousands of files in quick succession; queueing the
+# changes avoids one SQLite commit per file. The queue is shared with process_file(),
+# so renames it records from worker threads are batched too
+_file_change_queue = get_file_change_queue()
+
+
 def record_file_change(change_type, old_path=None, new_path=None):
-    """Record a file change directly in the file store
-    
+    """Queue a file change for the file store
+
+    Changes are applied in batches by the background flusher thread. Call
+    flush_file_changes() before reading the file store to see pending changes.
+
     Args:
         change_type: 'add', 'remove', or 'rename'
         old_path: Original file path (for 'remove' and 'rename')
         new_path: New file path (for 'add' and 'rename')
     """
-    try:
-        if change_type == 'add' and new_path:
-            file_store.add_file(new_path)
-            logging.info(f"Added file to store: {new_path}")
-        elif change_type == 'remove' and old_path:
-            file_store.remove_file(old_path)
-            logging.info(f"Removed file from store: {old_path}")
-        elif change_type == 'rename' and old_path and new_path:
-            file_store.rename_file(old_path, new_path)
-            logging.info(f"Renamed file in store: {old_path} -> {new_path}")
-        
-    except Exception as e:
-        logging.error(f"Error recording file change: {e}")
+    _file_change_queue.record(change_type, old_path=old_path, new_path=new_path)
+
+def flush_file_changes():
+    """Apply all queued file changes to the file store in one transaction
+
+    Returns:
+        Number of changes applied
+    """
+    return _file_change_queue.flush()
+
+def start_file_change_flusher():
+    """Start the background file change flusher (once per process)"""
+    _file_change_queue.start()
 
 def load_files_from_store():
     """Load file list from the file store database
@@ -241,8 +323,154 @@ def get_comic_files():
     if not WATCHED_DIR:
         return []
     
+    flush_file_changes()
     return load_files_from_store()
 
+def get_relative_path(filepath):
+    """Get a file path relative to WATCHED_DIR for display
+    
+    Store paths all come from walking WATCHED_DIR, so slicing off the known prefix
+    gives the same result as os.path.relpath() without its abspath/split/join work
+    on every file of a listing. Other paths still go through os.path.relpath().
+    """
+    if not WATCHED_DIR:
+        return filepath
+    if filepath.startswith(WATCHED_DIR_PREFIX):
+        return filepath[len(WATCHED_DIR_PREFIX):]
+    return os.path.relpath(filepath, WATCHED_DIR)
+
+def map_concurrently(func, items):
+    """Apply func to each item on a bounded thread pool, yielding results in input order
+    
+    Per-file archive work is dominated by disk I/O and zlib, both of which release
+    the GIL, so threads overlap well. The pool is sized by the MAX_WORKERS setting.
+    Results are yielded as soon as the next item in order completes, so streaming
+    callers can report progress; if the caller stops early, queued items are cancelled.
+    
+    Args:
+        func: Callable taking a single item
+        items: List of items
+        
+    Yields:
+        func(item) for each item, in order
+    """
+    max_workers = min(get_max_workers(), len(items))
+    if max_workers <= 1:
+        yield from map(func, items)
+        return
+    
+    executor = ThreadPoolExecutor(max_workers=max_workers)
+    try:
+        yield from executor.map(func, items)
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
+
+def get_request_file_list():
+    """Decode the JSON request body once and extract the list of requested files
+    
+    Uses get_json(silent=True) so a missing or malformed body is rejected up front
+    with a 400 instead of raising inside the handler, and drops entries that are
+    not non-empty strings before any per-file work starts. Repeated paths are
+    dropped too (keeping the first), since two workers operating on the same file
+    at once would race on its rename.
+    
+    Returns:
+        Tuple of (data dict, list of unique file paths in request order)
+    """
+    data = request.get_json(silent=True)
+    if not isinstance(data, dict):
+        return {}, []
+    files = data.get('files')
+    if not isinstance(files, list):
+        return data, []
+    return data, list(dict.fromkeys(filepath for filepath in files if isinstance(filepath, str) and filepath))
+
+def get_store_etag():
+    """Build an ETag for responses derived from the file store
+    
+    Combines the app version with the store's files/markers change counters, so it
+    changes whenever any process modifies files or markers.
+    
+    Returns:
+        ETag string, or None if the store version could not be read
+    """
+    version = file_store.get_store_version()
+    if version is None:
+        return None
+    return f"{__version__}-{version[0]}-{version[1]}"
+
+def get_store_counts():
+    """Get (total files, unmarked files)
+    
+    Both come from counters that the store's triggers keep up to date, so this is
+    two single-row reads rather than a scan of the files table. That costs about
+    as much as checking the store version, so the counts are not cached.
+    
+    Returns:
+        Tuple of (total_count, unmarked_count)
+    """
+    return file_store.get_file_count(), file_store.get_unmarked_file_count()
+
+def _existing_in_directory(paths):
+    """Return the subset of paths (all in one directory) that exist"""
+    if len(paths) == 1:
+        return paths if os.path.exists(paths[0]) else []
+    try:
+        with os.scandir(os.path.dirname(paths[0]) or '.') as entries:
+            names = {entry.name for entry in entries}
+    except OSError:
+        # Directory is gone or unreadable, so none of its files exist
+        return []
+    return [path for path in paths if os.path.basename(path) in names]
+
+def find_existing_files(filepaths):
+    """Find which of the given files exist on the filesystem
+    
+    Paths are grouped by parent directory and each directory is listed once with
+    os.scandir, so checking N files costs one directory read per distinct parent
+    instead of one stat() per file. A directory holding a single requested file
+    is stat'ed directly, since listing a large directory for one name is slower.
+    Directories are checked on the worker thread pool, so on network filesystems
+    selections spanning many folders overlap their round trips.
+    
+    Args:
+        filepaths: List of file paths to check
+        
+    Returns:
+        Set of the paths that exist
+    """
+    by_directory = collections.defaultdict(list)
+    for filepath in filepaths:
+        by_directory[os.path.dirname(filepath)].append(filepath)
+    
+    existing = set()
+    for paths in map_concurrently(_existing_in_directory, list(by_directory.values())):
+        existing.update(paths)
+    
+    return existing
+
+def _stat_or_none(filepath):
+    try:
+        return os.stat(filepath)
+    except OSError:
+        return None
+
+def stat_files(filepaths):
+    """Stat many files at once on the worker thread pool
+    
+    os.stat releases the GIL, so on network or spinning-disk libraries the
+    per-file syscall latency overlaps instead of adding up. Each file is stat'ed
+    once for both size and mtime.
+    
+    Args:
+        filepaths: List of file paths
+        
+    Returns:
+        Dictionary mapping each existing path to its os.stat_result
+    """
+    results = map_concurrently(_stat_or_none, filepaths)
+    return {filepath: st for filepath, st in zip(filepaths, results) if st is not None}
+
 def filter_unmarked_existing_files(files):
     """Filter files to only unmarked files that still exist on filesystem
     
@@ -253,30 +481,376 @@ def filter_unmarked_existing_files(files):
         List of unmarked files that exist on filesystem
     """
     unmarked_files = []
-    
-    for filepath in files:
-        # Skip files that are already processed
-        if is_file_processed(filepath):
-            continue
-        # Validate file still exists before adding to list
-        if not os.path.exists(filepath):
-            logging.warning(f"[API] Skipping non-existent file: {filepath}")
+    # One marker query for the whole list instead of one lookup per file
+    processed = get_processed_files()
+    candidates = [filepath for filepath in files if os.path.abspath(filepath) not in processed]
+    
+    # Validate files still exist before adding to list
+    existing_paths = find_existing_files(candidates)
+    for filepath in candidates:
+        if filepath not in existing_paths:
+            logging.warning("[API] Skipping non-existent file: %s", filepath)
             continue
         unmarked_files.append(filepath)
     
     return unmarked_files
 
-def handle_file_rename_in_store(original_path, final_path):
-    """Handle file rename in file store - record change if file was actually renamed"""
-    if original_path != final_path:
-        record_file_change('rename', old_path=original_path, new_path=final_path)
+# process_file() flags and log wording for each bulk file operation
+FILE_OPERATIONS = {
+    'process': ({'fixtitle': True, 'fixseries': True, 'fixfilename': True},
+                'Processed file', 'processing file'),
+    'rename': ({'fixtitle': False, 'fixseries': False, 'fixfilename': True},
+               'Renamed file', 'renaming file'),
+    'normalize': ({'fixtitle': True, 'fixseries': True, 'fixfilename': False},
+                  'Normalized metadata for file', 'normalizing metadata for file'),
+}
+
+def apply_file_operation(filepath, operation):
+    """Run one bulk operation ('process', 'rename' or 'normalize') on a file
+    
+    Marks the file as web modified, runs process_file() and marks the result as
+    processed. Safe to call from map_concurrently() workers: marker updates go
+    through SQLite and renames through the shared file change queue.
+    
+    Returns:
+        Tuple of (final_filepath, error message or None)
+    """
+    import traceback
+    
+    flags, done, failed = FILE_OPERATIONS[operation]
+    try:
+        mark_file_web_modified_wrapper(filepath)
+        final_filepath = process_file.process_file(filepath, **flags)
+        # process_file() already queued any rename on the shared file change queue
+        mark_file_processed_wrapper(final_filepath, original_filepath=filepath)
+        logging.info("%s via web interface: %s -> %s", done, filepath, final_filepath)
+        return final_filepath, None
+    except Exception as e:
+        logging.error("Error %s %s: %s", failed, filepath, e)
+        logging.error("Traceback: %s", traceback.format_exc())
+        return filepath, str(e)
+
+def map_file_operation(operation, files, existing_paths=None):
+    """Run apply_file_operation() over files concurrently, yielding outcomes in order
+    
+    Processed and duplicate markers written by the workers are buffered in one
+    MarkerBatch and applied in a few transactions instead of one per file. The
+    batch is flushed before the last outcome is yielded (callers zip() outcomes
+    with files, so they stop without exhausting the generator) or when the
+    caller stops early.
+    
+    Args:
+        operation: 'process', 'rename' or 'normalize'
+        files: List of file paths
+        existing_paths: Optional set of paths to operate on; other entries yield None
+        
+    Yields:
+        (final_filepath, error) for each file, or None for skipped entries
+    """
+    batch = MarkerBatch()
+    
+    def run(filepath):
+        if existing_paths is not None and filepath not in existing_paths:
+            return None
+        with batched_markers(batch):
+            return apply_file_operation(filepath, operation)
+    
+    try:
+        for count, outcome in enumerate(map_concurrently(run, files), 1):
+            if count == len(files):
+                batch.flush()
+            yield outcome
+    finally:
+        batch.flush()
+
+def run_file_operation_request(operation, files, names=None, check_existing=False):
+    """Run a bulk operation for a request and build its response
+    
+    Shared by the all/selected/unmarked endpoints of every operation. Responds
+    according to the 'stream' query parameter: a single JSON body by default,
+    Server-Sent Events progress with stream=true, or NDJSON with stream=ndjson
+    (see stream_file_operation()).
+    
+    Like background jobs, only one bulk run is active at a time: while a job or
+    another request's run is in progress the request is rejected with 409.
+    
+    Args:
+        operation: 'process', 'rename' or 'normalize'
+        files: List of full file paths
+        names: Paths reported to the client, parallel to files (defaults to files)
+        check_existing: Report files that no longer exist as 'File not found'
+    """
+    run_lock, busy_response = claim_bulk_run(get_job_manager(max_workers=get_max_workers()))
+    if busy_response:
+        return busy_response
+    try:
+        response = _run_file_operation_request(operation, files, names, check_existing)
+    except BaseException:
+        run_lock.close()
+        raise
+    if not response.is_streamed:
+        run_lock.close()
+        return response
+    # Streams run after this returns, so keep the slot until the stream ends
+    # (or the response is closed without being read)
+    response.response = _release_when_done(response.response, run_lock)
+    response.call_on_close(run_lock.close)
+    return response
+
+def _release_when_done(chunks, run_lock):
+    try:
+        yield from chunks
+    finally:
+        run_lock.close()
+
+def _run_file_operation_request(operation, files, names, check_existing):
+    names = files if names is None else names
+    stream_mode = request.args.get('stream', 'false').lower()
+    
+    if stream_mode == 'ndjson':
+        return stream_file_operation(operation, files, names, check_existing)
+    
+    if stream_mode != 'true':
+        # Non-streaming mode (backward compatible)
+        # Check existence once per parent directory instead of one stat per file
+        existing_paths = find_existing_files(files) if check_existing else None
+        results = []
+        for name, outcome in zip(names, map_file_operation(operation, files, existing_paths)):
+            if outcome is None:
+                results.append({'file': os.path.basename(name), 'success': False, 'error': 'File not found'})
+            elif outcome[1] is None:
+                results.append({'file': os.path.basename(outcome[0]), 'success': True})
+            else:
+                results.append({'file': os.path.basename(name), 'success': False, 'error': outcome[1]})
+        
+        return json_response({'results': results})
+    
+    # Streaming mode - send progress updates
+    endpoint = request.endpoint
+    
+    def generate():
+        import traceback
+        results = []
+        try:
+            # Scan inside the generator so the response starts streaming immediately
+            existing_paths = find_existing_files(files) if check_existing else None
+            outcomes = map_file_operation(operation, files, existing_paths)
+            for i, (name, outcome) in enumerate(zip(names, outcomes)):
+                result = {'file': os.path.basename(name)}
+                
+                if outcome is None:
+                    result['success'] = False
+                    result['error'] = 'File not found'
+                else:
+                    error = outcome[1]
+                    result['success'] = error is None
+                    if error is not None:
+                        result['error'] = error
+                
+                results.append(result)
+                
+                # Send progress update
+                progress = {
+                    'current': i + 1,
+                    'total': len(files),
+                    'file': result['file'],
+                    'success': result['success'],
+                    'error': result.get('error')
+                }
+                yield b"data: " + dump_json(progress) + b"\n\n"
+            
+            # Send final results
+            yield b"data: " + dump_json({'done': True, 'results': results}) + b"\n\n"
+        except Exception as e:
+            # Critical error in streaming - log and send error completion
+            logging.error(f"CRITICAL: Streaming error in {endpoint}: {e}")
+            logging.error(f"Traceback: {traceback.format_exc()}")
+            error_response = {'done': True, 'error': 'An unexpected error occurred. Please check the logs for details.', 'results': results}
+            yield b"data: " + dump_json(error_response) + b"\n\n"
+    
+    return stream_response(generate(), 'text/event-stream')
+
+def run_single_file_operation(filepath, operation):
+    """Run one operation on a single file for the /api/<op>-file/<path> endpoints"""
+    full_path = resolve_path(filepath)
+    
+    if not os.path.exists(full_path):
+        return jsonify({'error': 'File not found'}), 404
+    
+    _, error = apply_file_operation(full_path, operation)
+    if error is not None:
+        return jsonify({'error': error}), 500
+    return jsonify({'success': True})
+
+def stream_file_operation(operation, files, names=None, check_existing=False):
+    """Stream a bulk operation as NDJSON, one result object per line
+    
+    Selected with ?stream=ndjson. Each result is written as soon as its file (and
+    every file before it) is done, and nothing is accumulated server-side, so
+    memory stays flat and clients see progress on libraries of any size. The
+    last line is a summary: {"done": true, "total", "succeeded", "failed"}.
+    
+    Args:
+        operation: 'process', 'rename' or 'normalize'
+        files: List of full file paths
+        names: Paths reported to the client, parallel to files (defaults to files)
+        check_existing: Report files that no longer exist as 'File not found'
+    """
+    names = files if names is None else names
+    
+    def generate():
+        succeeded = 0
+        try:
+            # Scan inside the generator so the response starts streaming immediately
+            existing_paths = find_existing_files(files) if check_existing else None
+            outcomes = map_file_operation(operation, files, existing_paths)
+            for name, outcome in zip(names, outcomes):
+                if outcome is None:
+                    result = {'file': os.path.basename(name), 'success': False, 'error': 'File not found'}
+                elif outcome[1] is None:
+                    succeeded += 1
+                    result = {'file': os.path.basename(outcome[0]), 'success': True}
+                else:
+                    result = {'file': os.path.basename(name), 'success': False, 'error': outcome[1]}
+                yield dump_json(result) + b'\n'
+            
+            yield dump_json({'done': True, 'total': len(files), 'succeeded': succeeded,
+                             'failed': len(files) - succeeded}) + b'\n'
+        except Exception as e:
+            import traceback
+            logging.error(f"CRITICAL: Streaming error in {operation} (ndjson): {e}")
+            logging.error(f"Traceback: {traceback.format_exc()}")
+            yield dump_json({'done': True, 'error': 'An unexpected error occurred. Please check the logs for details.'}) + b'\n'
+    
+    return stream_response(generate(), 'application/x-ndjson')
+
+# Held while checking for a running bulk job and claiming the bulk run slot, so
+# two clicks of "Process All" cannot both start a run. The thread lock covers
+# Gunicorn worker threads, the lock file covers the worker processes.
+_job_start_lock = threading.Lock()
+JOB_START_LOCK_PATH = os.path.join(CONFIG_DIR, 'job_start.lock')
+# Locked for as long as a bulk run started by a request is in progress: for the
+# whole of a synchronous (all/selected/unmarked) run, and until a background
+# job is registered as the active job.
+BULK_RUN_LOCK_PATH = os.path.join(CONFIG_DIR, 'bulk_run.lock')
+
+def get_running_job_id(job_manager):
+    """Id of the active job if it is still queued or processing, otherwise None
+    
+    An active job left behind by a restart (or one that already finished) does
+    not block new jobs.
+    """
+    active_job = get_active_job()
+    if not active_job:
+        return None
+    status = job_manager.get_job_status(active_job['job_id'])
+    if status and status['status'] in (JobStatus.QUEUED.value, JobStatus.PROCESSING.value):
+        return active_job['job_id']
+    return None
+
+def claim_bulk_run(job_manager):
+    """Reserve the single bulk run slot, or build the 409 response if it is taken
+    
+    The slot is taken while a background job is queued or processing, or while
+    another request holds the bulk run lock.
+    
+    Returns:
+        (run_lock, None) with run_lock the locked file to close once the run is
+        over, or (None, response) when another run is active
+    """
+    with _job_start_lock, open(JOB_START_LOCK_PATH, 'w') as lock_file:
+        fcntl.flock(lock_file, fcntl.LOCK_EX)
+        running_job_id = get_running_job_id(job_manager)
+        if running_job_id:
+            logging.warning("[API] Job %s is already running, not starting another", running_job_id)
+            return None, (jsonify({'error': 'Another job is already running', 'job_id': running_job_id}), 409)
+        
+        run_lock = open(BULK_RUN_LOCK_PATH, 'w')
+        try:
+            fcntl.flock(run_lock, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            run_lock.close()
+            logging.warning("[API] A bulk operation is already running, not starting another")
+            return None, (jsonify({'error': 'Another job is already running'}), 409)
+        return run_lock, None
+
+def start_file_operation_job(operation, files, description):
+    """Run a bulk file operation as a background job and respond with its id
+    
+    The request returns as soon as the job is queued instead of holding the
+    connection (and a Gunicorn worker thread) for the whole run. Clients follow
+    progress through /api/jobs/<job_id> and the event stream.
+    
+    Only one bulk job runs at a time: while another is queued or processing the
+    request is rejected with 409 and the running job's id.
+    
+    Args:
+        operation: 'process', 'rename' or 'normalize'
+        files: List of full file paths
+        description: Active job label shown in the UI (e.g. 'Processing Files...')
+    """
+    job_manager = get_job_manager(max_workers=get_max_workers())
+    run_lock, busy_response = claim_bulk_run(job_manager)
+    if busy_response:
+        return busy_response
+    try:
+        job_id = job_manager.create_job(files)
+        
+        # Set active job on server IMMEDIATELY when job is created
+        # This ensures the job is tracked even if the page refreshes before polling starts
+        set_active_job(job_id, description)
+    finally:
+        # From here on the active job keeps other runs out
+        run_lock.close()
+    logging.info(f"[API] Set active job {job_id} on server")
+    
+    def process_item(filepath):
+        final_filepath, error = apply_file_operation(filepath, operation)
+        if error is not None:
+            return JobResult(item=os.path.basename(filepath), success=False, error=error)
+        return JobResult(
+            item=os.path.basename(filepath),
+            success=True,
+            details={'original': filepath, 'final': final_filepath}
+        )
+    
+    # Start job
+    try:
+        job_manager.start_job(job_id, process_item, files)
+    except RuntimeError as e:
+        import traceback
+        logging.error(f"[API] Failed to start job {job_id}: {e}")
+        logging.error(f"Traceback: {traceback.format_exc()}")
+        # Clear active job since we failed to start
+        clear_active_job()
+        # Return generic error message to user (log contains details)
+        return jsonify({'error': 'Failed to start processing job. Please try again.'}), 500
+    
+    logging.info(f"[API] Created and started job {job_id} for {len(files)} files")
+    return jsonify({
+        'job_id': job_id,
+        'total_items': len(files)
+    })
+
+def get_selected_existing_paths():
+    """Full paths of the requested files that exist, and the number requested"""
+    _, file_list = get_request_file_list()
+    requested_paths = list(map(resolve_path, file_list))
+    # One directory scan per parent instead of one stat per file
+    existing_paths = find_existing_files(requested_paths)
+    return [full_path for full_path in requested_paths if full_path in existing_paths], len(file_list)
+
+@functools.lru_cache(maxsize=None)
+def _lowercase_role_synonyms(role_synonyms):
+    """Lowercased synonym set for a role, computed once per synonym tuple"""
+    return frozenset(r.lower() for r in role_synonyms)
 
 def get_credits_by_role(credits_list, role_synonyms):
     """Extract credits for a specific role from credits list"""
     if not credits_list:
         return ''
     
-    role_synonyms_lower = [r.lower() for r in role_synonyms]
+    role_synonyms_lower = _lowercase_role_synonyms(tuple(role_synonyms))
     matching_credits = [
         credit.person for credit in credits_list 
         if credit.role.lower() in role_synonyms_lower
@@ -356,14 +930,14 @@ def update_credits_by_role(credits_list, role_synonyms, value_str):
     """Update credits for a specific role in credits list"""
     if not value_str or not value_str.strip():
         # Remove all credits with this role
-        role_synonyms_lower = [r.lower() for r in role_synonyms]
+        role_synonyms_lower = _lowercase_role_synonyms(tuple(role_synonyms))
         return [c for c in credits_list if c.role.lower() not in role_synonyms_lower]
     
     # Parse comma-separated names
     names = [name.strip() for name in value_str.split(',') if name.strip()]
     
     # Remove existing credits with this role
-    role_synonyms_lower = [r.lower() for r in role_synonyms]
+    role_synonyms_lower = _lowercase_role_synonyms(tuple(role_synonyms))
     filtered_credits = [c for c in credits_list if c.role.lower() not in role_synonyms_lower]
     
     # Add new credits with primary role name
@@ -438,7 +1012,7 @@ def update_file_tags(filepath, tag_updates):
                     setattr(tags, key, value)
         
         # Mark as web modified before writing
-        mark_file_web_modified(filepath)
+        mark_file_web_modified_wrapper(filepath)
         
         # Write tags
         ca.write_tags(tags, 'cr')
@@ -449,6 +1023,18 @@ def update_file_tags(filepath, tag_updates):
         logging.error(f"Error updating tags for {filepath}: {e}")
         return False
 
+@functools.lru_cache(maxsize=None)
+def render_index(base_path):
+    """Render the main page for a base path
+    
+    The page depends only on base_path, so it is rendered once per process
+    instead of on every request.
+    
+    Returns:
+        The page as UTF-8 bytes
+    """
+    return render_template('index.html', base_path=base_path, version=__version__).encode('utf-8')
+
 @app.route('/')
 def index():
     """Serve the main page"""
@@ -456,9 +1042,11 @@ def index():
     base_path = app.config.get('APPLICATION_ROOT', '')
     if base_path == '/':
         base_path = ''
-    response = render_template('index.html', base_path=base_path)
-    # Add cache control for static HTML (short cache for dynamic content)
-    return response
+    response = app.response_class(render_index(base_path), mimetype='text/html')
+    # Browsers revalidate the page on each visit and get a 304 while it is unchanged
+    response.headers['Cache-Control'] = 'no-cache'
+    response.add_etag()
+    return response.make_conditional(request)
 
 @app.route('/manifest.json')
 def serve_manifest():
@@ -533,14 +1121,31 @@ const BASE_PATH = '{base_path}';
         mimetype='application/javascript'
     )
 
+@functools.lru_cache(maxsize=32)
+def gzip_static_file(path, mtime):
+    """Gzip a static file's contents, once per file version (keyed on mtime)"""
+    with open(path, 'rb') as f:
+        return gzip.compress(f.read(), compresslevel=9, mtime=0)
+
 @app.route('/static/<path:filename>')
 def serve_static(filename):
     """Serve static files (icons, CSS, JS, etc.) with caching headers"""
     response = send_from_directory(static_folder, filename)
     # Cache static files for 1 year (CSS/JS) or 1 day (icons)
     if filename.endswith(('.css', '.js')):
-        # Long cache for versioned assets
+        # Long cache for versioned assets (the page links them with ?v=<app version>)
         response.headers['Cache-Control'] = 'public, max-age=31536000, immutable'
+        # CSS/JS shrink several times under gzip, which neither Flask nor Gunicorn applies
+        if response.status_code == 200 and 'gzip' in request.accept_encodings:
+            path = safe_join(static_folder, filename)
+            response.direct_passthrough = False
+            response.set_data(gzip_static_file(path, os.path.getmtime(path)))
+            response.headers['Content-Encoding'] = 'gzip'
+            response.headers.pop('Accept-Ranges', None)
+            etag, _ = response.get_etag()
+            if etag:
+                response.set_etag(f"{etag}-gzip")
+                response.make_conditional(request)
     else:
         # Shorter cache for icons and other assets
         response.headers['Cache-Control'] = 'public, max-age=86400'
@@ -572,29 +1177,30 @@ def get_enriched_file_list(files):
     # Get all file metadata from database in a single query
     file_metadata = load_files_with_metadata_from_store()
     
+    # Stat files missing from the database in one concurrent batch
+    file_stats = stat_files([f for f in files if f not in file_metadata])
+    
     # Build file list with metadata
     all_files = []
     for f in files:
         abs_path = os.path.abspath(f)
-        rel_path = os.path.relpath(f, WATCHED_DIR) if WATCHED_DIR else f
+        rel_path = get_relative_path(f)
         
-        # Get metadata from database or fall back to os.path
+        # Get metadata from database or fall back to the batched stat
         metadata = file_metadata.get(f)
         if metadata:
             file_size = metadata['file_size'] or 0
             file_mtime = metadata['last_modified']
+        elif f in file_stats:
+            file_size = file_stats[f].st_size
+            file_mtime = file_stats[f].st_mtime
         else:
-            # Fallback to os.path if not in database
-            try:
-                file_size = os.path.getsize(f)
-                file_mtime = os.path.getmtime(f)
-            except OSError:
-                file_size = 0
-                file_mtime = 0
+            file_size = 0
+            file_mtime = 0
         
         all_files.append({
             'path': f,
-            'name': os.path.basename(f),
+            'name': rel_path.rsplit(os.sep, 1)[-1],
             'relative_path': rel_path,
             'size': file_size,
             'modified': file_mtime,
@@ -661,9 +1267,17 @@ def list_files():
     sort_mode = request.args.get('sort', 'name', type=str)  # 'name', 'date', 'size'
     sort_direction = request.args.get('direction', 'asc', type=str)  # 'asc', 'desc'
     
-    # Get unmarked count efficiently (single SQL query)
-    from unified_store import get_unmarked_file_count
-    unmarked_count = get_unmarked_file_count()
+    # Make sure queued renames/deletes are visible before querying
+    flush_file_changes()
+    
+    # Conditional GET: the listing only changes when the files or markers tables do,
+    # so a client holding the current version gets a 304 without running any queries
+    etag = get_store_etag()
+    if etag and etag in request.if_none_match:
+        return app.response_class(status=304, headers={'ETag': f'"{etag}"'})
+    
+    # Unmarked count is only recounted after the store changes
+    _, unmarked_count = get_store_counts()
     
     # Use optimized paginated query from database for all filter modes
     # Calculate offset
@@ -688,26 +1302,21 @@ def list_files():
         filter_mode=filter_mode
     )
     
-    # Enrich only the files in this page
-    marker_data = get_all_marker_data()
-    processed_files = marker_data.get('processed', set())
-    duplicate_files = marker_data.get('duplicate', set())
-    
-    paginated_files = []
-    for file_data in paginated_file_data:
-        filepath = file_data['filepath']
-        abs_path = os.path.abspath(filepath)
-        rel_path = os.path.relpath(filepath, WATCHED_DIR) if WATCHED_DIR else filepath
-        
-        paginated_files.append({
-            'path': filepath,
-            'name': os.path.basename(filepath),
-            'relative_path': rel_path,
+    # Enrich only the files in this page; marker flags come with the page query.
+    # This runs once per file when per_page=0, so it is a single comprehension and
+    # rpartition stands in for os.path.basename (same result on POSIX, less overhead)
+    paginated_files = [
+        {
+            'path': file_data['filepath'],
+            'name': file_data['filepath'].rpartition(os.sep)[2],
+            'relative_path': get_relative_path(file_data['filepath']),
             'size': file_data['file_size'] or 0,
             'modified': file_data['last_modified'],
-            'processed': abs_path in processed_files,
-            'duplicate': abs_path in duplicate_files
-        })
+            'processed': file_data['processed'],
+            'duplicate': file_data['duplicate']
+        }
+        for file_data in paginated_file_data
+    ]
     
     # Calculate pagination
     if per_page <= 0:
@@ -717,7 +1326,7 @@ def list_files():
         total_pages = (total_filtered + per_page - 1) // per_page if total_filtered > 0 else 1
         page = max(1, min(page, total_pages))
     
-    return jsonify({
+    response = json_response({
         'files': paginated_files,
         'page': page,
         'per_page': per_page,
@@ -725,11 +1334,29 @@ def list_files():
         'total_pages': total_pages,
         'unmarked_count': unmarked_count
     })
+    if etag:
+        response.set_etag(etag)
+    return response
+
+@app.route('/api/files/rescan', methods=['POST'])
+def rescan_files():
+    """API endpoint to pick up changes made to the library outside the app right away
+    
+    Without it, files added while the watcher was disabled only show up at the next
+    background sync. The sync lists only directories whose mtime changed since the
+    last one, so a rescan of an unchanged library costs one stat per directory.
+    """
+    result = file_store.sync_with_filesystem_if_stale(WATCHED_DIR, max_age=0)
+    if result is None:
+        # Another process is syncing right now
+        return jsonify({'success': True, 'skipped': True})
+    added, removed, updated = result
+    return jsonify({'success': True, 'added': added, 'removed': removed, 'updated': updated})
 
 @app.route('/api/file/<path:filepath>/tags')
 def get_tags(filepath):
     """API endpoint to get tags for a specific file"""
-    full_path = os.path.join(WATCHED_DIR, filepath) if WATCHED_DIR else filepath
+    full_path = resolve_path(filepath)
     
     if not os.path.exists(full_path):
         return jsonify({'error': 'File not found'}), 404
@@ -743,7 +1370,7 @@ def get_tags(filepath):
 @app.route('/api/file/<path:filepath>/tags', methods=['POST'])
 def update_tags(filepath):
     """API endpoint to update tags for a specific file"""
-    full_path = os.path.join(WATCHED_DIR, filepath) if WATCHED_DIR else filepath
+    full_path = resolve_path(filepath)
     
     if not os.path.exists(full_path):
         return jsonify({'error': 'File not found'}), 404
@@ -761,21 +1388,30 @@ def update_tags(filepath):
 @app.route('/api/files/tags', methods=['POST'])
 def batch_update_tags():
     """API endpoint to update tags for multiple files with streaming progress"""
-    data = request.json
-    files = data.get('files', [])
+    data, files = get_request_file_list()
     tag_updates = data.get('tags', {})
     stream = request.args.get('stream', 'false').lower() == 'true'
     
     if not files or not tag_updates:
         return jsonify({'error': 'Files and tags are required'}), 400
     
+    full_paths = list(map(resolve_path, files))
+    
+    def update_existing_file_tags(full_path, existing_paths):
+        """Update tags for one file, returning None if it does not exist"""
+        if full_path not in existing_paths:
+            return None
+        return update_file_tags(full_path, tag_updates)
+    
     if not stream:
+        # Check existence once per parent directory instead of one stat per file
+        existing_paths = find_existing_files(full_paths)
+        outcomes = map_concurrently(lambda full_path: update_existing_file_tags(full_path, existing_paths), full_paths)
+        
         # Non-streaming mode (backward compatible)
         results = []
-        for filepath in files:
-            full_path = os.path.join(WATCHED_DIR, filepath) if WATCHED_DIR else filepath
-            if os.path.exists(full_path):
-                success = update_file_tags(full_path, tag_updates)
+        for filepath, success in zip(files, outcomes):
+            if success is not None:
                 results.append({
                     'file': filepath,
                     'success': success
@@ -787,20 +1423,20 @@ def batch_update_tags():
                     'error': 'File not found'
                 })
         
-        return jsonify({'results': results})
+        return json_response({'results': results})
     
     # Streaming mode - send progress updates
     def generate():
-        import json
         import traceback
         results = []
         try:
-            for i, filepath in enumerate(files):
-                full_path = os.path.join(WATCHED_DIR, filepath) if WATCHED_DIR else filepath
+            # Scan inside the generator so the response starts streaming immediately
+            existing_paths = find_existing_files(full_paths)
+            outcomes = map_concurrently(lambda full_path: update_existing_file_tags(full_path, existing_paths), full_paths)
+            for i, (filepath, success) in enumerate(zip(files, outcomes)):
                 result = {'file': filepath}
                 
-                if os.path.exists(full_path):
-                    success = update_file_tags(full_path, tag_updates)
+                if success is not None:
                     result['success'] = success
                     if not success:
                         result['error'] = 'Failed to update tags'
@@ -818,628 +1454,95 @@ def batch_update_tags():
                     'success': result['success'],
                     'error': result.get('error')
                 }
-                yield f"data: {json.dumps(progress)}\n\n"
+                yield b"data: " + dump_json(progress) + b"\n\n"
             
             # Send final results
-            yield f"data: {json.dumps({'done': True, 'results': results})}\n\n"
+            yield b"data: " + dump_json({'done': True, 'results': results}) + b"\n\n"
         except Exception as e:
             # Critical error in streaming - log and send error completion
             logging.error(f"CRITICAL: Streaming error in update_multiple_tags: {e}")
             logging.error(f"Traceback: {traceback.format_exc()}")
             error_response = {'done': True, 'error': 'An unexpected error occurred. Please check the logs for details.', 'results': results}
-            yield f"data: {json.dumps(error_response)}\n\n"
+            yield b"data: " + dump_json(error_response) + b"\n\n"
     
-    return app.response_class(generate(), mimetype='text/event-stream')
+    return stream_response(generate(), 'text/event-stream')
 
 
 @app.route('/api/process-all', methods=['POST'])
 def process_all_files():
     """API endpoint to process all files in the watched directory with streaming progress"""
-    from process_file import process_file
-    
-    stream = request.args.get('stream', 'false').lower() == 'true'
     files = get_comic_files()
-    
-    if not stream:
-        # Non-streaming mode (backward compatible)
-        results = []
-        for filepath in files:
-            try:
-                mark_file_web_modified(filepath)
-                final_filepath = process_file(filepath, fixtitle=True, fixseries=True, fixfilename=True)
-                mark_file_processed_wrapper(final_filepath, original_filepath=filepath)
-                handle_file_rename_in_store(filepath, final_filepath)
-                results.append({
-                    'file': os.path.basename(final_filepath),
-                    'success': True
-                })
-                logging.info(f"Processed file via web interface: {filepath} -> {final_filepath}")
-            except Exception as e:
-                results.append({
-                    'file': os.path.basename(filepath),
-                    'success': False,
-                    'error': str(e)
-                })
-                logging.error(f"Error processing file {filepath}: {e}")
-        
-        return jsonify({'results': results})
-    
-    # Streaming mode - send progress updates
-    def generate():
-        import json
-        import traceback
-        results = []
-        try:
-            for i, filepath in enumerate(files):
-                result = {'file': os.path.basename(filepath)}
-                
-                try:
-                    mark_file_web_modified(filepath)
-                    final_filepath = process_file(filepath, fixtitle=True, fixseries=True, fixfilename=True)
-                    mark_file_processed_wrapper(final_filepath, original_filepath=filepath)
-                    handle_file_rename_in_store(filepath, final_filepath)
-                    result['success'] = True
-                    logging.info(f"Processed file via web interface: {filepath} -> {final_filepath}")
-                except Exception as e:
-                    result['success'] = False
-                    result['error'] = str(e)
-                    logging.error(f"Error processing file {filepath}: {e}")
-                    logging.error(f"Traceback: {traceback.format_exc()}")
-                
-                results.append(result)
-                
-                # Send progress update
-                progress = {
-                    'current': i + 1,
-                    'total': len(files),
-                    'file': result['file'],
-                    'success': result['success'],
-                    'error': result.get('error')
-                }
-                yield f"data: {json.dumps(progress)}\n\n"
-            
-            # Send final results
-            yield f"data: {json.dumps({'done': True, 'results': results})}\n\n"
-        except Exception as e:
-            # Critical error in streaming - log and send error completion
-            logging.error(f"CRITICAL: Streaming error in process_all_files: {e}")
-            logging.error(f"Traceback: {traceback.format_exc()}")
-            error_response = {'done': True, 'error': 'An unexpected error occurred. Please check the logs for details.', 'results': results}
-            yield f"data: {json.dumps(error_response)}\n\n"
-    
-    return app.response_class(generate(), mimetype='text/event-stream')
+    return run_file_operation_request('process', files)
 
 
 @app.route('/api/rename-all', methods=['POST'])
 def rename_all_files():
     """API endpoint to rename all files in the watched directory with streaming progress"""
-    from process_file import process_file
-    
-    stream = request.args.get('stream', 'false').lower() == 'true'
     files = get_comic_files()
-    
-    if not stream:
-        # Non-streaming mode (backward compatible)
-        results = []
-        for filepath in files:
-            try:
-                mark_file_web_modified(filepath)
-                final_filepath = process_file(filepath, fixtitle=False, fixseries=False, fixfilename=True)
-                mark_file_processed_wrapper(final_filepath, original_filepath=filepath)
-                handle_file_rename_in_store(filepath, final_filepath)
-                results.append({
-                    'file': os.path.basename(final_filepath),
-                    'success': True
-                })
-                logging.info(f"Renamed file via web interface: {filepath} -> {final_filepath}")
-            except Exception as e:
-                results.append({
-                    'file': os.path.basename(filepath),
-                    'success': False,
-                    'error': str(e)
-                })
-                logging.error(f"Error renaming file {filepath}: {e}")
-        
-        return jsonify({'results': results})
-    
-    # Streaming mode - send progress updates
-    def generate():
-        import json
-        import traceback
-        results = []
-        try:
-            for i, filepath in enumerate(files):
-                result = {'file': os.path.basename(filepath)}
-                
-                try:
-                    mark_file_web_modified(filepath)
-                    final_filepath = process_file(filepath, fixtitle=False, fixseries=False, fixfilename=True)
-                    mark_file_processed_wrapper(final_filepath, original_filepath=filepath)
-                    handle_file_rename_in_store(filepath, final_filepath)
-                    result['success'] = True
-                    logging.info(f"Renamed file via web interface: {filepath} -> {final_filepath}")
-                except Exception as e:
-                    result['success'] = False
-                    result['error'] = str(e)
-                    logging.error(f"Error renaming file {filepath}: {e}")
-                    logging.error(f"Traceback: {traceback.format_exc()}")
-                
-                results.append(result)
-                
-                # Send progress update
-                progress = {
-                    'current': i + 1,
-                    'total': len(files),
-                    'file': result['file'],
-                    'success': result['success'],
-                    'error': result.get('error')
-                }
-                yield f"data: {json.dumps(progress)}\n\n"
-            
-            # Send final results
-            yield f"data: {json.dumps({'done': True, 'results': results})}\n\n"
-        except Exception as e:
-            # Critical error in streaming - log and send error completion
-            logging.error(f"CRITICAL: Streaming error in rename_all_files: {e}")
-            logging.error(f"Traceback: {traceback.format_exc()}")
-            error_response = {'done': True, 'error': 'An unexpected error occurred. Please check the logs for details.', 'results': results}
-            yield f"data: {json.dumps(error_response)}\n\n"
-    
-    return app.response_class(generate(), mimetype='text/event-stream')
+    return run_file_operation_request('rename', files)
 
 
 @app.route('/api/normalize-all', methods=['POST'])
 def normalize_all_files():
     """API endpoint to normalize metadata for all files in the watched directory with streaming progress"""
-    from process_file import process_file
-    
-    stream = request.args.get('stream', 'false').lower() == 'true'
     files = get_comic_files()
-    
-    if not stream:
-        # Non-streaming mode (backward compatible)
-        results = []
-        for filepath in files:
-            try:
-                mark_file_web_modified(filepath)
-                final_filepath = process_file(filepath, fixtitle=True, fixseries=True, fixfilename=False)
-                mark_file_processed_wrapper(final_filepath, original_filepath=filepath)
-                results.append({
-                    'file': os.path.basename(final_filepath),
-                    'success': True
-                })
-                logging.info(f"Normalized metadata for file via web interface: {filepath}")
-            except Exception as e:
-                results.append({
-                    'file': os.path.basename(filepath),
-                    'success': False,
-                    'error': str(e)
-                })
-                logging.error(f"Error normalizing metadata for file {filepath}: {e}")
-        
-        return jsonify({'results': results})
-    
-    # Streaming mode - send progress updates
-    def generate():
-        import json
-        import traceback
-        results = []
-        try:
-            for i, filepath in enumerate(files):
-                result = {'file': os.path.basename(filepath)}
-                
-                try:
-                    mark_file_web_modified(filepath)
-                    final_filepath = process_file(filepath, fixtitle=True, fixseries=True, fixfilename=False)
-                    mark_file_processed_wrapper(final_filepath, original_filepath=filepath)
-                    result['success'] = True
-                    logging.info(f"Normalized metadata for file via web interface: {filepath}")
-                except Exception as e:
-                    result['success'] = False
-                    result['error'] = str(e)
-                    logging.error(f"Error normalizing metadata for file {filepath}: {e}")
-                    logging.error(f"Traceback: {traceback.format_exc()}")
-                
-                results.append(result)
-                
-                # Send progress update
-                progress = {
-                    'current': i + 1,
-                    'total': len(files),
-                    'file': result['file'],
-                    'success': result['success'],
-                    'error': result.get('error')
-                }
-                yield f"data: {json.dumps(progress)}\n\n"
-            
-            # Send final results
-            yield f"data: {json.dumps({'done': True, 'results': results})}\n\n"
-        except Exception as e:
-            # Critical error in streaming - log and send error completion
-            logging.error(f"CRITICAL: Streaming error in normalize_all_files: {e}")
-            logging.error(f"Traceback: {traceback.format_exc()}")
-            error_response = {'done': True, 'error': 'An unexpected error occurred. Please check the logs for details.', 'results': results}
-            yield f"data: {json.dumps(error_response)}\n\n"
-    
-    return app.response_class(generate(), mimetype='text/event-stream')
+    return run_file_operation_request('normalize', files)
 
 
 @app.route('/api/process-file/<path:filepath>', methods=['POST'])
 def process_single_file(filepath):
     """API endpoint to process a single file"""
-    from process_file import process_file
-    
-    full_path = os.path.join(WATCHED_DIR, filepath) if WATCHED_DIR else filepath
-    
-    if not os.path.exists(full_path):
-        return jsonify({'error': 'File not found'}), 404
-    
-    try:
-        # Mark as web modified to prevent watcher from processing
-        mark_file_web_modified(full_path)
-        
-        # Process the file and get the final filepath (may be renamed)
-        final_filepath = process_file(full_path, fixtitle=True, fixseries=True, fixfilename=True)
-        
-        # Mark as processed using the final filepath, cleanup old filename if renamed
-        mark_file_processed_wrapper(final_filepath, original_filepath=full_path)
-        
-        handle_file_rename_in_store(full_path, final_filepath)
-        
-        logging.info(f"Processed file via web interface: {full_path} -> {final_filepath}")
-        return jsonify({'success': True})
-    except Exception as e:
-        logging.error(f"Error processing file {full_path}: {e}")
-        return jsonify({'error': str(e)}), 500
+    return run_single_file_operation(filepath, 'process')
 
 @app.route('/api/rename-file/<path:filepath>', methods=['POST'])
 def rename_single_file(filepath):
     """API endpoint to rename a single file based on metadata"""
-    from process_file import process_file
-    
-    full_path = os.path.join(WATCHED_DIR, filepath) if WATCHED_DIR else filepath
-    
-    if not os.path.exists(full_path):
-        return jsonify({'error': 'File not found'}), 404
-    
-    try:
-        # Mark as web modified to prevent watcher from processing
-        mark_file_web_modified(full_path)
-        
-        # Only rename the file
-        final_filepath = process_file(full_path, fixtitle=False, fixseries=False, fixfilename=True)
-        
-        # Mark as processed using the final filepath, cleanup old filename if renamed
-        mark_file_processed_wrapper(final_filepath, original_filepath=full_path)
-        
-        handle_file_rename_in_store(full_path, final_filepath)
-        
-        logging.info(f"Renamed file via web interface: {full_path} -> {final_filepath}")
-        return jsonify({'success': True})
-    except Exception as e:
-        logging.error(f"Error renaming file {full_path}: {e}")
-        return jsonify({'error': str(e)}), 500
+    return run_single_file_operation(filepath, 'rename')
 
 @app.route('/api/normalize-file/<path:filepath>', methods=['POST'])
 def normalize_single_file(filepath):
     """API endpoint to normalize metadata for a single file"""
-    from process_file import process_file
-    
-    full_path = os.path.join(WATCHED_DIR, filepath) if WATCHED_DIR else filepath
-    
-    if not os.path.exists(full_path):
-        return jsonify({'error': 'File not found'}), 404
-    
-    try:
-        # Mark as web modified to prevent watcher from processing
-        mark_file_web_modified(full_path)
-        
-        # Only normalize metadata
-        final_filepath = process_file(full_path, fixtitle=True, fixseries=True, fixfilename=False)
-        
-        # Mark as processed using the final filepath, cleanup old filename if renamed
-        mark_file_processed_wrapper(final_filepath, original_filepath=full_path)
-        
-        logging.info(f"Normalized metadata for file via web interface: {full_path}")
-        return jsonify({'success': True})
-    except Exception as e:
-        logging.error(f"Error normalizing metadata for file {full_path}: {e}")
-        return jsonify({'error': str(e)}), 500
+    return run_single_file_operation(filepath, 'normalize')
 
 @app.route('/api/process-selected', methods=['POST'])
 def process_selected_files():
     """API endpoint to process selected files with streaming progress"""
-    from process_file import process_file
-    
-    data = request.json
-    file_list = data.get('files', [])
-    stream = request.args.get('stream', 'false').lower() == 'true'
+    _, file_list = get_request_file_list()
     
     if not file_list:
         return jsonify({'error': 'No files specified'}), 400
     
-    if not stream:
-        # Non-streaming mode (backward compatible)
-        results = []
-        for filepath in file_list:
-            full_path = os.path.join(WATCHED_DIR, filepath) if WATCHED_DIR else filepath
-            
-            if not os.path.exists(full_path):
-                results.append({
-                    'file': os.path.basename(filepath),
-                    'success': False,
-                    'error': 'File not found'
-                })
-                continue
-            
-            try:
-                mark_file_web_modified(full_path)
-                final_filepath = process_file(full_path, fixtitle=True, fixseries=True, fixfilename=True)
-                mark_file_processed_wrapper(final_filepath, original_filepath=full_path)
-                handle_file_rename_in_store(full_path, final_filepath)
-                results.append({
-                    'file': os.path.basename(final_filepath),
-                    'success': True
-                })
-                logging.info(f"Processed file via web interface: {full_path} -> {final_filepath}")
-            except Exception as e:
-                results.append({
-                    'file': os.path.basename(filepath),
-                    'success': False,
-                    'error': str(e)
-                })
-                logging.error(f"Error processing file {full_path}: {e}")
-        
-        return jsonify({'results': results})
-    
-    # Streaming mode - send progress updates
-    def generate():
-        import json
-        import traceback
-        results = []
-        try:
-            for i, filepath in enumerate(file_list):
-                full_path = os.path.join(WATCHED_DIR, filepath) if WATCHED_DIR else filepath
-                result = {'file': os.path.basename(filepath)}
-                
-                if not os.path.exists(full_path):
-                    result['success'] = False
-                    result['error'] = 'File not found'
-                else:
-                    try:
-                        mark_file_web_modified(full_path)
-                        final_filepath = process_file(full_path, fixtitle=True, fixseries=True, fixfilename=True)
-                        mark_file_processed_wrapper(final_filepath, original_filepath=full_path)
-                        handle_file_rename_in_store(full_path, final_filepath)
-                        result['success'] = True
-                        logging.info(f"Processed file via web interface: {full_path} -> {final_filepath}")
-                    except Exception as e:
-                        result['success'] = False
-                        result['error'] = str(e)
-                        logging.error(f"Error processing file {full_path}: {e}")
-                        logging.error(f"Traceback: {traceback.format_exc()}")
-                
-                results.append(result)
-                
-                # Send progress update
-                progress = {
-                    'current': i + 1,
-                    'total': len(file_list),
-                    'file': result['file'],
-                    'success': result['success'],
-                    'error': result.get('error')
-                }
-                yield f"data: {json.dumps(progress)}\n\n"
-            
-            # Send final results
-            yield f"data: {json.dumps({'done': True, 'results': results})}\n\n"
-        except Exception as e:
-            # Critical error in streaming - log and send error completion
-            logging.error(f"CRITICAL: Streaming error in process_selected_files: {e}")
-            logging.error(f"Traceback: {traceback.format_exc()}")
-            error_response = {'done': True, 'error': 'An unexpected error occurred. Please check the logs for details.', 'results': results}
-            yield f"data: {json.dumps(error_response)}\n\n"
-    
-    return app.response_class(generate(), mimetype='text/event-stream')
+    full_paths = list(map(resolve_path, file_list))
+    return run_file_operation_request('process', full_paths, names=file_list, check_existing=True)
 
 
 @app.route('/api/rename-selected', methods=['POST'])
 def rename_selected_files():
     """API endpoint to rename selected files with streaming progress"""
-    from process_file import process_file
-    
-    data = request.json
-    file_list = data.get('files', [])
-    stream = request.args.get('stream', 'false').lower() == 'true'
+    _, file_list = get_request_file_list()
     
     if not file_list:
         return jsonify({'error': 'No files specified'}), 400
     
-    if not stream:
-        # Non-streaming mode (backward compatible)
-        results = []
-        for filepath in file_list:
-            full_path = os.path.join(WATCHED_DIR, filepath) if WATCHED_DIR else filepath
-            
-            if not os.path.exists(full_path):
-                results.append({
-                    'file': os.path.basename(filepath),
-                    'success': False,
-                    'error': 'File not found'
-                })
-                continue
-            
-            try:
-                mark_file_web_modified(full_path)
-                final_filepath = process_file(full_path, fixtitle=False, fixseries=False, fixfilename=True)
-                mark_file_processed_wrapper(final_filepath, original_filepath=full_path)
-                handle_file_rename_in_store(full_path, final_filepath)
-                results.append({
-                    'file': os.path.basename(final_filepath),
-                    'success': True
-                })
-                logging.info(f"Renamed file via web interface: {full_path} -> {final_filepath}")
-            except Exception as e:
-                results.append({
-                    'file': os.path.basename(filepath),
-                    'success': False,
-                    'error': str(e)
-                })
-                logging.error(f"Error renaming file {full_path}: {e}")
-        
-        return jsonify({'results': results})
-    
-    # Streaming mode - send progress updates
-    def generate():
-        import json
-        import traceback
-        results = []
-        try:
-            for i, filepath in enumerate(file_list):
-                full_path = os.path.join(WATCHED_DIR, filepath) if WATCHED_DIR else filepath
-                result = {'file': os.path.basename(filepath)}
-                
-                if not os.path.exists(full_path):
-                    result['success'] = False
-                    result['error'] = 'File not found'
-                else:
-                    try:
-                        mark_file_web_modified(full_path)
-                        final_filepath = process_file(full_path, fixtitle=False, fixseries=False, fixfilename=True)
-                        mark_file_processed_wrapper(final_filepath, original_filepath=full_path)
-                        handle_file_rename_in_store(full_path, final_filepath)
-                        result['success'] = True
-                        logging.info(f"Renamed file via web interface: {full_path} -> {final_filepath}")
-                    except Exception as e:
-                        result['success'] = False
-                        result['error'] = str(e)
-                        logging.error(f"Error renaming file {full_path}: {e}")
-                        logging.error(f"Traceback: {traceback.format_exc()}")
-                
-                results.append(result)
-                
-                # Send progress update
-                progress = {
-                    'current': i + 1,
-                    'total': len(file_list),
-                    'file': result['file'],
-                    'success': result['success'],
-                    'error': result.get('error')
-                }
-                yield f"data: {json.dumps(progress)}\n\n"
-            
-            # Send final results
-            yield f"data: {json.dumps({'done': True, 'results': results})}\n\n"
-        except Exception as e:
-            # Critical error in streaming - log and send error completion
-            logging.error(f"CRITICAL: Streaming error in rename_selected_files: {e}")
-            logging.error(f"Traceback: {traceback.format_exc()}")
-            error_response = {'done': True, 'error': 'An unexpected error occurred. Please check the logs for details.', 'results': results}
-            yield f"data: {json.dumps(error_response)}\n\n"
-    
-    return app.response_class(generate(), mimetype='text/event-stream')
+    full_paths = list(map(resolve_path, file_list))
+    return run_file_operation_request('rename', full_paths, names=file_list, check_existing=True)
 
 
 @app.route('/api/normalize-selected', methods=['POST'])
 def normalize_selected_files():
     """API endpoint to normalize metadata for selected files with streaming progress"""
-    from process_file import process_file
-    
-    data = request.json
-    file_list = data.get('files', [])
-    stream = request.args.get('stream', 'false').lower() == 'true'
+    _, file_list = get_request_file_list()
     
     if not file_list:
         return jsonify({'error': 'No files specified'}), 400
     
-    if not stream:
-        # Non-streaming mode (backward compatible)
-        results = []
-        for filepath in file_list:
-            full_path = os.path.join(WATCHED_DIR, filepath) if WATCHED_DIR else filepath
-            
-            if not os.path.exists(full_path):
-                results.append({
-                    'file': os.path.basename(filepath),
-                    'success': False,
-                    'error': 'File not found'
-                })
-                continue
-            
-            try:
-                mark_file_web_modified(full_path)
-                final_filepath = process_file(full_path, fixtitle=True, fixseries=True, fixfilename=False)
-                mark_file_processed_wrapper(final_filepath, original_filepath=full_path)
-                results.append({
-                    'file': os.path.basename(final_filepath),
-                    'success': True
-                })
-                logging.info(f"Normalized metadata for file via web interface: {full_path}")
-            except Exception as e:
-                results.append({
-                    'file': os.path.basename(filepath),
-                    'success': False,
-                    'error': str(e)
-                })
-                logging.error(f"Error normalizing metadata for file {full_path}: {e}")
-        
-        return jsonify({'results': results})
-    
-    # Streaming mode - send progress updates
-    def generate():
-        import json
-        import traceback
-        results = []
-        try:
-            for i, filepath in enumerate(file_list):
-                full_path = os.path.join(WATCHED_DIR, filepath) if WATCHED_DIR else filepath
-                result = {'file': os.path.basename(filepath)}
-                
-                if not os.path.exists(full_path):
-                    result['success'] = False
-                    result['error'] = 'File not found'
-                else:
-                    try:
-                        mark_file_web_modified(full_path)
-                        final_filepath = process_file(full_path, fixtitle=True, fixseries=True, fixfilename=False)
-                        mark_file_processed_wrapper(final_filepath, original_filepath=full_path)
-                        result['success'] = True
-                        logging.info(f"Normalized metadata for file via web interface: {full_path}")
-                    except Exception as e:
-                        result['success'] = False
-                        result['error'] = str(e)
-                        logging.error(f"Error normalizing metadata for file {full_path}: {e}")
-                        logging.error(f"Traceback: {traceback.format_exc()}")
-                
-                results.append(result)
-                
-                # Send progress update
-                progress = {
-                    'current': i + 1,
-                    'total': len(file_list),
-                    'file': result['file'],
-                    'success': result['success'],
-                    'error': result.get('error')
-                }
-                yield f"data: {json.dumps(progress)}\n\n"
-            
-            # Send final results
-            yield f"data: {json.dumps({'done': True, 'results': results})}\n\n"
-        except Exception as e:
-            # Critical error in streaming - log and send error completion
-            logging.error(f"CRITICAL: Streaming error in normalize_selected_files: {e}")
-            logging.error(f"Traceback: {traceback.format_exc()}")
-            error_response = {'done': True, 'error': 'An unexpected error occurred. Please check the logs for details.', 'results': results}
-            yield f"data: {json.dumps(error_response)}\n\n"
-    
-    return app.response_class(generate(), mimetype='text/event-stream')
+    full_paths = list(map(resolve_path, file_list))
+    return run_file_operation_request('normalize', full_paths, names=file_list, check_existing=True)
 
 
 @app.route('/api/jobs/process-all', methods=['POST'])
 def async_process_all_files():
     """API endpoint to start async processing of all files"""
-    from process_file import process_file
-    
     logging.info("[API] Request to process all files (async)")
     files = get_comic_files()
     
@@ -1448,130 +1551,92 @@ def async_process_all_files():
         return jsonify({'error': 'No files to process'}), 400
     
     logging.info(f"[API] Found {len(files)} files to process")
+    return start_file_operation_job('process', files, 'Processing Files...')
+
+
+@app.route('/api/jobs/rename-all', methods=['POST'])
+def async_rename_all_files():
+    """API endpoint to start async renaming of all files"""
+    logging.info("[API] Request to rename all files (async)")
+    files = get_comic_files()
     
-    # Create job
-    job_manager = get_job_manager(max_workers=get_max_workers())
-    job_id = job_manager.create_job(files)
-    
-    # Set active job on server IMMEDIATELY when job is created
-    # This ensures the job is tracked even if the page refreshes before polling starts
-    set_active_job(job_id, 'Processing Files...')
-    logging.info(f"[API] Set active job {job_id} on server")
+    if not files:
+        logging.warning("[API] No files found to rename")
+        return jsonify({'error': 'No files to rename'}), 400
     
-    # Define processing function
-    def process_item(filepath):
-        try:
-            mark_file_web_modified(filepath)
-            final_filepath = process_file(filepath, fixtitle=True, fixseries=True, fixfilename=True)
-            mark_file_processed_wrapper(final_filepath, original_filepath=filepath)
-            handle_file_rename_in_store(filepath, final_filepath)
-            logging.info(f"[BATCH] Processed file: {filepath} -> {final_filepath}")
-            return JobResult(
-                item=os.path.basename(filepath),
-                success=True,
-                details={'original': filepath, 'final': final_filepath}
-            )
-        except Exception as e:
-            logging.error(f"[BATCH] Error processing file {filepath}: {e}")
-            return JobResult(
-                item=os.path.basename(filepath),
-                success=False,
-                error=str(e)
-            )
+    logging.info(f"[API] Found {len(files)} files to rename")
+    return start_file_operation_job('rename', files, 'Renaming All Files...')
+
+
+@app.route('/api/jobs/normalize-all', methods=['POST'])
+def async_normalize_all_files():
+    """API endpoint to start async normalizing of all files"""
+    logging.info("[API] Request to normalize all files (async)")
+    files = get_comic_files()
     
-    # Start job
-    try:
-        job_manager.start_job(job_id, process_item, files)
-    except RuntimeError as e:
-        import traceback
-        logging.error(f"[API] Failed to start job {job_id}: {e}")
-        logging.error(f"Traceback: {traceback.format_exc()}")
-        # Clear active job since we failed to start
-        clear_active_job()
-        # Return generic error message to user (log contains details)
-        return jsonify({'error': 'Failed to start processing job. Please try again.'}), 500
+    if not files:
+        logging.warning("[API] No files found to normalize")
+        return jsonify({'error': 'No files to normalize'}), 400
     
-    logging.info(f"[API] Created and started job {job_id} for {len(files)} files")
-    return jsonify({
-        'job_id': job_id,
-        'total_items': len(files)
-    })
+    logging.info(f"[API] Found {len(files)} files to normalize")
+    return start_file_operation_job('normalize', files, 'Normalizing All Files...')
 
 
 @app.route('/api/jobs/process-selected', methods=['POST'])
 def async_process_selected_files():
     """API endpoint to start async processing of selected files"""
-    from process_file import process_file
-    
-    data = request.json
-    file_list = data.get('files', [])
+    full_paths, requested = get_selected_existing_paths()
     
-    logging.info(f"[API] Request to process {len(file_list)} selected files (async)")
+    logging.info(f"[API] Request to process {requested} selected files (async)")
     
-    if not file_list:
+    if not requested:
         logging.warning("[API] No files specified in request")
         return jsonify({'error': 'No files specified'}), 400
     
-    # Build full paths
-    full_paths = []
-    for filepath in file_list:
-        full_path = os.path.join(WATCHED_DIR, filepath) if WATCHED_DIR else filepath
-        if os.path.exists(full_path):
-            full_paths.append(full_path)
-    
     if not full_paths:
-        logging.warning(f"[API] None of the {len(file_list)} specified files exist")
+        logging.warning(f"[API] None of the {requested} specified files exist")
         return jsonify({'error': 'No valid files to process'}), 400
     
-    logging.info(f"[API] Found {len(full_paths)} valid files out of {len(file_list)} requested")
+    logging.info(f"[API] Found {len(full_paths)} valid files out of {requested} requested")
+    return start_file_operation_job('process', full_paths, 'Processing Selected Files...')
+
+
+@app.route('/api/jobs/rename-selected', methods=['POST'])
+def async_rename_selected_files():
+    """API endpoint to start async renaming of selected files"""
+    full_paths, requested = get_selected_existing_paths()
     
-    # Create job
-    job_manager = get_job_manager(max_workers=get_max_workers())
-    job_id = job_manager.create_job(full_paths)
+    logging.info(f"[API] Request to rename {requested} selected files (async)")
     
-    # Set active job on server IMMEDIATELY when job is created
-    # This ensures the job is tracked even if the page refreshes before polling starts
-    set_active_job(job_id, 'Processing Selected Files...')
-    logging.info(f"[API] Set active job {job_id} on server")
+    if not requested:
+        logging.warning("[API] No files specified in request")
+        return jsonify({'error': 'No files specified'}), 400
     
-    # Define processing function
-    def process_item(filepath):
-        try:
-            mark_file_web_modified(filepath)
-            final_filepath = process_file(filepath, fixtitle=True, fixseries=True, fixfilename=True)
-            mark_file_processed_wrapper(final_filepath, original_filepath=filepath)
-            handle_file_rename_in_store(filepath, final_filepath)
-            logging.info(f"[BATCH] Processed file: {filepath} -> {final_filepath}")
-            return JobResult(
-                item=os.path.basename(filepath),
-                success=True,
-                details={'original': filepath, 'final': final_filepath}
-            )
-        except Exception as e:
-            logging.error(f"[BATCH] Error processing file {filepath}: {e}")
-            return JobResult(
-                item=os.path.basename(filepath),
-                success=False,
-                error=str(e)
-            )
+    if not full_paths:
+        logging.warning(f"[API] None of the {requested} specified files exist")
+        return jsonify({'error': 'No valid files to rename'}), 400
     
-    # Start job
-    try:
-        job_manager.start_job(job_id, process_item, full_paths)
-    except RuntimeError as e:
-        import traceback
-        logging.error(f"[API] Failed to start job {job_id}: {e}")
-        logging.error(f"Traceback: {traceback.format_exc()}")
-        # Clear active job since we failed to start
-        clear_active_job()
-        # Return generic error message to user (log contains details)
-        return jsonify({'error': 'Failed to start processing job. Please try again.'}), 500
+    logging.info(f"[API] Found {len(full_paths)} valid files out of {requested} requested")
+    return start_file_operation_job('rename', full_paths, 'Renaming Selected Files...')
+
+
+@app.route('/api/jobs/normalize-selected', methods=['POST'])
+def async_normalize_selected_files():
+    """API endpoint to start async normalizing of selected files"""
+    full_paths, requested = get_selected_existing_paths()
     
-    logging.info(f"[API] Created and started job {job_id} for {len(full_paths)} files")
-    return jsonify({
-        'job_id': job_id,
-        'total_items': len(full_paths)
-    })
+    logging.info(f"[API] Request to normalize {requested} selected files (async)")
+    
+    if not requested:
+        logging.warning("[API] No files specified in request")
+        return jsonify({'error': 'No files specified'}), 400
+    
+    if not full_paths:
+        logging.warning(f"[API] None of the {requested} specified files exist")
+        return jsonify({'error': 'No valid files to normalize'}), 400
+    
+    logging.info(f"[API] Found {len(full_paths)} valid files out of {requested} requested")
+    return start_file_operation_job('normalize', full_paths, 'Normalizing Selected Files...')
 
 
 @app.route('/api/jobs/<job_id>', methods=['GET'])
@@ -1595,7 +1660,7 @@ def get_job_status(job_id):
         logging.warning(f"[API] Job {job_id} not found")
         return jsonify({'error': 'Job not found'}), 404
     
-    return jsonify(status)
+    return json_response(status)
 
 
 @app.route('/api/jobs', methods=['GET'])
@@ -1603,7 +1668,7 @@ def list_jobs():
     """API endpoint to list all jobs"""
     job_manager = get_job_manager(max_workers=get_max_workers())
     jobs = job_manager.list_jobs()
-    return jsonify({'jobs': jobs})
+    return json_response({'jobs': jobs})
 
 
 @app.route('/api/jobs/<job_id>', methods=['DELETE'])
@@ -1654,74 +1719,23 @@ def cancel_job(job_id):
 @app.route('/api/jobs/process-unmarked', methods=['POST'])
 def async_process_unmarked_files():
     """API endpoint to start async processing of unmarked files"""
-    from process_file import process_file
-    
     logging.info("[API] Request to process unmarked files (async)")
     
     # Get all files and filter to unmarked only that exist
     files = get_comic_files()
     unmarked_files = filter_unmarked_existing_files(files)
     
-    if not unmarked_files:
-        logging.warning("[API] No unmarked files found to process")
-        return jsonify({'error': 'No unmarked files to process'}), 400
-    
-    logging.info(f"[API] Found {len(unmarked_files)} unmarked files to process")
-    
-    # Create job
-    job_manager = get_job_manager(max_workers=get_max_workers())
-    job_id = job_manager.create_job(unmarked_files)
-    
-    # Set active job on server IMMEDIATELY when job is created
-    # This ensures the job is tracked even if the page refreshes before polling starts
-    set_active_job(job_id, 'Processing Unmarked Files...')
-    logging.info(f"[API] Set active job {job_id} on server")
-    
-    # Define processing function
-    def process_item(filepath):
-        try:
-            mark_file_web_modified(filepath)
-            final_filepath = process_file(filepath, fixtitle=True, fixseries=True, fixfilename=True)
-            mark_file_processed_wrapper(final_filepath, original_filepath=filepath)
-            handle_file_rename_in_store(filepath, final_filepath)
-            logging.info(f"[BATCH] Processed unmarked file: {filepath} -> {final_filepath}")
-            return JobResult(
-                item=os.path.basename(filepath),
-                success=True,
-                details={'original': filepath, 'final': final_filepath}
-            )
-        except Exception as e:
-            logging.error(f"[BATCH] Error processing unmarked file {filepath}: {e}")
-            return JobResult(
-                item=os.path.basename(filepath),
-                success=False,
-                error=str(e)
-            )
-    
-    # Start job
-    try:
-        job_manager.start_job(job_id, process_item, unmarked_files)
-    except RuntimeError as e:
-        import traceback
-        logging.error(f"[API] Failed to start job {job_id}: {e}")
-        logging.error(f"Traceback: {traceback.format_exc()}")
-        # Clear active job since we failed to start
-        clear_active_job()
-        # Return generic error message to user (log contains details)
-        return jsonify({'error': 'Failed to start processing job. Please try again.'}), 500
+    if not unmarked_files:
+        logging.warning("[API] No unmarked files found to process")
+        return jsonify({'error': 'No unmarked files to process'}), 400
     
-    logging.info(f"[API] Created and started job {job_id} for {len(unmarked_files)} unmarked files")
-    return jsonify({
-        'job_id': job_id,
-        'total_items': len(unmarked_files)
-    })
+    logging.info(f"[API] Found {len(unmarked_files)} unmarked files to process")
+    return start_file_operation_job('process', unmarked_files, 'Processing Unmarked Files...')
 
 
 @app.route('/api/jobs/rename-unmarked', methods=['POST'])
 def async_rename_unmarked_files():
     """API endpoint to start async renaming of unmarked files"""
-    from process_file import process_file
-    
     logging.info("[API] Request to rename unmarked files (async)")
     
     # Get all files and filter to unmarked only that exist
@@ -1733,60 +1747,12 @@ def async_rename_unmarked_files():
         return jsonify({'error': 'No unmarked files to rename'}), 400
     
     logging.info(f"[API] Found {len(unmarked_files)} unmarked files to rename")
-    
-    # Create job
-    job_manager = get_job_manager(max_workers=get_max_workers())
-    job_id = job_manager.create_job(unmarked_files)
-    
-    # Set active job on server IMMEDIATELY when job is created
-    set_active_job(job_id, 'Renaming Unmarked Files...')
-    logging.info(f"[API] Set active job {job_id} on server")
-    
-    # Define processing function
-    def process_item(filepath):
-        try:
-            mark_file_web_modified(filepath)
-            final_filepath = process_file(filepath, fixtitle=False, fixseries=False, fixfilename=True)
-            mark_file_processed_wrapper(final_filepath, original_filepath=filepath)
-            handle_file_rename_in_store(filepath, final_filepath)
-            logging.info(f"[BATCH] Renamed unmarked file: {filepath} -> {final_filepath}")
-            return JobResult(
-                item=os.path.basename(filepath),
-                success=True,
-                details={'original': filepath, 'final': final_filepath}
-            )
-        except Exception as e:
-            logging.error(f"[BATCH] Error renaming unmarked file {filepath}: {e}")
-            return JobResult(
-                item=os.path.basename(filepath),
-                success=False,
-                error=str(e)
-            )
-    
-    # Start job
-    try:
-        job_manager.start_job(job_id, process_item, unmarked_files)
-    except RuntimeError as e:
-        import traceback
-        logging.error(f"[API] Failed to start job {job_id}: {e}")
-        logging.error(f"Traceback: {traceback.format_exc()}")
-        # Clear active job since we failed to start
-        clear_active_job()
-        # Return generic error message to user (log contains details)
-        return jsonify({'error': 'Failed to start processing job. Please try again.'}), 500
-    
-    logging.info(f"[API] Created and started job {job_id} for {len(unmarked_files)} unmarked files")
-    return jsonify({
-        'job_id': job_id,
-        'total_items': len(unmarked_files)
-    })
+    return start_file_operation_job('rename', unmarked_files, 'Renaming Unmarked Files...')
 
 
 @app.route('/api/jobs/normalize-unmarked', methods=['POST'])
 def async_normalize_unmarked_files():
     """API endpoint to start async normalizing of unmarked files"""
-    from process_file import process_file
-    
     logging.info("[API] Request to normalize unmarked files (async)")
     
     # Get all files and filter to unmarked only that exist
@@ -1798,52 +1764,7 @@ def async_normalize_unmarked_files():
         return jsonify({'error': 'No unmarked files to normalize'}), 400
     
     logging.info(f"[API] Found {len(unmarked_files)} unmarked files to normalize")
-    
-    # Create job
-    job_manager = get_job_manager(max_workers=get_max_workers())
-    job_id = job_manager.create_job(unmarked_files)
-    
-    # Set active job on server IMMEDIATELY when job is created
-    set_active_job(job_id, 'Normalizing Unmarked Files...')
-    logging.info(f"[API] Set active job {job_id} on server")
-    
-    # Define processing function
-    def process_item(filepath):
-        try:
-            mark_file_web_modified(filepath)
-            final_filepath = process_file(filepath, fixtitle=True, fixseries=True, fixfilename=False)
-            mark_file_processed_wrapper(final_filepath, original_filepath=filepath)
-            logging.info(f"[BATCH] Normalized unmarked file: {filepath}")
-            return JobResult(
-                item=os.path.basename(filepath),
-                success=True,
-                details={'original': filepath, 'final': final_filepath}
-            )
-        except Exception as e:
-            logging.error(f"[BATCH] Error normalizing unmarked file {filepath}: {e}")
-            return JobResult(
-                item=os.path.basename(filepath),
-                success=False,
-                error=str(e)
-            )
-    
-    # Start job
-    try:
-        job_manager.start_job(job_id, process_item, unmarked_files)
-    except RuntimeError as e:
-        import traceback
-        logging.error(f"[API] Failed to start job {job_id}: {e}")
-        logging.error(f"Traceback: {traceback.format_exc()}")
-        # Clear active job since we failed to start
-        clear_active_job()
-        # Return generic error message to user (log contains details)
-        return jsonify({'error': 'Failed to start processing job. Please try again.'}), 500
-    
-    logging.info(f"[API] Created and started job {job_id} for {len(unmarked_files)} unmarked files")
-    return jsonify({
-        'job_id': job_id,
-        'total_items': len(unmarked_files)
-    })
+    return start_file_operation_job('normalize', unmarked_files, 'Normalizing Unmarked Files...')
 
 
 @app.route('/api/settings/filename-format', methods=['GET'])
@@ -1896,29 +1817,49 @@ def set_watcher_enabled_api():
     else:
         return jsonify({'error': 'Failed to save watcher enabled setting'}), 500
 
+# Most recent watcher processing failures included in /api/watcher/status
+WATCHER_STATUS_FAILURES = 10
+
+# pgrep normally answers in milliseconds; the timeout keeps a stuck process table
+# read from pinning a request thread
+WATCHER_CHECK_TIMEOUT = 5
+
+def is_watcher_process_running():
+    """Check whether the watcher process is running
+    
+    Raises:
+        Exception: If pgrep cannot be run or does not finish within WATCHER_CHECK_TIMEOUT
+    """
+    # pgrep exits 0 only when a process matched, so its output (the PIDs) is not needed
+    result = subprocess.run(
+        ['pgrep', '-f', 'python.*watcher.py'],
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        timeout=WATCHER_CHECK_TIMEOUT
+    )
+    return result.returncode == 0
+
 @app.route('/api/watcher/status', methods=['GET'])
 def get_watcher_status_api():
     """API endpoint to get the watcher process status"""
-    import subprocess
-    
     is_running = False
     try:
-        # Check if watcher.py process is running
-        result = subprocess.run(
-            ['pgrep', '-f', 'python.*watcher.py'],
-            capture_output=True,
-            text=True
-        )
-        is_running = result.returncode == 0 and len(result.stdout.strip()) > 0
+        is_running = is_watcher_process_running()
     except Exception as e:
         logging.error(f"Error checking watcher status: {e}")
     
     # Get the enabled setting from config
     enabled_setting = get_watcher_enabled()
     
-    return jsonify({
+    from unified_store import get_processing_failures
+    failures = get_processing_failures(limit=WATCHER_STATUS_FAILURES)
+    return json_response({
         'running': is_running,
-        'enabled': enabled_setting
+        'enabled': enabled_setting,
+        'recent_failures': [
+            {'file': get_relative_path(f['filepath']), 'error': f['error'], 'timestamp': f['timestamp']}
+            for f in failures
+        ]
     })
 
 @app.route('/api/settings/log-max-bytes', methods=['GET'])
@@ -2084,6 +2025,40 @@ def get_version():
         'version': __version__
     })
 
+# Initial guess at the average log line length when tail-reading a log
+LOG_TAIL_BYTES_PER_LINE = 512
+
+def read_log_tail(log_file, lines):
+    """Read the last `lines` lines of a log file (every line if lines <= 0)
+    
+    Seeks back from the end by an estimated number of bytes and doubles the
+    window until enough lines were captured, so only about the requested lines
+    are read regardless of the file size.
+    
+    Returns:
+        List of raw lines (bytes, line endings kept)
+    """
+    with open(log_file, 'rb') as f:
+        size = f.seek(0, os.SEEK_END)
+        if lines <= 0:
+            f.seek(0)
+            return f.read().splitlines(keepends=True)
+        
+        window = lines * LOG_TAIL_BYTES_PER_LINE
+        while True:
+            start = max(0, size - window)
+            f.seek(start)
+            chunk_lines = f.read(size - start).splitlines(keepends=True)
+            # Unless the window reaches the start of the file, its first line is partial
+            if start == 0 or len(chunk_lines) > lines:
+                return chunk_lines[-lines:]
+            window *= 2
+
+def count_log_lines(log_file):
+    """Count the lines in a log file, reading it in binary blocks"""
+    with open(log_file, 'rb') as f:
+        return sum(1 for _ in f)
+
 @app.route('/api/logs', methods=['GET'])
 def get_logs():
     """API endpoint to get the log file contents"""
@@ -2102,25 +2077,19 @@ def get_logs():
     try:
         # Get the number of lines to return (default: last 500 lines)
         lines = request.args.get('lines', default=500, type=int)
+        # Counting every line means reading the whole file, so only do it on request
+        count_total = request.args.get('count_total', default='0') in ('1', 'true')
         
-        with open(log_file, 'r', encoding='utf-8', errors='replace') as f:
-            # Read all lines
-            all_lines = f.readlines()
-            
-            # Return the last N lines (or all if lines=0)
-            if lines > 0:
-                log_content = ''.join(all_lines[-lines:])
-                returned_lines = min(lines, len(all_lines))
-            else:
-                log_content = ''.join(all_lines)
-                returned_lines = len(all_lines)
-        
-        return jsonify({
-            'logs': log_content,
-            'total_lines': len(all_lines),
-            'returned_lines': returned_lines,
+        tail = read_log_tail(log_file, lines)
+        response = {
+            'logs': b''.join(tail).decode('utf-8', errors='replace'),
+            'returned_lines': len(tail),
             'log_type': log_type
-        })
+        }
+        if count_total or lines <= 0:
+            response['total_lines'] = len(tail) if lines <= 0 else count_log_lines(log_file)
+        
+        return json_response(response)
     except Exception as e:
         logging.error(f"Error reading log file: {e}")
         return jsonify({'error': str(e)}), 500
@@ -2128,310 +2097,132 @@ def get_logs():
 @app.route('/api/scan-unmarked', methods=['GET'])
 def scan_unmarked_files():
     """API endpoint to scan for unmarked files"""
-    files = get_comic_files()
-    unmarked_files = []
-    marked_files = []
-    
-    for filepath in files:
-        if is_file_processed(filepath):
-            marked_files.append(filepath)
-        else:
-            unmarked_files.append(filepath)
-    
-    return jsonify({
-        'unmarked_count': len(unmarked_files),
-        'marked_count': len(marked_files),
-        'total_count': len(files)
+    # Counted in the database, and only recounted after the store changes
+    flush_file_changes()
+    
+    # Polled by the dashboard: let clients reuse the counts for a few seconds,
+    # then revalidate against the store version for a 304
+    cache_control = 'max-age=5, must-revalidate'
+    etag = get_store_etag()
+    if etag and etag in request.if_none_match:
+        return app.response_class(status=304, headers={'ETag': f'"{etag}"', 'Cache-Control': cache_control})
+    
+    total_count, unmarked_count = get_store_counts()
+    
+    response = json_response({
+        'unmarked_count': unmarked_count,
+        'marked_count': total_count - unmarked_count,
+        'total_count': total_count
     })
+    if etag:
+        response.set_etag(etag)
+        response.headers['Cache-Control'] = cache_control
+    return response
 
 @app.route('/api/process-unmarked', methods=['POST'])
 def process_unmarked_files():
     """API endpoint to process only unmarked files with streaming progress"""
-    from process_file import process_file
-    
-    stream = request.args.get('stream', 'false').lower() == 'true'
     files = get_comic_files()
     
     # Filter to only unmarked files that still exist
     unmarked_files = filter_unmarked_existing_files(files)
-    
-    if not stream:
-        # Non-streaming mode (backward compatible)
-        results = []
-        
-        for filepath in unmarked_files:
-            try:
-                # Mark as web modified to prevent watcher from processing
-                mark_file_web_modified(filepath)
-                
-                # Process the file and get the final filepath (may be renamed)
-                final_filepath = process_file(filepath, fixtitle=True, fixseries=True, fixfilename=True)
-                
-                # Mark as processed using the final filepath, cleanup old filename if renamed
-                mark_file_processed_wrapper(final_filepath, original_filepath=filepath)
-                
-                handle_file_rename_in_store(filepath, final_filepath)
-                
-                results.append({
-                    'file': os.path.basename(final_filepath),
-                    'success': True
-                })
-                logging.info(f"Processed unmarked file via web interface: {filepath} -> {final_filepath}")
-            except Exception as e:
-                results.append({
-                    'file': os.path.basename(filepath),
-                    'success': False,
-                    'error': str(e)
-                })
-                logging.error(f"Error processing unmarked file {filepath}: {e}")
-        
-        return jsonify({'results': results})
-    
-    # Streaming mode - send progress updates
-    def generate():
-        import json
-        import traceback
-        results = []
-        try:
-            for i, filepath in enumerate(unmarked_files):
-                result = {'file': os.path.basename(filepath)}
-                
-                try:
-                    mark_file_web_modified(filepath)
-                    final_filepath = process_file(filepath, fixtitle=True, fixseries=True, fixfilename=True)
-                    mark_file_processed_wrapper(final_filepath, original_filepath=filepath)
-                    handle_file_rename_in_store(filepath, final_filepath)
-                    result['success'] = True
-                    logging.info(f"Processed unmarked file via web interface: {filepath} -> {final_filepath}")
-                except Exception as e:
-                    result['success'] = False
-                    result['error'] = str(e)
-                    logging.error(f"Error processing unmarked file {filepath}: {e}")
-                    logging.error(f"Traceback: {traceback.format_exc()}")
-                
-                results.append(result)
-                
-                # Send progress update
-                progress = {
-                    'current': i + 1,
-                    'total': len(unmarked_files),
-                    'file': result['file'],
-                    'success': result['success'],
-                    'error': result.get('error')
-                }
-                yield f"data: {json.dumps(progress)}\n\n"
-            
-            # Send final results
-            yield f"data: {json.dumps({'done': True, 'results': results})}\n\n"
-        except Exception as e:
-            # Critical error in streaming - log and send error completion
-            logging.error(f"CRITICAL: Streaming error in process_unmarked_files: {e}")
-            logging.error(f"Traceback: {traceback.format_exc()}")
-            error_response = {'done': True, 'error': 'An unexpected error occurred. Please check the logs for details.', 'results': results}
-            yield f"data: {json.dumps(error_response)}\n\n"
-    
-    return app.response_class(generate(), mimetype='text/event-stream')
+    return run_file_operation_request('process', unmarked_files)
 
 @app.route('/api/rename-unmarked', methods=['POST'])
 def rename_unmarked_files():
     """API endpoint to rename only unmarked files with streaming progress"""
-    from process_file import process_file
-    
-    stream = request.args.get('stream', 'false').lower() == 'true'
     files = get_comic_files()
     
     # Filter to only unmarked files that still exist
     unmarked_files = filter_unmarked_existing_files(files)
-    
-    if not stream:
-        # Non-streaming mode (backward compatible)
-        results = []
-        
-        for filepath in unmarked_files:
-            try:
-                # Mark as web modified to prevent watcher from processing
-                mark_file_web_modified(filepath)
-                
-                # Only rename the file
-                final_filepath = process_file(filepath, fixtitle=False, fixseries=False, fixfilename=True)
-                
-                # Mark as processed using the final filepath, cleanup old filename if renamed
-                mark_file_processed_wrapper(final_filepath, original_filepath=filepath)
-                
-                handle_file_rename_in_store(filepath, final_filepath)
-                
-                results.append({
-                    'file': os.path.basename(final_filepath),
-                    'success': True
-                })
-                logging.info(f"Renamed unmarked file via web interface: {filepath} -> {final_filepath}")
-            except Exception as e:
-                results.append({
-                    'file': os.path.basename(filepath),
-                    'success': False,
-                    'error': str(e)
-                })
-                logging.error(f"Error renaming unmarked file {filepath}: {e}")
-        
-        return jsonify({'results': results})
-    
-    # Streaming mode - send progress updates
-    def generate():
-        import json
-        import traceback
-        results = []
-        try:
-            for i, filepath in enumerate(unmarked_files):
-                result = {'file': os.path.basename(filepath)}
-                
-                try:
-                    mark_file_web_modified(filepath)
-                    final_filepath = process_file(filepath, fixtitle=False, fixseries=False, fixfilename=True)
-                    mark_file_processed_wrapper(final_filepath, original_filepath=filepath)
-                    handle_file_rename_in_store(filepath, final_filepath)
-                    result['success'] = True
-                    logging.info(f"Renamed unmarked file via web interface: {filepath} -> {final_filepath}")
-                except Exception as e:
-                    result['success'] = False
-                    result['error'] = str(e)
-                    logging.error(f"Error renaming unmarked file {filepath}: {e}")
-                    logging.error(f"Traceback: {traceback.format_exc()}")
-                
-                results.append(result)
-                
-                # Send progress update
-                progress = {
-                    'current': i + 1,
-                    'total': len(unmarked_files),
-                    'file': result['file'],
-                    'success': result['success'],
-                    'error': result.get('error')
-                }
-                yield f"data: {json.dumps(progress)}\n\n"
-            
-            # Send final results
-            yield f"data: {json.dumps({'done': True, 'results': results})}\n\n"
-        except Exception as e:
-            # Critical error in streaming - log and send error completion
-            logging.error(f"CRITICAL: Streaming error in rename_unmarked_files: {e}")
-            logging.error(f"Traceback: {traceback.format_exc()}")
-            error_response = {'done': True, 'error': 'An unexpected error occurred. Please check the logs for details.', 'results': results}
-            yield f"data: {json.dumps(error_response)}\n\n"
-    
-    return app.response_class(generate(), mimetype='text/event-stream')
+    return run_file_operation_request('rename', unmarked_files)
 
 @app.route('/api/normalize-unmarked', methods=['POST'])
 def normalize_unmarked_files():
     """API endpoint to normalize metadata for only unmarked files with streaming progress"""
-    from process_file import process_file
-    
-    stream = request.args.get('stream', 'false').lower() == 'true'
     files = get_comic_files()
     
     # Filter to only unmarked files that still exist
     unmarked_files = filter_unmarked_existing_files(files)
-    
-    if not stream:
-        # Non-streaming mode (backward compatible)
-        results = []
-        
-        for filepath in unmarked_files:
-            try:
-                # Mark as web modified to prevent watcher from processing
-                mark_file_web_modified(filepath)
-                
-                # Only normalize metadata
-                final_filepath = process_file(filepath, fixtitle=True, fixseries=True, fixfilename=False)
-                
-                # Mark as processed using the final filepath, cleanup old filename if renamed
-                mark_file_processed_wrapper(final_filepath, original_filepath=filepath)
-                
-                results.append({
-                    'file': os.path.basename(final_filepath),
-                    'success': True
-                })
-                logging.info(f"Normalized metadata for unmarked file via web interface: {filepath}")
-            except Exception as e:
-                results.append({
-                    'file': os.path.basename(filepath),
-                    'success': False,
-                    'error': str(e)
-                })
-                logging.error(f"Error normalizing metadata for unmarked file {filepath}: {e}")
-        
-        return jsonify({'results': results})
-    
-    # Streaming mode - send progress updates
-    def generate():
-        import json
-        import traceback
-        results = []
-        try:
-            for i, filepath in enumerate(unmarked_files):
-                result = {'file': os.path.basename(filepath)}
-                
-                try:
-                    mark_file_web_modified(filepath)
-                    final_filepath = process_file(filepath, fixtitle=True, fixseries=True, fixfilename=False)
-                    mark_file_processed_wrapper(final_filepath, original_filepath=filepath)
-                    result['success'] = True
-                    logging.info(f"Normalized metadata for unmarked file via web interface: {filepath}")
-                except Exception as e:
-                    result['success'] = False
-                    result['error'] = str(e)
-                    logging.error(f"Error normalizing metadata for unmarked file {filepath}: {e}")
-                    logging.error(f"Traceback: {traceback.format_exc()}")
-                
-                results.append(result)
-                
-                # Send progress update
-                progress = {
-                    'current': i + 1,
-                    'total': len(unmarked_files),
-                    'file': result['file'],
-                    'success': result['success'],
-                    'error': result.get('error')
-                }
-                yield f"data: {json.dumps(progress)}\n\n"
-            
-            # Send final results
-            yield f"data: {json.dumps({'done': True, 'results': results})}\n\n"
-        except Exception as e:
-            # Critical error in streaming - log and send error completion
-            logging.error(f"CRITICAL: Streaming error in normalize_unmarked_files: {e}")
-            logging.error(f"Traceback: {traceback.format_exc()}")
-            error_response = {'done': True, 'error': 'An unexpected error occurred. Please check the logs for details.', 'results': results}
-            yield f"data: {json.dumps(error_response)}\n\n"
-    
-    return app.response_class(generate(), mimetype='text/event-stream')
+    return run_file_operation_request('normalize', unmarked_files)
 
-@app.route('/api/delete-file/<path:filepath>', methods=['DELETE'])
-def delete_single_file(filepath):
-    """API endpoint to delete a single file"""
-    full_path = os.path.join(WATCHED_DIR, filepath) if WATCHED_DIR else filepath
+def delete_file(full_path):
+    """Delete a file and clear its markers and store entry
     
-    if not os.path.exists(full_path):
-        return jsonify({'error': 'File not found'}), 404
+    Safe to call from map_concurrently() workers; inside batched_markers() the
+    marker clears join the caller's batch.
     
+    Returns:
+        Error message, or None on success
+    """
     try:
         # Mark as web modified before deletion to prevent watcher from processing
-        mark_file_web_modified(full_path)
+        mark_file_web_modified_wrapper(full_path)
         
         # Delete the file
         os.remove(full_path)
         
         # Clear processed and duplicate markers (web_modified marker will be consumed by watcher)
-        unmark_file_processed(full_path)
-        unmark_file_duplicate(full_path)
+        clear_file_markers(full_path)
         
         # Update file store
         record_file_change('remove', old_path=full_path)
         
         logging.info(f"Deleted file via web interface: {full_path}")
-        return jsonify({'success': True})
+        return None
     except Exception as e:
         logging.error(f"Error deleting file {full_path}: {e}")
-        return jsonify({'error': str(e)}), 500
+        return str(e)
+
+@app.route('/api/delete-file/<path:filepath>', methods=['DELETE'])
+def delete_single_file(filepath):
+    """API endpoint to delete a single file"""
+    full_path = resolve_path(filepath)
+    
+    if not os.path.exists(full_path):
+        return jsonify({'error': 'File not found'}), 404
+    
+    error = delete_file(full_path)
+    if error is not None:
+        return jsonify({'error': error}), 500
+    return jsonify({'success': True})
+
+@app.route('/api/delete-selected', methods=['POST'])
+def delete_selected_files():
+    """API endpoint to delete selected files in one request
+    
+    Files are removed on the worker thread pool, their marker clears are applied
+    as one batch and the store removals go through the shared file change queue.
+    """
+    _, file_list = get_request_file_list()
+    
+    if not file_list:
+        return jsonify({'error': 'No files specified'}), 400
+    
+    full_paths = list(map(resolve_path, file_list))
+    existing_paths = find_existing_files(full_paths)
+    batch = MarkerBatch()
+    
+    def run(full_path):
+        if full_path not in existing_paths:
+            return 'File not found'
+        with batched_markers(batch):
+            return delete_file(full_path)
+    
+    try:
+        errors = list(map_concurrently(run, full_paths))
+    finally:
+        batch.flush()
+    
+    results = []
+    for filepath, error in zip(file_list, errors):
+        result = {'file': filepath, 'success': error is None}
+        if error is not None:
+            result['error'] = error
+        results.append(result)
+    
+    logging.info(f"Deleted {sum(r['success'] for r in results)} of {len(results)} selected file(s) via web interface")
+    return json_response({'results': results})
 
 @app.route('/api/preferences', methods=['GET'])
 def get_preferences_endpoint():
@@ -2535,7 +2326,7 @@ def get_processing_history_endpoint():
         history = get_processing_history(limit=limit, offset=offset)
         total_count = get_processing_history_count()
         
-        return jsonify({
+        return json_response({
             'history': history,
             'total': total_count,
             'limit': limit,
@@ -2634,14 +2425,7 @@ def health_check():
     
     # Check watcher process status
     try:
-        import subprocess
-        result = subprocess.run(
-            ['pgrep', '-f', 'python.*watcher.py'],
-            capture_output=True,
-            text=True,
-            timeout=5
-        )
-        is_running = result.returncode == 0 and len(result.stdout.strip()) > 0
+        is_running = is_watcher_process_running()
         health_status['checks']['watcher'] = 'running' if is_running else 'not_running'
         # Note: watcher not running is not necessarily unhealthy if it's disabled
     except Exception as e:
@@ -2650,31 +2434,57 @@ def health_check():
     status_code = 200 if health_status['status'] == 'healthy' else 503
     return jsonify(health_status), status_code
 
+# The file store is re-synced once the last sync (by any worker or the watcher) is
+# older than STORE_SYNC_MAX_AGE seconds, checked every STORE_SYNC_CHECK_INTERVAL
+STORE_SYNC_MAX_AGE = 300
+STORE_SYNC_CHECK_INTERVAL = 30.0
+
+def sync_file_store():
+    """Sync the file store with WATCHED_DIR unless a recent sync already did"""
+    result = file_store.sync_with_filesystem_if_stale(WATCHED_DIR, max_age=STORE_SYNC_MAX_AGE)
+    if result is not None:
+        added, removed, updated = result
+        logging.info(f"File store sync complete: +{added} new files, -{removed} deleted files, ~{updated} updated files")
+
+def store_sync_loop():
+    """Keep the file store in sync in the background
+    
+    Every worker runs this loop, but the sync lock lets only one process walk
+    the library at a time; the others skip their turn.
+    """
+    while True:
+        try:
+            sync_file_store()
+        except Exception as e:
+            logging.error(f"Error syncing file store: {e}")
+        time.sleep(STORE_SYNC_CHECK_INTERVAL)
+
 def init_app():
     """Initialize the application on startup"""
     if not WATCHED_DIR:
         logging.error("WATCHED_DIR environment variable is not set. Exiting.")
         sys.exit(1)
     
-    # Sync file store with filesystem if not recently synced
-    last_sync = file_store.get_last_sync_timestamp()
-    current_time = time.time()
-    # Sync if never synced or last sync was more than 5 minutes ago
-    if last_sync is None or (current_time - last_sync) > 300:
-        logging.info("Syncing file store with filesystem...")
-        added, removed, updated = file_store.sync_with_filesystem(WATCHED_DIR)
-        logging.info(f"File store sync complete: +{added} new files, -{removed} deleted files, ~{updated} updated files")
-    else:
-        logging.info(f"File store was recently synced ({int(current_time - last_sync)}s ago), skipping sync")
+    # Only wait for the sync when the store has never been populated. Otherwise
+    # serve the stored file list right away and let the background thread catch
+    # up, so workers start without walking the whole library.
+    if file_store.get_last_sync_timestamp() is None:
+        sync_file_store()
+    store_sync_thread = threading.Thread(target=store_sync_loop, name="file-store-sync", daemon=True)
+    store_sync_thread.start()
+    
+    start_file_change_flusher()
     
     logging.info("Application initialization complete")
 
 if __name__ == '__main__':
     # This block is only for development/testing purposes
-    # In production, Gunicorn will import the app directly
+    # In production, Gunicorn (gthread workers, see start.sh) imports the app directly
     init_app()
     port = int(os.environ.get('WEB_PORT', 5000))
-    app.run(host='0.0.0.0', port=port, debug=False)
+    # Threaded like the Gunicorn workers, so status polls and event streams are
+    # served while a bulk request is running
+    app.run(host='0.0.0.0', port=port, debug=False, threaded=True)
 else:
     # When imported by Gunicorn, initialize the app
     init_app()
@@ -22,6 +22,11 @@ WEB_PORT=${WEB_PORT:-5000}
 # Job state is now stored in SQLite, supporting multiple workers
 GUNICORN_WORKERS=${GUNICORN_WORKERS:-2}
 
+# Get number of request threads per worker from environment variable (default: 8)
+# Requests are I/O-bound (archive rewrites, renames, SQLite, SSE streams), so each
+# worker serves them on a thread pool (gthread worker) instead of one at a time
+GUNICORN_THREADS=${GUNICORN_THREADS:-8}
+
 # Start the web app with Gunicorn (production WSGI server)
 # Job state stored in SQLite database for cross-process sharing
 # Concurrency is provided by both multiple workers and ThreadPoolExecutor (default: 4 threads per worker, configurable via MAX_WORKERS)
@@ -29,7 +34,7 @@ GUNICORN_WORKERS=${GUNICORN_WORKERS:-2}
 # Reverse proxy support: --forwarded-allow-ips=* trusts X-Forwarded-* headers from all proxies
 
 # Build gunicorn command with optional SSL support
-GUNICORN_CMD="gunicorn --workers ${GUNICORN_WORKERS} --bind 0.0.0.0:${WEB_PORT} --timeout 600 --forwarded-allow-ips=*"
+GUNICORN_CMD="gunicorn --workers ${GUNICORN_WORKERS} --threads ${GUNICORN_THREADS} --bind 0.0.0.0:${WEB_PORT} --timeout 600 --forwarded-allow-ips=*"
 
 # Add SSL/TLS support if certificates are provided
 if [ -n "$SSL_CERTFILE" ] && [ -n "$SSL_KEYFILE" ]; then
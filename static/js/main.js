@@ -155,7 +155,16 @@
                 
                 // Allow a brief moment for final updates, then finalize
                 setTimeout(async () => {
-                    if (status === 'completed') {
+                    if (status === 'completed' && errorCount > 0) {
+                        // Keep the modal open so failures are not mistaken for success
+                        document.getElementById('progressTitle').textContent = `Completed with errors: ${errorCount} of ${total} items failed (${successCount} succeeded)`;
+                        completeProgress(true);
+                        showMessage(`${errorCount} of ${total} files failed to process`, 'error');
+                        await clearActiveJobOnServer();
+                        hasActiveJob = false;
+                        currentJobTitle = null;
+                        loadFiles(currentPage, true);
+                    } else if (status === 'completed') {
                         // Update modal title and call completeProgress to show close button
                         document.getElementById('progressTitle').textContent = `Completed! All ${total} items processed (${successCount} succeeded, ${errorCount} failed)`;
                         completeProgress();
@@ -779,7 +788,8 @@
         async function scanUnmarkedFiles() {
             try {
                 showMessage('Scanning for unmarked files...', 'info');
-                const response = await fetch(apiUrl('/api/scan-unmarked'));
+                // Always revalidate: a user-initiated scan must not reuse counts from before a run
+                const response = await fetch(apiUrl('/api/scan-unmarked'), { cache: 'no-cache' });
                 if (!response.ok) {
                     throw new Error(`HTTP error! status: ${response.status}`);
                 }
@@ -1395,58 +1405,13 @@
             }
         }
         
-        async function processAllFiles() {
-            if (!confirm('This will process all files in the watched directory. Continue?')) {
-                return;
-            }
-            
-            showProgressModal('Processing All Files...');
-            
-            let successCount = 0;
-            let errorCount = 0;
-            let totalFiles = 0;
-            
-            try {
-                const response = await fetch(apiUrl('/api/process-all?stream=true'), {
-                    method: 'POST'
-                });
-                
-                const reader = response.body.getReader();
-                const decoder = new TextDecoder();
-                
-                while (true) {
-                    const { done, value } = await reader.read();
-                    if (done) break;
-                    
-                    const chunk = decoder.decode(value);
-                    const lines = chunk.split('\n');
-                    
-                    for (const line of lines) {
-                        if (line.startsWith('data: ')) {
-                            const data = JSON.parse(line.substring(6));
-                            
-                            if (data.done) {
-                                totalFiles = data.results.length;
-                                completeProgress();
-                                showMessage(`Processed ${successCount} of ${totalFiles} files successfully!`, 'success');
-                                // Refresh file list
-                                await loadFiles(1, true);
-                            } else {
-                                if (data.success) {
-                                    successCount++;
-                                } else {
-                                    errorCount++;
-                                }
-                                updateProgress(data.current, data.total, successCount, errorCount);
-                                addProgressDetail(data.file, data.success, data.error);
-                            }
-                        }
-                    }
-                }
-            } catch (error) {
-                showMessage('Failed to process files: ' + error.message, 'error');
-                closeProgressModal();
+        async function jobStartError(response, fallbackMessage) {
+            // A 409 means another bulk job is still running; show the server's reason
+            if (response.status === 409) {
+                const data = await response.json();
+                return new Error(data.error);
             }
+            return new Error(fallbackMessage);
         }
         
         async function processAllFilesAsync() {
@@ -1465,7 +1430,7 @@
                 
                 if (!response.ok) {
                     console.error(`[BATCH] Failed to start processing (HTTP ${response.status})`);
-                    throw new Error('Failed to start processing job');
+                    throw await jobStartError(response, 'Failed to start processing job');
                 }
                 
                 const data = await response.json();
@@ -1514,7 +1479,7 @@
                 
                 if (!response.ok) {
                     console.error(`[BATCH] Failed to start processing (HTTP ${response.status})`);
-                    throw new Error('Failed to start processing job');
+                    throw await jobStartError(response, 'Failed to start processing job');
                 }
                 
                 const data = await response.json();
@@ -1751,7 +1716,7 @@
                     }
                     
                     const total = status.total_items || 0;
-                    showMessage(`Batch processing completed: ${successCount} of ${total} files processed successfully${errorCount > 0 ? `, ${errorCount} failed` : ''}`, successCount > 0 ? 'success' : 'warning');
+                    showMessage(`Batch processing completed: ${successCount} of ${total} files processed successfully${errorCount > 0 ? `, ${errorCount} failed` : ''}`, errorCount === 0 ? 'success' : (successCount > 0 ? 'warning' : 'error'));
                     
                     // Clear from server
                     await clearActiveJobOnServer();
@@ -1778,112 +1743,52 @@
             }
         }
         
-        async function renameAllFiles() {
-            if (!confirm('This will rename all files in the watched directory based on metadata. Continue?')) {
-                return;
-            }
-            
-            showProgressModal('Renaming All Files...');
-            
-            let successCount = 0;
-            let errorCount = 0;
-            let totalFiles = 0;
+        async function startFileJob(endpoint, title, verb, files) {
+            // Start a bulk file job on the server and follow its progress
+            showProgressModal(`Starting async ${verb}...`);
             
             try {
-                const response = await fetch(apiUrl('/api/rename-all?stream=true'), {
-                    method: 'POST'
-                });
-                
-                const reader = response.body.getReader();
-                const decoder = new TextDecoder();
+                console.log(`[BATCH] Starting ${endpoint} request...`);
+                const options = { method: 'POST' };
+                if (files) {
+                    options.headers = { 'Content-Type': 'application/json' };
+                    options.body = JSON.stringify({ files: files });
+                }
+                const response = await fetch(apiUrl(endpoint), options);
                 
-                while (true) {
-                    const { done, value } = await reader.read();
-                    if (done) break;
-                    
-                    const chunk = decoder.decode(value);
-                    const lines = chunk.split('\n');
-                    
-                    for (const line of lines) {
-                        if (line.startsWith('data: ')) {
-                            const data = JSON.parse(line.substring(6));
-                            
-                            if (data.done) {
-                                totalFiles = data.results.length;
-                                completeProgress();
-                                showMessage(`Renamed ${successCount} of ${totalFiles} files successfully!`, 'success');
-                                // Refresh file list
-                                await loadFiles(1, true);
-                            } else {
-                                if (data.success) {
-                                    successCount++;
-                                } else {
-                                    errorCount++;
-                                }
-                                updateProgress(data.current, data.total, successCount, errorCount);
-                                addProgressDetail(data.file, data.success, data.error);
-                            }
-                        }
-                    }
+                if (!response.ok) {
+                    console.error(`[BATCH] Failed to start ${endpoint} (HTTP ${response.status})`);
+                    throw await jobStartError(response, `Failed to start ${verb} job`);
                 }
+                
+                const data = await response.json();
+                console.log(`[BATCH] Created job ${data.job_id} for ${data.total_items} files`);
+                showMessage(`Started ${verb} ${data.total_items} files in background`, 'info');
+                
+                // Poll for status
+                await trackJobStatus(data.job_id, title);
+                
             } catch (error) {
-                showMessage('Failed to rename files: ' + error.message, 'error');
+                console.error(`[BATCH] Error starting ${endpoint}:`, error);
+                showMessage(`Failed to start ${verb}: ` + error.message, 'error');
                 closeProgressModal();
             }
         }
         
+        async function renameAllFiles() {
+            if (!confirm('This will rename all files in the watched directory based on metadata. Continue?')) {
+                return;
+            }
+            
+            await startFileJob('/api/jobs/rename-all', 'Renaming All Files...', 'renaming');
+        }
+        
         async function normalizeAllFiles() {
             if (!confirm('This will normalize metadata for all files in the watched directory. Continue?')) {
                 return;
             }
             
-            showProgressModal('Normalizing Metadata...');
-            
-            let successCount = 0;
-            let errorCount = 0;
-            let totalFiles = 0;
-            
-            try {
-                const response = await fetch(apiUrl('/api/normalize-all?stream=true'), {
-                    method: 'POST'
-                });
-                
-                const reader = response.body.getReader();
-                const decoder = new TextDecoder();
-                
-                while (true) {
-                    const { done, value } = await reader.read();
-                    if (done) break;
-                    
-                    const chunk = decoder.decode(value);
-                    const lines = chunk.split('\n');
-                    
-                    for (const line of lines) {
-                        if (line.startsWith('data: ')) {
-                            const data = JSON.parse(line.substring(6));
-                            
-                            if (data.done) {
-                                totalFiles = data.results.length;
-                                completeProgress();
-                                showMessage(`Normalized metadata for ${successCount} of ${totalFiles} files successfully!`, 'success');
-                                // Refresh file list
-                                await loadFiles(1, true);
-                            } else {
-                                if (data.success) {
-                                    successCount++;
-                                } else {
-                                    errorCount++;
-                                }
-                                updateProgress(data.current, data.total, successCount, errorCount);
-                                addProgressDetail(data.file, data.success, data.error);
-                            }
-                        }
-                    }
-                }
-            } catch (error) {
-                showMessage('Failed to normalize metadata: ' + error.message, 'error');
-                closeProgressModal();
-            }
+            await startFileJob('/api/jobs/normalize-all', 'Normalizing All Files...', 'normalizing');
         }
         
         async function processUnmarkedFiles() {
@@ -1902,7 +1807,7 @@
                 
                 if (!response.ok) {
                     console.error(`[BATCH] Failed to start processing unmarked files (HTTP ${response.status})`);
-                    throw new Error('Failed to start processing job');
+                    throw await jobStartError(response, 'Failed to start processing job');
                 }
                 
                 const data = await response.json();
@@ -1938,7 +1843,7 @@
                 
                 if (!response.ok) {
                     console.error(`[BATCH] Failed to start renaming unmarked files (HTTP ${response.status})`);
-                    throw new Error('Failed to start renaming job');
+                    throw await jobStartError(response, 'Failed to start renaming job');
                 }
                 
                 const data = await response.json();
@@ -1974,7 +1879,7 @@
                 
                 if (!response.ok) {
                     console.error(`[BATCH] Failed to start normalizing unmarked files (HTTP ${response.status})`);
-                    throw new Error('Failed to start normalizing job');
+                    throw await jobStartError(response, 'Failed to start normalizing job');
                 }
                 
                 const data = await response.json();
@@ -1994,70 +1899,6 @@
             }
         }
         
-        async function processSelectedFiles() {
-            if (selectedFiles.size === 0) {
-                showMessage('No files selected', 'error');
-                return;
-            }
-            
-            if (!confirm(`This will process ${selectedFiles.size} selected file${selectedFiles.size > 1 ? 's' : ''}. Continue?`)) {
-                return;
-            }
-            
-            showProgressModal('Processing Selected Files...');
-            
-            const files = Array.from(selectedFiles);
-            let successCount = 0;
-            let errorCount = 0;
-            
-            try {
-                const response = await fetch(apiUrl('/api/process-selected?stream=true'), {
-                    method: 'POST',
-                    headers: {
-                        'Content-Type': 'application/json'
-                    },
-                    body: JSON.stringify({
-                        files: files
-                    })
-                });
-                
-                const reader = response.body.getReader();
-                const decoder = new TextDecoder();
-                
-                while (true) {
-                    const { done, value } = await reader.read();
-                    if (done) break;
-                    
-                    const chunk = decoder.decode(value);
-                    const lines = chunk.split('\n');
-                    
-                    for (const line of lines) {
-                        if (line.startsWith('data: ')) {
-                            const data = JSON.parse(line.substring(6));
-                            
-                            if (data.done) {
-                                completeProgress();
-                                showMessage(`Processed ${successCount} of ${files.length} files successfully!`, 'success');
-                                // Refresh file list
-                                await loadFiles(1, true);
-                            } else {
-                                if (data.success) {
-                                    successCount++;
-                                } else {
-                                    errorCount++;
-                                }
-                                updateProgress(data.current, data.total, successCount, errorCount);
-                                addProgressDetail(data.file, data.success, data.error);
-                            }
-                        }
-                    }
-                }
-            } catch (error) {
-                showMessage('Failed to process files: ' + error.message, 'error');
-                closeProgressModal();
-            }
-        }
-        
         async function renameSelectedFiles() {
             if (selectedFiles.size === 0) {
                 showMessage('No files selected', 'error');
@@ -2068,58 +1909,7 @@
                 return;
             }
             
-            showProgressModal('Renaming Selected Files...');
-            
-            const files = Array.from(selectedFiles);
-            let successCount = 0;
-            let errorCount = 0;
-            
-            try {
-                const response = await fetch(apiUrl('/api/rename-selected?stream=true'), {
-                    method: 'POST',
-                    headers: {
-                        'Content-Type': 'application/json'
-                    },
-                    body: JSON.stringify({
-                        files: files
-                    })
-                });
-                
-                const reader = response.body.getReader();
-                const decoder = new TextDecoder();
-                
-                while (true) {
-                    const { done, value } = await reader.read();
-                    if (done) break;
-                    
-                    const chunk = decoder.decode(value);
-                    const lines = chunk.split('\n');
-                    
-                    for (const line of lines) {
-                        if (line.startsWith('data: ')) {
-                            const data = JSON.parse(line.substring(6));
-                            
-                            if (data.done) {
-                                completeProgress();
-                                showMessage(`Renamed ${successCount} of ${files.length} files successfully!`, 'success');
-                                // Refresh file list
-                                await loadFiles(1, true);
-                            } else {
-                                if (data.success) {
-                                    successCount++;
-                                } else {
-                                    errorCount++;
-                                }
-                                updateProgress(data.current, data.total, successCount, errorCount);
-                                addProgressDetail(data.file, data.success, data.error);
-                            }
-                        }
-                    }
-                }
-            } catch (error) {
-                showMessage('Failed to rename files: ' + error.message, 'error');
-                closeProgressModal();
-            }
+            await startFileJob('/api/jobs/rename-selected', 'Renaming Selected Files...', 'renaming', Array.from(selectedFiles));
         }
         
         async function normalizeSelectedFiles() {
@@ -2132,58 +1922,7 @@
                 return;
             }
             
-            showProgressModal('Normalizing Metadata for Selected Files...');
-            
-            const files = Array.from(selectedFiles);
-            let successCount = 0;
-            let errorCount = 0;
-            
-            try {
-                const response = await fetch(apiUrl('/api/normalize-selected?stream=true'), {
-                    method: 'POST',
-                    headers: {
-                        'Content-Type': 'application/json'
-                    },
-                    body: JSON.stringify({
-                        files: files
-                    })
-                });
-                
-                const reader = response.body.getReader();
-                const decoder = new TextDecoder();
-                
-                while (true) {
-                    const { done, value } = await reader.read();
-                    if (done) break;
-                    
-                    const chunk = decoder.decode(value);
-                    const lines = chunk.split('\n');
-                    
-                    for (const line of lines) {
-                        if (line.startsWith('data: ')) {
-                            const data = JSON.parse(line.substring(6));
-                            
-                            if (data.done) {
-                                completeProgress();
-                                showMessage(`Normalized metadata for ${successCount} of ${files.length} files successfully!`, 'success');
-                                // Refresh file list
-                                await loadFiles(1, true);
-                            } else {
-                                if (data.success) {
-                                    successCount++;
-                                } else {
-                                    errorCount++;
-                                }
-                                updateProgress(data.current, data.total, successCount, errorCount);
-                                addProgressDetail(data.file, data.success, data.error);
-                            }
-                        }
-                    }
-                }
-            } catch (error) {
-                showMessage('Failed to normalize metadata: ' + error.message, 'error');
-                closeProgressModal();
-            }
+            await startFileJob('/api/jobs/normalize-selected', 'Normalizing Selected Files...', 'normalizing', Array.from(selectedFiles));
         }
         
         async function processSingleFile(filepath) {
@@ -2298,8 +2037,14 @@
             }
         }
         
-        function refreshFiles() {
+        async function refreshFiles() {
             showMessage('Refreshing file list...', 'info');
+            try {
+                // Pick up files changed outside the app before reloading the list
+                await fetch(apiUrl('/api/files/rescan'), { method: 'POST' });
+            } catch (error) {
+                console.error('Error rescanning files:', error);
+            }
             loadFiles(currentPage, true);
         }
         
@@ -2610,7 +2355,7 @@
             details.scrollTop = details.scrollHeight;
         }
         
-        function completeProgress() {
+        function completeProgress(hadErrors = false) {
             document.getElementById('progressCloseBtn').style.display = 'block';
             document.getElementById('progressCancelBtn').style.display = 'none';  // Hide cancel button when complete
             
@@ -2618,7 +2363,7 @@
             const indicator = document.getElementById('progressIndicator');
             if (indicator.style.display !== 'none') {
                 const indicatorText = document.getElementById('progressIndicatorText');
-                indicatorText.textContent = '✅ Processing Complete';
+                indicatorText.textContent = hadErrors ? '⚠️ Completed with errors' : '✅ Processing Complete';
             }
         }
         
@@ -2677,7 +2422,9 @@
                 } else {
                     logsContent.textContent = data.logs || 'No logs available';
                     const logTypeLabel = data.log_type === 'debug' ? 'Debug Logs' : 'Basic Logs';
-                    logStats.textContent = `${logTypeLabel} - Showing ${data.returned_lines} of ${data.total_lines} total lines`;
+                    logStats.textContent = data.total_lines !== undefined
+                        ? `${logTypeLabel} - Showing ${data.returned_lines} of ${data.total_lines} total lines`
+                        : `${logTypeLabel} - Showing last ${data.returned_lines} lines`;
                 }
             } catch (error) {
                 logsContent.textContent = 'Failed to load logs: ' + error.message;
@@ -3000,28 +2747,32 @@
             let successCount = 0;
             let failCount = 0;
             
-            // Delete files one by one
-            for (let i = 0; i < selectedFilesArray.length; i++) {
-                const filepath = selectedFilesArray[i];
-                updateProgress(i + 1, selectedFilesArray.length, successCount, failCount);
+            // Delete all selected files in one request
+            try {
+                const response = await fetch(apiUrl('/api/delete-selected'), {
+                    method: 'POST',
+                    headers: { 'Content-Type': 'application/json' },
+                    body: JSON.stringify({ files: selectedFilesArray })
+                });
+                const data = await response.json();
                 
-                try {
-                    const response = await fetch(apiUrl(`/api/delete-file/${encodeURIComponent(filepath)}`), {
-                        method: 'DELETE'
-                    });
-                    
-                    if (response.ok) {
+                if (!response.ok) {
+                    throw new Error(data.error || `HTTP error! status: ${response.status}`);
+                }
+                
+                for (const result of data.results) {
+                    if (result.success) {
                         successCount++;
-                        addProgressDetail(filepath, true);
+                        addProgressDetail(result.file, true);
                     } else {
-                        const data = await response.json();
                         failCount++;
-                        addProgressDetail(filepath, false, data.error || 'Unknown error');
+                        addProgressDetail(result.file, false, result.error || 'Unknown error');
                     }
-                } catch (error) {
-                    failCount++;
-                    addProgressDetail(filepath, false, error.message);
                 }
+                updateProgress(data.results.length, selectedFilesArray.length, successCount, failCount);
+            } catch (error) {
+                failCount = selectedFilesArray.length - successCount;
+                addProgressDetail('Delete request', false, error.message);
             }
             
             completeProgress();
@@ -3046,12 +2797,23 @@
                 }
                 const data = await response.json();
                 updateWatcherStatusDisplay(data.running, data.enabled);
+                showWatcherFailures(data.recent_failures);
             } catch (error) {
                 console.error('Error fetching initial watcher status:', error);
                 updateWatcherStatusDisplay(null, null);
             }
         }
         
+        function showWatcherFailures(failures) {
+            // Files the watcher failed to process (newest first) are listed in the tooltip
+            if (!failures || failures.length === 0) {
+                return;
+            }
+            const statusIndicator = document.getElementById('watcherStatus');
+            const lines = failures.map(f => `• ${f.file}: ${f.error || 'Unknown error'}`);
+            statusIndicator.title += `\n\nRecent processing failures:\n${lines.join('\n')}`;
+        }
+        
         function updateWatcherStatusDisplay(running, enabled) {
             const statusIndicator = document.getElementById('watcherStatus');
             const iconElement = statusIndicator.querySelector('.watcher-icon');
@@ -0,0 +1,358 @@
+#!/usr/bin/env python3
+"""
+Test that bulk endpoints run per-file work on a bounded thread pool while
+keeping results in request order.
+"""
+
+import sys
+import os
+import time
+import threading
+import tempfile
+import shutil
+
+# Create temp directory first
+temp_dir = tempfile.mkdtemp(prefix='test_bulk_concurrency_')
+watched_dir = os.path.join(temp_dir, 'comics')
+os.makedirs(watched_dir)
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
+
+# Set up environment before importing modules
+os.environ['WATCHED_DIR'] = watched_dir
+os.environ['MAX_WORKERS'] = '4'
+os.environ['CONFIG_DIR'] = temp_dir
+
+import unified_store
+unified_store.CONFIG_DIR = temp_dir
+unified_store.STORE_DIR = os.path.join(temp_dir, 'store')
+unified_store.DB_PATH = os.path.join(unified_store.STORE_DIR, 'comicmaintainer.db')
+unified_store._db_initialized = False
+
+import web_app
+
+
+def test_map_concurrently_order():
+    """Test that results come back in input order and work overlaps"""
+    print("\n" + "=" * 60)
+    print("TEST: map_concurrently ordering")
+    print("=" * 60)
+
+    active = 0
+    peak = 0
+    lock = threading.Lock()
+
+    def work(n):
+        nonlocal active, peak
+        with lock:
+            active += 1
+            peak = max(peak, active)
+        # Later items finish first to check ordering
+        time.sleep(0.05 * (8 - n) / 8)
+        with lock:
+            active -= 1
+        return n * n
+
+    results = list(web_app.map_concurrently(work, list(range(8))))
+    assert results == [n * n for n in range(8)], results
+    print("✓ Results returned in input order")
+
+    assert 1 < peak <= 4, f"Expected 2-4 concurrent workers, saw {peak}"
+    print(f"✓ Work ran concurrently on a bounded pool (peak {peak})")
+
+    assert list(web_app.map_concurrently(work, [3])) == [9]
+    assert list(web_app.map_concurrently(work, [])) == []
+    print("✓ Single-item and empty inputs handled")
+
+
+def test_batch_tags_missing_files():
+    """Test that batch tag updates still report missing files in order"""
+    print("\n" + "=" * 60)
+    print("TEST: batch tag update results")
+    print("=" * 60)
+
+    client = web_app.app.test_client()
+    response = client.post('/api/files/tags', json={
+        'files': ['missing_a.cbz', 'missing_b.cbz'],
+        'tags': {'series': 'Test'}
+    })
+    assert response.status_code == 200
+    results = response.get_json()['results']
+    assert [r['file'] for r in results] == ['missing_a.cbz', 'missing_b.cbz'], results
+    assert all(r['error'] == 'File not found' for r in results), results
+    print("✓ Missing files reported in request order")
+
+
+def test_process_selected_concurrently():
+    """Test that selected-file processing runs files concurrently and keeps order"""
+    print("\n" + "=" * 60)
+    print("TEST: process-selected on the thread pool")
+    print("=" * 60)
+
+    import process_file
+    names = [f'comic_{i}.cbz' for i in range(6)]
+    for name in names:
+        with open(os.path.join(watched_dir, name), 'w') as f:
+            f.write('test content')
+
+    active = 0
+    peak = 0
+    lock = threading.Lock()
+
+    def fake_process_file(filepath, fixtitle=True, fixseries=True, fixfilename=True):
+        nonlocal active, peak
+        with lock:
+            active += 1
+            peak = max(peak, active)
+        time.sleep(0.05)
+        with lock:
+            active -= 1
+        if filepath.endswith('comic_3.cbz'):
+            raise ValueError('bad archive')
+        # Rename everything so the final name is reported
+        return filepath.replace('.cbz', '_renamed.cbz') if fixfilename else filepath
+
+    original = process_file.process_file
+    process_file.process_file = fake_process_file
+    try:
+        client = web_app.app.test_client()
+        response = client.post('/api/process-selected', json={'files': names + ['missing.cbz']})
+        results = response.get_json()['results']
+
+        response = client.post('/api/normalize-selected', json={'files': names[:2]})
+        normalized = response.get_json()['results']
+    finally:
+        process_file.process_file = original
+
+    expected = [n.replace('.cbz', '_renamed.cbz') for n in names]
+    expected[3] = 'comic_3.cbz'
+    assert [r['file'] for r in results] == expected + ['missing.cbz'], results
+    assert results[3] == {'file': 'comic_3.cbz', 'success': False, 'error': 'bad archive'}
+    assert results[-1]['error'] == 'File not found'
+    assert all(r['success'] for i, r in enumerate(results[:-1]) if i != 3)
+    print("✓ Results, errors and missing files reported in request order")
+
+    assert 1 < peak <= 4, f"Expected 2-4 concurrent workers, saw {peak}"
+    print(f"✓ Files processed concurrently on a bounded pool (peak {peak})")
+
+    assert [r['file'] for r in normalized] == names[:2], normalized
+    print("✓ Normalize keeps filenames (fixfilename=False)")
+
+    processed = unified_store.get_markers('processed')
+    assert os.path.join(watched_dir, 'comic_0_renamed.cbz') in processed
+    assert os.path.join(watched_dir, 'comic_3.cbz') not in processed
+    print("✓ Batched processed markers applied before the response")
+
+
+def test_ndjson_stream():
+    """Test that ?stream=ndjson writes one result per line and a summary"""
+    print("\n" + "=" * 60)
+    print("TEST: NDJSON bulk results")
+    print("=" * 60)
+
+    import json
+    import process_file
+    names = [f'ndjson_{i}.cbz' for i in range(3)]
+    for name in names:
+        with open(os.path.join(watched_dir, name), 'w') as f:
+            f.write('test content')
+
+    def fake_process_file(filepath, fixtitle=True, fixseries=True, fixfilename=True):
+        if filepath.endswith('ndjson_1.cbz'):
+            raise ValueError('bad archive')
+        return filepath
+
+    original = process_file.process_file
+    process_file.process_file = fake_process_file
+    try:
+        client = web_app.app.test_client()
+        response = client.post('/api/process-selected?stream=ndjson', json={'files': names + ['gone.cbz']})
+        assert response.mimetype == 'application/x-ndjson', response.mimetype
+        assert response.headers.get('X-Accel-Buffering') == 'no'
+        lines = [json.loads(line) for line in response.get_data(as_text=True).splitlines()]
+    finally:
+        process_file.process_file = original
+
+    assert [r.get('file') for r in lines[:-1]] == names + ['gone.cbz'], lines
+    assert lines[1] == {'file': 'ndjson_1.cbz', 'success': False, 'error': 'bad archive'}
+    assert lines[3]['error'] == 'File not found'
+    assert lines[-1] == {'done': True, 'total': 4, 'succeeded': 2, 'failed': 2}, lines[-1]
+    print("✓ One JSON object per file, in request order, then a summary line")
+
+    process_file.process_file = fake_process_file
+    try:
+        response = client.post('/api/rename-selected?stream=true', json={'files': names})
+        assert response.headers.get('X-Accel-Buffering') == 'no'
+        events = [json.loads(chunk[len('data: '):]) for chunk in response.get_data(as_text=True).split('\n\n') if chunk]
+    finally:
+        process_file.process_file = original
+
+    assert [e['current'] for e in events[:-1]] == [1, 2, 3], events
+    assert events[-1]['done'] is True
+    assert [r['success'] for r in events[-1]['results']] == [True, False, True], events[-1]
+    print("✓ SSE progress events followed by the full results")
+
+
+def test_background_jobs():
+    """Test that rename/normalize jobs return a job id and run in the background"""
+    print("\n" + "=" * 60)
+    print("TEST: rename/normalize background jobs")
+    print("=" * 60)
+
+    import process_file
+    names = [f'job_{i}.cbz' for i in range(3)]
+    for name in names:
+        with open(os.path.join(watched_dir, name), 'w') as f:
+            f.write('test content')
+
+    release = threading.Event()
+    calls = []
+
+    def fake_process_file(filepath, fixtitle=True, fixseries=True, fixfilename=True):
+        release.wait(5)
+        calls.append((os.path.basename(filepath), fixtitle, fixfilename))
+        return filepath
+
+    original = process_file.process_file
+    process_file.process_file = fake_process_file
+    try:
+        client = web_app.app.test_client()
+        response = client.post('/api/jobs/rename-selected', json={'files': names + ['missing.cbz']})
+        assert response.status_code == 200, response.status_code
+        data = response.get_json()
+        assert data['total_items'] == 3, data
+        assert calls == [], "Job ran inside the request"
+        print("✓ Job id returned before any file was processed")
+
+        release.set()
+        deadline = time.time() + 10
+        status = None
+        while time.time() < deadline:
+            status = client.get(f"/api/jobs/{data['job_id']}").get_json()
+            if status['status'] == 'completed':
+                break
+            time.sleep(0.05)
+        assert status['status'] == 'completed', status
+        assert status['processed_items'] == 3, status
+        assert sorted(calls) == [(name, False, True) for name in names], calls
+        print("✓ Job renamed the existing files in the background")
+
+        assert client.post('/api/jobs/normalize-selected', json={'files': ['missing.cbz']}).status_code == 400
+        assert client.post('/api/jobs/normalize-selected', json={}).status_code == 400
+        print("✓ Missing or empty selections rejected")
+    finally:
+        process_file.process_file = original
+        web_app.clear_active_job()
+
+
+def test_batched_markers():
+    """Test that marker writes inside batched_markers() are applied in one transaction"""
+    print("\n" + "=" * 60)
+    print("TEST: batched marker writes")
+    print("=" * 60)
+
+    import markers
+    paths = [os.path.join(watched_dir, f'batched_{i}.cbz') for i in range(5)]
+    calls = []
+    original = markers.apply_marker_changes
+
+    def counting_apply(changes):
+        calls.append(list(changes))
+        return original(changes)
+
+    markers.apply_marker_changes = counting_apply
+    try:
+        with markers.batched_markers() as batch:
+            for path in paths:
+                markers.mark_file_processed(path)
+            markers.mark_file_duplicate(paths[0])
+            assert len(batch) == 6
+            assert not markers.is_file_processed(paths[0]), "Buffered marker written early"
+            markers.mark_file_web_modified(paths[1])
+            assert markers.is_file_web_modified(paths[1]), "Web modified marker was buffered"
+    finally:
+        markers.apply_marker_changes = original
+
+    assert len(calls) == 1 and len(calls[0]) == 6, calls
+    assert all(markers.is_file_processed(path) for path in paths)
+    assert markers.is_file_duplicate(paths[0])
+    print("✓ Processed/duplicate markers applied in one transaction on exit")
+    print("✓ Web modified markers written immediately")
+
+    # Worker threads join a shared batch; markers written outside it are immediate
+    batch = markers.MarkerBatch(flush_threshold=1000)
+    renamed = [path + '.renamed.cbz' for path in paths]
+    def worker(pair):
+        with markers.batched_markers(batch):
+            markers.mark_file_processed(pair[1], original_filepath=pair[0])
+    list(web_app.map_concurrently(worker, list(zip(paths, renamed))))
+    assert len(batch) == 10, len(batch)
+    assert batch.flush() == 10
+    assert all(markers.is_file_processed(path) for path in renamed)
+    assert not any(markers.is_file_processed(path) for path in paths)
+    print("✓ Shared batch collects renames from worker threads")
+
+
+def test_delete_selected():
+    """Test that /api/delete-selected removes files, markers and store entries"""
+    print("\n" + "=" * 60)
+    print("TEST: delete selected files")
+    print("=" * 60)
+
+    import markers
+    names = [f'delete_{i}.cbz' for i in range(4)]
+    paths = [os.path.join(watched_dir, name) for name in names]
+    for path in paths:
+        with open(path, 'w') as f:
+            f.write('test content')
+        unified_store.add_file(path)
+        markers.mark_file_processed(path)
+    markers.mark_file_duplicate(paths[0])
+
+    calls = []
+    original = markers.apply_marker_changes
+    markers.apply_marker_changes = lambda changes: calls.append(list(changes)) or original(changes)
+    try:
+        client = web_app.app.test_client()
+        response = client.post('/api/delete-selected', json={'files': names + ['gone.cbz']})
+    finally:
+        markers.apply_marker_changes = original
+
+    assert response.status_code == 200
+    results = response.get_json()['results']
+    assert [r['file'] for r in results] == names + ['gone.cbz'], results
+    assert all(r['success'] for r in results[:4])
+    assert results[4] == {'file': 'gone.cbz', 'success': False, 'error': 'File not found'}
+    assert not any(os.path.exists(path) for path in paths)
+    print("✓ Selected files deleted, missing file reported")
+
+    assert len(calls) == 1, f"Expected one marker transaction, got {len(calls)}"
+    assert not any(markers.is_file_processed(path) for path in paths)
+    assert not markers.is_file_duplicate(paths[0])
+    web_app.flush_file_changes()
+    assert not any(unified_store.has_file(path) for path in paths)
+    print("✓ Markers cleared in one transaction and store entries removed")
+
+    assert client.post('/api/delete-selected', json={'files': []}).status_code == 400
+    print("✓ Empty selection rejected")
+
+
+if __name__ == '__main__':
+    try:
+        test_map_concurrently_order()
+        test_batch_tags_missing_files()
+        test_process_selected_concurrently()
+        test_ndjson_stream()
+        test_background_jobs()
+        test_batched_markers()
+        test_delete_selected()
+        print("\n✅ All bulk concurrency tests passed!")
+        sys.exit(0)
+    except Exception as e:
+        print(f"\n❌ Test failed: {e}")
+        import traceback
+        traceback.print_exc()
+        sys.exit(1)
+    finally:
+        shutil.rmtree(temp_dir, ignore_errors=True)
@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""
+Test that store-derived API responses carry an ETag and answer 304 to
+If-None-Match until the files or markers change.
+"""
+
+import sys
+import os
+import tempfile
+import shutil
+
+# Create temp directory first
+temp_dir = tempfile.mkdtemp(prefix='test_conditional_')
+watched_dir = os.path.join(temp_dir, 'comics')
+os.makedirs(watched_dir)
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
+
+# Set up environment before importing modules
+os.environ['WATCHED_DIR'] = watched_dir
+
+import unified_store
+unified_store.CONFIG_DIR = temp_dir
+unified_store.STORE_DIR = os.path.join(temp_dir, 'store')
+unified_store.DB_PATH = os.path.join(unified_store.STORE_DIR, 'comicmaintainer.db')
+unified_store._db_initialized = False
+
+import web_app
+
+
+def _make_file(name):
+    path = os.path.join(watched_dir, name)
+    with open(path, 'w') as f:
+        f.write('test content')
+    return path
+
+
+def test_files_etag():
+    """Test conditional GET on /api/files"""
+    print("\n" + "=" * 60)
+    print("TEST: /api/files ETag")
+    print("=" * 60)
+
+    unified_store.clear_all_files()
+    paths = [_make_file(f'comic_{i}.cbz') for i in range(3)]
+    unified_store.batch_add_files(paths)
+
+    client = web_app.app.test_client()
+    response = client.get('/api/files')
+    assert response.status_code == 200
+    etag = response.headers.get('ETag')
+    assert etag, "No ETag on /api/files"
+    assert response.headers['Cache-Control'] == 'no-cache', response.headers['Cache-Control']
+    print(f"✓ /api/files returned ETag {etag}")
+
+    response = client.get('/api/files', headers={'If-None-Match': etag})
+    assert response.status_code == 304, f"Expected 304, got {response.status_code}"
+    print("✓ Unchanged store answers 304")
+
+    web_app.mark_file_processed(paths[0])
+    response = client.get('/api/files', headers={'If-None-Match': etag})
+    assert response.status_code == 200, "Marker change did not invalidate ETag"
+    assert response.headers['ETag'] != etag
+    etag = response.headers['ETag']
+    print("✓ Marker change invalidates ETag")
+
+    web_app.record_file_change('remove', old_path=paths[1])
+    response = client.get('/api/files', headers={'If-None-Match': etag})
+    assert response.status_code == 200, "Pending file change did not invalidate ETag"
+    assert response.get_json()['total_files'] == 2
+    print("✓ Pending file change flushed and invalidates ETag")
+
+
+def test_scan_unmarked_etag():
+    """Test conditional GET and freshness window on /api/scan-unmarked"""
+    print("\n" + "=" * 60)
+    print("TEST: /api/scan-unmarked ETag")
+    print("=" * 60)
+
+    unified_store.clear_all_files()
+    paths = [_make_file(f'scan_{i}.cbz') for i in range(2)]
+    unified_store.batch_add_files(paths)
+
+    client = web_app.app.test_client()
+    response = client.get('/api/scan-unmarked')
+    assert response.status_code == 200
+    assert response.get_json()['unmarked_count'] == 2
+    etag = response.headers.get('ETag')
+    assert etag, "No ETag on /api/scan-unmarked"
+    assert response.headers['Cache-Control'] == 'max-age=5, must-revalidate', response.headers['Cache-Control']
+    print("✓ Counts returned with ETag and a 5 second freshness window")
+
+    response = client.get('/api/scan-unmarked', headers={'If-None-Match': etag})
+    assert response.status_code == 304, f"Expected 304, got {response.status_code}"
+    assert response.headers['Cache-Control'] == 'max-age=5, must-revalidate'
+    print("✓ Unchanged store answers 304")
+
+    web_app.mark_file_processed(paths[0])
+    response = client.get('/api/scan-unmarked', headers={'If-None-Match': etag})
+    assert response.status_code == 200, "Marker change did not invalidate ETag"
+    assert response.get_json()['unmarked_count'] == 1
+    print("✓ Marker change invalidates ETag")
+
+
+if __name__ == '__main__':
+    try:
+        test_files_etag()
+        test_scan_unmarked_etag()
+        print("\n✅ All conditional request tests passed!")
+        sys.exit(0)
+    except Exception as e:
+        print(f"\n❌ Test failed: {e}")
+        import traceback
+        traceback.print_exc()
+        sys.exit(1)
+    finally:
+        shutil.rmtree(temp_dir, ignore_errors=True)
@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+Test that get_config() serves repeated reads from its cache and picks up
+changes saved by this or another process.
+"""
+
+import sys
+import os
+import json
+import tempfile
+import shutil
+from unittest.mock import patch
+
+# Create temp directory first
+temp_dir = tempfile.mkdtemp(prefix='test_config_cache_')
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
+
+# Set up environment before importing modules
+os.environ['CONFIG_DIR'] = temp_dir
+
+import config
+
+
+def test_config_cache():
+    """Test cached reads and invalidation on save"""
+    print("\n" + "=" * 60)
+    print("TEST: config cache")
+    print("=" * 60)
+
+    assert config.get_filename_format() == config.DEFAULT_FILENAME_FORMAT
+    print("✓ Defaults returned when no config file exists")
+
+    assert config.set_filename_format('{series} {issue}')
+    assert config.get_filename_format() == '{series} {issue}'
+    print("✓ Saved value visible")
+
+    with patch('builtins.open', side_effect=AssertionError("config re-read")):
+        for _ in range(5):
+            assert config.get_filename_format() == '{series} {issue}'
+    print("✓ Unchanged config served without re-reading the file")
+
+    cfg = config.get_config()
+    cfg['filename_format'] = 'mutated'
+    assert config.get_filename_format() == '{series} {issue}'
+    print("✓ Callers get their own copy")
+
+    # Simulate another process replacing the file
+    tmp_file = config.CONFIG_FILE + '.other'
+    with open(tmp_file, 'w') as f:
+        json.dump({'filename_format': 'from other process', 'watcher_enabled': False}, f)
+    os.replace(tmp_file, config.CONFIG_FILE)
+    assert config.get_filename_format() == 'from other process'
+    assert config.get_watcher_enabled() is False
+    print("✓ File replaced by another process is re-read")
+
+    os.remove(config.CONFIG_FILE)
+    assert config.get_filename_format() == config.DEFAULT_FILENAME_FORMAT
+    print("✓ Removed config falls back to defaults")
+
+
+if __name__ == '__main__':
+    try:
+        test_config_cache()
+        print("\n✅ All config cache tests passed!")
+        sys.exit(0)
+    except Exception as e:
+        print(f"\n❌ Test failed: {e}")
+        import traceback
+        traceback.print_exc()
+        sys.exit(1)
+    finally:
+        shutil.rmtree(temp_dir, ignore_errors=True)
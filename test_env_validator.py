@@ -143,7 +143,7 @@ def test_optional_vars_get_defaults():
     print("=" * 60)
     
     # Remove optional variables
-    optional_vars = ['MAX_WORKERS', 'GUNICORN_WORKERS', 'PUID', 'PGID']
+    optional_vars = ['MAX_WORKERS', 'GUNICORN_WORKERS', 'GUNICORN_THREADS', 'PUID', 'PGID']
     originals = {}
     for var in optional_vars:
         originals[var] = os.environ.pop(var, None)
@@ -159,6 +159,7 @@ def test_optional_vars_get_defaults():
             # Check that defaults were set
             assert os.environ.get('MAX_WORKERS') == '4', "MAX_WORKERS should default to 4"
             assert os.environ.get('GUNICORN_WORKERS') == '2', "GUNICORN_WORKERS should default to 2"
+            assert os.environ.get('GUNICORN_THREADS') == '8', "GUNICORN_THREADS should default to 8"
             
             print("✓ Optional variables got default values")
         finally:
@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+Test that broadcast events are encoded to SSE once and shared by all clients.
+"""
+
+import sys
+import os
+import json
+from unittest.mock import patch
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
+
+import event_broadcaster
+from event_broadcaster import Event, get_broadcaster
+
+
+def test_event_encoded_once():
+    """Test that each event is JSON-encoded once regardless of client count"""
+    print("\n" + "=" * 60)
+    print("TEST: SSE event encoding")
+    print("=" * 60)
+
+    event = Event(type='file_processed', data={'filepath': '/comics/a.cbz', 'success': True})
+    message = event.to_sse_format()
+    assert message.startswith('data: ') and message.endswith('\n\n')
+    payload = json.loads(message[len('data: '):])
+    assert payload == {'type': 'file_processed', 'data': event.data, 'timestamp': event.timestamp}
+    print("✓ SSE message carries type, data and timestamp")
+
+    assert event == Event(type=event.type, data=event.data, timestamp=event.timestamp)
+    print("✓ Cached encoding does not affect event equality")
+
+    broadcaster = get_broadcaster()
+    clients = [broadcaster.subscribe() for _ in range(5)]
+    try:
+        # Drain replayed events from earlier tests
+        for client in clients:
+            while not client.empty():
+                client.get_nowait()
+
+        with patch.object(event_broadcaster.json, 'dumps', wraps=json.dumps) as dumps:
+            broadcaster.broadcast('file_processed', {'filepath': '/comics/b.cbz', 'success': True})
+            messages = {client.get_nowait().to_sse_format() for client in clients}
+        assert len(messages) == 1
+        assert dumps.call_count == 1, f"Encoded {dumps.call_count} times for 5 clients"
+        print("✓ One encode shared by 5 clients")
+    finally:
+        for client in clients:
+            broadcaster.unsubscribe(client)
+
+
+def test_broadcast_client_snapshot():
+    """Test that broadcasts iterate a client snapshot and drop full queues"""
+    print("\n" + "=" * 60)
+    print("TEST: broadcast client snapshot")
+    print("=" * 60)
+
+    broadcaster = get_broadcaster()
+    live = broadcaster.subscribe()
+    full = broadcaster.subscribe()
+    while not full.full():
+        full.put_nowait(None)
+    snapshot = broadcaster._clients
+    assert isinstance(snapshot, frozenset) and {live, full} <= snapshot
+
+    broadcaster.broadcast('watcher_status', {'running': True, 'enabled': True})
+    received = []
+    while not live.empty():
+        received.append(live.get_nowait())
+    assert received and received[-1].type == 'watcher_status', received
+    assert full not in broadcaster._clients, "Full client was not dropped"
+    assert live in broadcaster._clients
+    assert full in snapshot, "Published snapshot was mutated"
+    print("✓ Full client dropped by swapping in a new set")
+
+    broadcaster.unsubscribe(live)
+    assert live not in broadcaster._clients
+    print("✓ Unsubscribe replaces the client set")
+
+
+if __name__ == '__main__':
+    try:
+        test_event_encoded_once()
+        test_broadcast_client_snapshot()
+        print("\n✅ All event encoding tests passed!")
+        sys.exit(0)
+    except Exception as e:
+        print(f"\n❌ Test failed: {e}")
+        import traceback
+        traceback.print_exc()
+        sys.exit(1)
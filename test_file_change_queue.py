@@ -0,0 +1,251 @@
+#!/usr/bin/env python3
+"""
+Test that file store changes recorded by the web interface are queued and
+applied in a single batched transaction.
+"""
+
+import sys
+import os
+import time
+import tempfile
+import shutil
+
+# Create temp directory first
+temp_dir = tempfile.mkdtemp(prefix='test_file_changes_')
+watched_dir = os.path.join(temp_dir, 'comics')
+os.makedirs(watched_dir)
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
+
+# Set up environment before importing modules
+os.environ['WATCHED_DIR'] = watched_dir
+
+import unified_store
+unified_store.CONFIG_DIR = temp_dir
+unified_store.STORE_DIR = os.path.join(temp_dir, 'store')
+unified_store.DB_PATH = os.path.join(unified_store.STORE_DIR, 'comicmaintainer.db')
+unified_store._db_initialized = False
+
+import web_app
+import file_store
+from file_change_queue import FileChangeQueue
+
+
+def _make_file(name):
+    path = os.path.join(watched_dir, name)
+    with open(path, 'w') as f:
+        f.write('test content')
+    return path
+
+
+def test_apply_file_changes():
+    """Test that apply_file_changes applies add/rename/remove in order"""
+    print("\n" + "=" * 60)
+    print("TEST: apply_file_changes batch")
+    print("=" * 60)
+
+    unified_store.clear_all_files()
+    a = _make_file('a.cbz')
+    b = _make_file('b.cbz')
+
+    applied = unified_store.apply_file_changes([
+        ('add', None, a),
+        ('add', None, b),
+        ('rename', a, a + '.renamed.cbz'),
+        ('remove', b, None),
+        ('bogus', None, None),
+    ])
+
+    assert applied == 4, f"Expected 4 applied changes, got {applied}"
+    assert unified_store.get_all_files() == [a + '.renamed.cbz'], unified_store.get_all_files()
+    print("✓ Changes applied in order within one transaction")
+
+    assert unified_store.apply_file_changes([]) == 0
+    print("✓ Empty batch is a no-op")
+
+
+def test_record_and_flush():
+    """Test that record_file_change queues and flush_file_changes applies"""
+    print("\n" + "=" * 60)
+    print("TEST: record_file_change queue and flush")
+    print("=" * 60)
+
+    unified_store.clear_all_files()
+    paths = [_make_file(f'queued_{i}.cbz') for i in range(20)]
+
+    for path in paths:
+        web_app.record_file_change('add', new_path=path)
+    web_app.flush_file_changes()
+
+    assert len(unified_store.get_all_files()) == 20
+    assert len(web_app._file_change_queue) == 0
+    print("✓ Queued changes applied on explicit flush")
+
+    # get_comic_files() must see changes recorded just before it
+    web_app.record_file_change('remove', old_path=paths[0])
+    files = web_app.get_comic_files()
+    assert paths[0] not in files, "Pending removal not visible to get_comic_files()"
+    print("✓ get_comic_files() flushes pending changes first")
+
+
+def test_idle_flush():
+    """Test that flushing an empty queue does not touch the store"""
+    print("\n" + "=" * 60)
+    print("TEST: idle flush")
+    print("=" * 60)
+
+    queue = FileChangeQueue(name="idle-flusher")
+    applied = []
+    original = file_store.apply_file_changes
+    file_store.apply_file_changes = lambda changes: applied.append(changes) or len(changes)
+    try:
+        assert queue.flush() == 0
+        assert applied == [], "Empty queue reached the store"
+        print("✓ Empty queue flush returns without applying")
+
+        queue.record('remove', old_path='/nowhere.cbz')
+        assert queue.flush() == 1
+        assert len(applied) == 1
+        print("✓ Queued change still applied")
+    finally:
+        file_store.apply_file_changes = original
+
+
+def test_failed_flush_retried():
+    """Test that a batch the store fails to apply is kept for the next flush"""
+    print("\n" + "=" * 60)
+    print("TEST: failed flush retried")
+    print("=" * 60)
+
+    queue = FileChangeQueue(name="retry-flusher")
+    applied = []
+    failures = [RuntimeError("database is locked")]
+
+    def apply_file_changes(changes):
+        if failures:
+            raise failures.pop()
+        applied.extend(changes)
+        return len(changes)
+
+    original = file_store.apply_file_changes
+    file_store.apply_file_changes = apply_file_changes
+    try:
+        queue.record('add', new_path='/first.cbz')
+        queue.record('add', new_path='/second.cbz')
+        assert queue.flush() == 0
+        assert len(queue) == 2, "Failed batch was dropped"
+        print("✓ Failed batch put back on the queue")
+
+        queue.record('remove', old_path='/first.cbz')
+        assert queue.flush() == 3
+        assert applied == [
+            ('add', None, '/first.cbz'),
+            ('add', None, '/second.cbz'),
+            ('remove', '/first.cbz', None),
+        ], applied
+        print("✓ Retried on the next flush, ahead of newer changes")
+    finally:
+        file_store.apply_file_changes = original
+
+
+def test_background_flusher():
+    """Test that the background flusher applies changes without an explicit flush"""
+    print("\n" + "=" * 60)
+    print("TEST: background flusher")
+    print("=" * 60)
+
+    unified_store.clear_all_files()
+    web_app.start_file_change_flusher()
+    path = _make_file('background.cbz')
+    web_app.record_file_change('add', new_path=path)
+
+    deadline = time.time() + 5
+    while time.time() < deadline and not unified_store.has_file(path):
+        time.sleep(0.05)
+
+    assert unified_store.has_file(path), "Background flusher did not apply the change"
+    print("✓ Background flusher applied queued change")
+
+
+def test_process_file_shares_queue():
+    """Test that process_file records through the process-wide queue"""
+    print("\n" + "=" * 60)
+    print("TEST: process_file uses the shared queue")
+    print("=" * 60)
+
+    import file_change_queue
+    import process_file
+
+    assert web_app._file_change_queue is file_change_queue.get_file_change_queue()
+    print("✓ Web app uses the process-wide queue")
+
+    unified_store.clear_all_files()
+    old = _make_file('shared_old.cbz')
+    new = os.path.join(watched_dir, 'shared_new.cbz')
+    unified_store.add_file(old)
+    os.rename(old, new)
+
+    saved = file_change_queue._default_queue
+    file_change_queue._default_queue = FileChangeQueue(name="unstarted")
+    try:
+        # No flusher running (script mode): applied immediately
+        process_file.record_file_change('rename', old_path=old, new_path=new)
+        assert unified_store.get_all_files() == [new]
+        print("✓ Applied immediately when no flusher is running")
+    finally:
+        file_change_queue._default_queue = saved
+
+    # Flusher running (web app): queued with the web app's own changes
+    web_app.start_file_change_flusher()
+    web_app._file_change_queue.flush_interval = 60
+    try:
+        process_file.record_file_change('rename', old_path=new, new_path=old)
+        assert len(web_app._file_change_queue) == 1
+        web_app.flush_file_changes()
+        assert unified_store.get_all_files() == [old]
+    finally:
+        web_app._file_change_queue.flush_interval = 0.05
+    print("✓ Queued on the shared queue when the flusher is running")
+
+
+def test_threshold_flush():
+    """Test that a full queue is flushed without waiting out the debounce window"""
+    print("\n" + "=" * 60)
+    print("TEST: early flush at threshold")
+    print("=" * 60)
+
+    unified_store.clear_all_files()
+    queue = FileChangeQueue(flush_interval=60, flush_threshold=5, name="test-flusher")
+    queue.start()
+    paths = [_make_file(f'threshold_{i}.cbz') for i in range(6)]
+    for path in paths:
+        queue.record('add', new_path=path)
+
+    deadline = time.time() + 5
+    while time.time() < deadline and len(queue):
+        time.sleep(0.05)
+
+    assert len(queue) == 0, "Full queue was not flushed early"
+    assert all(unified_store.has_file(path) for path in paths)
+    print("✓ Queue flushed as soon as it exceeded the threshold")
+
+
+if __name__ == '__main__':
+    try:
+        test_apply_file_changes()
+        test_record_and_flush()
+        test_idle_flush()
+        test_failed_flush_retried()
+        test_background_flusher()
+        test_process_file_shares_queue()
+        test_threshold_flush()
+        print("\n✅ All file change queue tests passed!")
+        sys.exit(0)
+    except Exception as e:
+        print(f"\n❌ Test failed: {e}")
+        import traceback
+        traceback.print_exc()
+        sys.exit(1)
+    finally:
+        shutil.rmtree(temp_dir, ignore_errors=True)
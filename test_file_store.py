@@ -168,10 +168,19 @@ def test_filesystem_sync():
         # Create some test files
         test_files = []
         for i in range(10):
-            filepath = os.path.join(tmpdir, f"test_{i}.cbz")
+            # Extensions match case-insensitively
+            ext = (".cbz", ".CBZ", ".Cbr")[i % 3]
+            filepath = os.path.join(tmpdir, f"test_{i}{ext}")
             with open(filepath, 'w') as f:
                 f.write("test content")
             test_files.append(filepath)
+        with open(os.path.join(tmpdir, "notes.txt"), 'w') as f:
+            f.write("not a comic")
+        # NAS metadata and recycle bin folders are not walked
+        for skipped in ("@eaDir", "#recycle"):
+            os.makedirs(os.path.join(tmpdir, skipped))
+            with open(os.path.join(tmpdir, skipped, "test_0.cbz"), 'w') as f:
+                f.write("test content")
         
         print(f"✓ Created {len(test_files)} test files in {tmpdir}")
         
@@ -203,10 +212,180 @@ def test_filesystem_sync():
         count = file_store.get_file_count()
         assert count == 7, f"Expected 7 files remaining, got {count}"
         print(f"✓ File count after removal: {count}")
+        
+        # Nested, mixed-case and hidden entries are handled by the single-pass walk
+        nested_dir = os.path.join(tmpdir, 'Series', 'Volume 1')
+        hidden_dir = os.path.join(tmpdir, '.hidden')
+        os.makedirs(nested_dir)
+        os.makedirs(hidden_dir)
+        for filepath in (os.path.join(nested_dir, 'nested.CBR'),
+                         os.path.join(nested_dir, 'notes.txt'),
+                         os.path.join(hidden_dir, 'hidden.cbz')):
+            with open(filepath, 'w') as f:
+                f.write("test content")
+        
+        added, removed, updated = file_store.sync_with_filesystem(tmpdir)
+        assert added == 1, f"Expected 1 nested file added, got {added}"
+        assert os.path.join(nested_dir, 'nested.CBR') in file_store.get_all_files()
+        print(f"✓ Nested comic found, hidden and non-comic files skipped")
+        
+        # Size changes are picked up from the stat taken during the walk
+        with open(test_files[5], 'w') as f:
+            f.write("changed test content")
+        added, removed, updated = file_store.sync_with_filesystem(tmpdir)
+        assert (added, removed, updated) == (0, 0, 1), f"Expected one update, got +{added} -{removed} ~{updated}"
+        print(f"✓ Modified file detected as updated")
+        
+        # A recent sync is not repeated, but max_age=0 always syncs
+        assert file_store.sync_with_filesystem_if_stale(tmpdir, max_age=300) is None
+        assert file_store.sync_with_filesystem_if_stale(tmpdir, max_age=0) == (0, 0, 0)
+        print(f"✓ Stale-only sync skips recently synced store")
+        
+        # A sync already running in another process is not waited on
+        import fcntl
+        with open(os.path.join(file_store.unified_store.STORE_DIR, 'sync.lock'), 'w') as lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            start_time = time.time()
+            assert file_store.sync_with_filesystem_if_stale(tmpdir, max_age=0) is None
+            assert time.time() - start_time < 1, "Sync waited on a held lock"
+            fcntl.flock(lock_file, fcntl.LOCK_UN)
+        print(f"✓ Sync skipped without waiting while another sync holds the lock")
     
     print("✅ Filesystem sync test PASSED")
 
 
+def test_incremental_sync():
+    """Test that incremental syncs only list directories whose mtime changed"""
+    print("\n" + "=" * 60)
+    print("TEST: Incremental Filesystem Sync")
+    print("=" * 60)
+    
+    file_store.clear_all_files()
+    with tempfile.TemporaryDirectory() as tmpdir:
+        dirs = [tmpdir, os.path.join(tmpdir, 'A'), os.path.join(tmpdir, 'B'), os.path.join(tmpdir, 'B', 'Inner')]
+        for directory in dirs[1:]:
+            os.makedirs(directory, exist_ok=True)
+        for directory in dirs:
+            with open(os.path.join(directory, 'comic.cbz'), 'w') as f:
+                f.write("test content")
+        
+        backdated = time.time() - 100
+        def age_dirs():
+            # Directories changed within the last moments are not trusted, so backdate them
+            for directory in dirs:
+                if os.path.isdir(directory):
+                    os.utime(directory, (backdated, backdated))
+        
+        age_dirs()
+        assert file_store.sync_with_filesystem(tmpdir) == (4, 0, 0)
+        assert set(unified_store.get_directory_mtimes()) == set(dirs)
+        print("✓ Full sync records every directory mtime")
+        
+        listed = []
+        original = unified_store._scan_directory
+        def recording_scan(directory, suffixes):
+            listed.append(directory)
+            return original(directory, suffixes)
+        unified_store._scan_directory = recording_scan
+        try:
+            assert file_store.sync_with_filesystem(tmpdir, incremental=True) == (0, 0, 0)
+            assert listed == [], f"Unchanged directories listed: {listed}"
+            print("✓ Nothing listed when no directory changed")
+            
+            with open(os.path.join(dirs[3], 'new.cbz'), 'w') as f:
+                f.write("test content")
+            assert file_store.sync_with_filesystem(tmpdir, incremental=True) == (1, 0, 0)
+            assert listed == [dirs[3]], listed
+            assert file_store.get_file_count() == 5
+            print("✓ Only the changed nested directory listed")
+            
+            age_dirs()
+            listed.clear()
+            shutil.rmtree(dirs[1])
+            assert file_store.sync_with_filesystem(tmpdir, incremental=True) == (0, 1, 0)
+            # Inner changed too recently at the last sync to be trusted, so it is listed again
+            assert sorted(listed) == [tmpdir, dirs[3]], listed
+            assert os.path.join(dirs[1], 'comic.cbz') not in file_store.get_all_files()
+            print("✓ Files of a removed directory dropped")
+        finally:
+            unified_store._scan_directory = original
+        
+        # In-place modifications in unchanged directories need a full sync
+        age_dirs()
+        with open(os.path.join(dirs[2], 'comic.cbz'), 'w') as f:
+            f.write("changed test content")
+        age_dirs()
+        assert file_store.sync_with_filesystem(tmpdir, incremental=True) == (0, 0, 0)
+        assert file_store.sync_with_filesystem(tmpdir) == (0, 0, 1)
+        print("✓ Full sync still picks up in-place modifications")
+        
+        # sync_with_filesystem_if_stale does a full sync once the last one is too old
+        file_store.set_metadata('last_full_sync_timestamp', str(time.time() - 100))
+        assert file_store.sync_with_filesystem_if_stale(tmpdir, max_age=0, full_sync_interval=50) == (0, 0, 0)
+        assert float(file_store.get_metadata('last_full_sync_timestamp')) > time.time() - 10
+        print("✓ Periodic full sync when the last one is older than the interval")
+    
+    print("✅ Incremental sync test PASSED")
+
+
+def test_incremental_sync_trailing_slash():
+    """Test that a watched directory given with a trailing slash keeps its files"""
+    print("\n" + "=" * 60)
+    print("TEST: Incremental Sync With Trailing Slash")
+    print("=" * 60)
+    
+    file_store.clear_all_files()
+    with tempfile.TemporaryDirectory() as tmpdir:
+        for parts in (('a.cbz',), ('Series1', 'b.cbz'), ('Series2', 'c.cbz')):
+            os.makedirs(os.path.join(tmpdir, *parts[:-1]), exist_ok=True)
+            with open(os.path.join(tmpdir, *parts), 'w') as f:
+                f.write("test content")
+        backdated = time.time() - 100
+        for directory in (tmpdir, os.path.join(tmpdir, 'Series1'), os.path.join(tmpdir, 'Series2')):
+            os.utime(directory, (backdated, backdated))
+        
+        root = tmpdir + os.sep
+        assert file_store.sync_with_filesystem(root) == (3, 0, 0)
+        assert file_store.sync_with_filesystem(root, incremental=True) == (0, 0, 0)
+        assert file_store.get_file_count() == 3
+        print("✓ Incremental sync keeps every file")
+    
+    print("✅ Trailing slash sync test PASSED")
+
+
+def test_symlinked_directories():
+    """Test that symlinked directories are followed without looping"""
+    print("\n" + "=" * 60)
+    print("TEST: Symlinked Directories")
+    print("=" * 60)
+    
+    file_store.clear_all_files()
+    with tempfile.TemporaryDirectory() as tmpdir:
+        watched = os.path.join(tmpdir, 'watched')
+        series = os.path.join(tmpdir, 'elsewhere', 'Series')
+        os.makedirs(watched)
+        os.makedirs(series)
+        for path in (os.path.join(watched, 'own.cbz'), os.path.join(series, 'linked.cbz')):
+            with open(path, 'w') as f:
+                f.write("test content")
+        os.symlink(series, os.path.join(watched, 'Series'))
+        # A link back up the tree must not be walked forever
+        os.symlink(watched, os.path.join(series, 'loop'))
+        
+        assert file_store.sync_with_filesystem(watched) == (2, 0, 0)
+        assert set(file_store.get_all_files()) == {
+            os.path.join(watched, 'own.cbz'),
+            os.path.join(watched, 'Series', 'linked.cbz'),
+        }
+        print("✓ Files in a symlinked directory found, loop not followed")
+        
+        assert file_store.sync_with_filesystem(watched, incremental=True)[1] == 0
+        assert file_store.get_file_count() == 2
+        print("✓ Incremental sync keeps files of symlinked directories")
+    
+    print("✅ Symlinked directories test PASSED")
+
+
 def test_metadata_operations():
     """Test metadata operations"""
     print("\n" + "=" * 60)
@@ -237,6 +416,48 @@ def test_metadata_operations():
     print("✅ Metadata operations test PASSED")
 
 
+def test_search_terms():
+    """Test multi-term and literal search in get_files_paginated"""
+    print("\n" + "=" * 60)
+    print("TEST: Search Terms")
+    print("=" * 60)
+    
+    file_store.clear_all_files()
+    paths = [
+        "/comics/Batman/Batman - Chapter 0001 (2020).cbz",
+        "/comics/Batman/Batman - Chapter 0002 (2021).cbz",
+        "/comics/Saga/Saga_100%.cbz",
+        "/comics/Saga/Saga 1000.cbz",
+    ]
+    with unified_store.get_db_connection() as conn:
+        conn.executemany(
+            "INSERT INTO files (filepath, last_modified, file_size, added_timestamp) VALUES (?, 0, 0, 0)",
+            [(p,) for p in paths]
+        )
+        conn.commit()
+    
+    def search(query):
+        results, total = file_store.get_files_paginated(limit=-1, search_query=query)
+        assert total == len(results)
+        return sorted(r['filepath'] for r in results)
+    
+    assert search('batman') == paths[:2]
+    print("✓ Single term is case-insensitive")
+    
+    assert search('batman 2020') == [paths[0]]
+    assert search('  2021   CHAPTER ') == [paths[1]]
+    print("✓ Every term must match, in any order")
+    
+    assert search('saga_') == [paths[2]]
+    assert search('100%') == [paths[2]]
+    print("✓ LIKE wildcards in the query match literally")
+    
+    assert len(search('   ')) == len(paths)
+    print("✓ Blank query matches everything")
+    
+    print("✅ Search terms test PASSED")
+
+
 def test_performance_comparison():
     """Compare performance with old system"""
     print("\n" + "=" * 60)
@@ -300,7 +521,11 @@ def main():
         test_rename_operation()
         test_batch_operations()
         test_filesystem_sync()
+        test_incremental_sync()
+        test_incremental_sync_trailing_slash()
+        test_symlinked_directories()
         test_metadata_operations()
+        test_search_terms()
         test_performance_comparison()
         
         print("\n" + "=" * 60)
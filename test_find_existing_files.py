@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+"""
+Test that find_existing_files() checks existence with one directory scan per
+parent directory and matches os.path.exists() for every path, that stat_files()
+and get_relative_path() enrich listings correctly, and that the selected-files
+endpoints validate their payload before doing any work.
+"""
+
+import sys
+import os
+import tempfile
+import shutil
+
+# Create temp directory first
+temp_dir = tempfile.mkdtemp(prefix='test_find_existing_')
+watched_dir = os.path.join(temp_dir, 'comics')
+os.makedirs(os.path.join(watched_dir, 'series'))
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
+
+# Set up environment before importing modules
+os.environ['WATCHED_DIR'] = watched_dir
+
+import unified_store
+unified_store.CONFIG_DIR = temp_dir
+unified_store.STORE_DIR = os.path.join(temp_dir, 'store')
+unified_store.DB_PATH = os.path.join(unified_store.STORE_DIR, 'comicmaintainer.db')
+unified_store._db_initialized = False
+
+import web_app
+
+
+def _make_file(*parts):
+    path = os.path.join(watched_dir, *parts)
+    with open(path, 'w') as f:
+        f.write('test content')
+    return path
+
+
+def test_find_existing_files():
+    """Test existence results across several directories"""
+    print("\n" + "=" * 60)
+    print("TEST: find_existing_files")
+    print("=" * 60)
+
+    present = [
+        _make_file('a.cbz'),
+        _make_file('b.cbz'),
+        _make_file('series', 'c.cbz'),
+    ]
+    missing = [
+        os.path.join(watched_dir, 'missing.cbz'),
+        os.path.join(watched_dir, 'series', 'missing.cbz'),
+        os.path.join(watched_dir, 'gone', 'x.cbz'),
+        os.path.join(watched_dir, 'gone', 'y.cbz'),
+    ]
+
+    existing = web_app.find_existing_files(present + missing)
+    assert existing == set(present), f"Unexpected result: {existing}"
+    print("✓ Existing files found, missing files and directories skipped")
+
+    assert web_app.find_existing_files([]) == set()
+    print("✓ Empty input returns empty set")
+
+    # Many directories are checked concurrently; results must not mix up
+    os.makedirs(os.path.join(watched_dir, 'many'))
+    spread = []
+    for i in range(40):
+        os.makedirs(os.path.join(watched_dir, 'many', str(i)))
+        spread.append(_make_file('many', str(i), 'x.cbz'))
+        spread.append(os.path.join(watched_dir, 'many', str(i), 'missing.cbz'))
+        if i % 2:
+            spread.append(_make_file('many', str(i), 'y.cbz'))
+    existing = web_app.find_existing_files(spread)
+    assert existing == {path for path in spread if os.path.exists(path)}
+    print("✓ Results across many directories match os.path.exists()")
+
+
+def test_filter_unmarked_existing_files():
+    """Test that the unmarked filter still drops non-existent files"""
+    print("\n" + "=" * 60)
+    print("TEST: filter_unmarked_existing_files")
+    print("=" * 60)
+
+    a = _make_file('unmarked_a.cbz')
+    b = _make_file('unmarked_b.cbz')
+    missing = os.path.join(watched_dir, 'unmarked_missing.cbz')
+
+    result = web_app.filter_unmarked_existing_files([a, missing, b])
+    assert result == [a, b], f"Unexpected result: {result}"
+    print("✓ Order preserved and non-existent files skipped")
+
+
+def test_stat_files():
+    """Test that stat_files returns one stat per existing file, in a batch"""
+    print("\n" + "=" * 60)
+    print("TEST: stat_files")
+    print("=" * 60)
+
+    paths = [_make_file(f'stat_{i}.cbz') for i in range(10)]
+    missing = os.path.join(watched_dir, 'stat_missing.cbz')
+
+    stats = web_app.stat_files(paths + [missing])
+    assert set(stats) == set(paths), sorted(stats)
+    for path in paths:
+        assert stats[path].st_size == os.path.getsize(path)
+        assert stats[path].st_mtime == os.path.getmtime(path)
+    print("✓ Existing files stat'ed, missing file omitted")
+
+    unified_store.clear_all_files()
+    enriched = web_app.get_enriched_file_list([paths[0], missing])
+    assert enriched[0]['size'] == len('test content')
+    assert enriched[1]['size'] == 0 and enriched[1]['modified'] == 0
+    print("✓ get_enriched_file_list uses the batched stats")
+
+    nested = os.path.join(watched_dir, 'series', 'nested.cbz')
+    assert web_app.get_relative_path(nested) == os.path.relpath(nested, watched_dir)
+    assert enriched[0]['relative_path'] == 'stat_0.cbz'
+    outside = os.path.join(temp_dir, 'outside.cbz')
+    assert web_app.get_relative_path(outside) == os.path.relpath(outside, watched_dir)
+    # A sibling directory sharing the name prefix is not inside WATCHED_DIR
+    sibling = watched_dir + '2/x.cbz'
+    assert web_app.get_relative_path(sibling) == os.path.relpath(sibling, watched_dir)
+    print("✓ Relative paths match os.path.relpath")
+
+
+def test_selected_payload_validation():
+    """Test that malformed selected-files payloads are rejected with 400"""
+    print("\n" + "=" * 60)
+    print("TEST: selected-files payload validation")
+    print("=" * 60)
+
+    client = web_app.app.test_client()
+    for payload in (None, [], {'files': 'a.cbz'}, {'files': [1, None, '']}):
+        if payload is None:
+            response = client.post('/api/process-selected', data='not json', content_type='application/json')
+        else:
+            response = client.post('/api/process-selected', json=payload)
+        assert response.status_code == 400, f"Payload {payload!r} returned {response.status_code}"
+    print("✓ Malformed payloads rejected before any per-file work")
+
+    response = client.post('/api/rename-selected', json={'files': ['missing.cbz']})
+    assert response.status_code == 200
+    results = response.get_json()['results']
+    assert results == [{'file': 'missing.cbz', 'success': False, 'error': 'File not found'}], results
+    print("✓ Missing files still reported per file")
+
+    response = client.post('/api/rename-selected', json={'files': ['missing.cbz', 'other.cbz', 'missing.cbz']})
+    results = response.get_json()['results']
+    assert [r['file'] for r in results] == ['missing.cbz', 'other.cbz'], results
+    print("✓ Repeated paths handled once, in request order")
+
+
+if __name__ == '__main__':
+    try:
+        test_find_existing_files()
+        test_filter_unmarked_existing_files()
+        test_stat_files()
+        test_selected_payload_validation()
+        print("\n✅ All find_existing_files tests passed!")
+        sys.exit(0)
+    except Exception as e:
+        print(f"\n❌ Test failed: {e}")
+        import traceback
+        traceback.print_exc()
+        sys.exit(1)
+    finally:
+        shutil.rmtree(temp_dir, ignore_errors=True)
@@ -46,6 +46,26 @@ def test_index_route():
         print("✓ Response is valid HTML")
         return True
 
+def test_index_cached():
+    """Test that the main page is rendered once and revalidated with its ETag"""
+    import web_app
+    web_app.render_index.cache_clear()
+    with app.test_client() as client:
+        first = client.get('/')
+        etag = first.headers.get('ETag')
+        assert etag, "Expected an ETag on the main page"
+        assert first.headers.get('Cache-Control') == 'no-cache'
+        
+        second = client.get('/')
+        assert second.data == first.data
+        assert web_app.render_index.cache_info().misses == 1, web_app.render_index.cache_info()
+        print("\n✓ Main page rendered once and served from memory")
+        
+        revalidated = client.get('/', headers={'If-None-Match': etag})
+        assert revalidated.status_code == 304, f"Expected 304, got {revalidated.status_code}"
+        print("✓ Unchanged page revalidates with 304")
+        return True
+
 def test_manifest_route():
     """Test that the manifest.json route works"""
     with app.test_client() as client:
@@ -91,6 +111,7 @@ if __name__ == '__main__':
     
     try:
         test_index_route()
+        test_index_cached()
         test_manifest_route()
         test_api_health()
         
@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+Test that a bulk job is not started while another one is still queued or
+processing, and that a stale active job does not block new ones.
+"""
+
+import sys
+import os
+import time
+import tempfile
+import shutil
+
+# Create temp directory first
+temp_dir = tempfile.mkdtemp(prefix='test_job_start_lock_')
+watched_dir = os.path.join(temp_dir, 'comics')
+os.makedirs(watched_dir)
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
+
+# Set up environment before importing modules
+os.environ['WATCHED_DIR'] = watched_dir
+os.environ['CONFIG_DIR'] = temp_dir
+
+import unified_store
+unified_store.CONFIG_DIR = temp_dir
+unified_store.STORE_DIR = os.path.join(temp_dir, 'store')
+unified_store.DB_PATH = os.path.join(unified_store.STORE_DIR, 'comicmaintainer.db')
+unified_store._db_initialized = False
+
+import web_app
+
+
+def test_overlapping_jobs_rejected():
+    """Test that bulk job requests get 409 while a job is running"""
+    print("\n" + "=" * 60)
+    print("TEST: overlapping bulk jobs rejected")
+    print("=" * 60)
+
+    with open(os.path.join(watched_dir, 'issue.cbz'), 'w') as f:
+        f.write('test content')
+    unified_store.sync_with_filesystem(watched_dir)
+
+    client = web_app.app.test_client()
+    job_manager = web_app.get_job_manager()
+    queued_id = job_manager.create_job(['queued.cbz'])
+    web_app.set_active_job(queued_id, 'Processing Files...')
+
+    for endpoint in ('/api/jobs/process-all', '/api/jobs/rename-all'):
+        response = client.post(endpoint)
+        assert response.status_code == 409, (endpoint, response.status_code)
+        assert response.get_json()['job_id'] == queued_id
+    print("✓ Requests rejected with 409 and the running job id")
+
+    response = client.post('/api/process-all')
+    assert response.status_code == 409, response.status_code
+    assert response.get_json()['job_id'] == queued_id
+    print("✓ Synchronous bulk request rejected while the job is running")
+
+    assert web_app.get_active_job()['job_id'] == queued_id
+    print("✓ Active job left untouched")
+
+    # A finished job still recorded as active must not block new jobs
+    job_manager.cancel_job(queued_id)
+    web_app.set_active_job(queued_id, 'Processing Files...')
+    response = client.post('/api/jobs/process-all')
+    assert response.status_code == 200, response.status_code
+    job_id = response.get_json()['job_id']
+    assert job_id != queued_id
+    print("✓ New job started once the previous one finished")
+
+    deadline = time.time() + 10
+    while job_manager.get_job_status(job_id)['status'] not in ('completed', 'failed'):
+        assert time.time() < deadline, "Job did not finish"
+        time.sleep(0.05)
+
+
+def test_sync_bulk_run_blocks_others():
+    """Test that a synchronous bulk run keeps other bulk runs out until it ends"""
+    print("\n" + "=" * 60)
+    print("TEST: synchronous bulk run blocks other runs")
+    print("=" * 60)
+
+    client = web_app.app.test_client()
+    web_app.clear_active_job()
+
+    response = client.post('/api/process-all?stream=ndjson', buffered=False)
+    assert response.status_code == 200, response.status_code
+    for endpoint in ('/api/process-all', '/api/jobs/process-all'):
+        blocked = client.post(endpoint)
+        assert blocked.status_code == 409, (endpoint, blocked.status_code)
+    print("✓ Other bulk requests rejected while the stream is open")
+
+    lines = response.get_data().splitlines()
+    response.close()
+    assert b'"done":true' in lines[-1], lines[-1]
+    response = client.post('/api/process-all')
+    assert response.status_code == 200, response.status_code
+    assert len(response.get_json()['results']) == 1
+    print("✓ Bulk requests accepted once the stream finished")
+
+
+if __name__ == '__main__':
+    try:
+        test_overlapping_jobs_rejected()
+        test_sync_bulk_run_blocks_others()
+        print("\n✅ All job start lock tests passed!")
+        sys.exit(0)
+    except Exception as e:
+        print(f"\n❌ Test failed: {e}")
+        import traceback
+        traceback.print_exc()
+        sys.exit(1)
+    finally:
+        shutil.rmtree(temp_dir, ignore_errors=True)
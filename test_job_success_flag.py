@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""
+Test that a job's status only reports success when every item succeeded, and
+lists the items that failed.
+"""
+
+import sys
+import os
+import time
+import uuid
+import tempfile
+import shutil
+
+# Set up test environment BEFORE importing modules
+temp_dir = tempfile.mkdtemp(prefix='test_job_success_flag_')
+os.environ['CONFIG_DIR'] = temp_dir
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
+
+import job_store
+
+
+def make_job(outcomes, status='completed'):
+    """Create a job with one result per (item, success) pair"""
+    job_id = str(uuid.uuid4())
+    assert job_store.create_job(job_id, len(outcomes), time.time())
+    for item, success in outcomes:
+        job_store.add_job_result(job_id, item, success, None if success else 'Timed out')
+    job_store.update_job_status(job_id, status, completed_at=time.time())
+    return job_store.get_job(job_id)
+
+
+def test_success_flag():
+    """Test the success flag and failed_items of finished and running jobs"""
+    print("\n" + "=" * 60)
+    print("TEST: job success flag")
+    print("=" * 60)
+
+    job = make_job([('a.cbz', True), ('b.cbz', True)])
+    assert job['success'] is True and job['failed_items'] == [], job
+    print("✓ Job with no failures reports success")
+
+    job = make_job([('a.cbz', True), ('b.cbz', False), ('c.cbz', False)])
+    assert job['success'] is False, job
+    assert job['failed_items'] == ['b.cbz', 'c.cbz'], job['failed_items']
+    print("✓ Job with failures reports them and is not a success")
+
+    job = make_job([('a.cbz', False), ('b.cbz', False)])
+    assert job['success'] is False and len(job['failed_items']) == 2
+    print("✓ Job where every item failed is not a success")
+
+    job = make_job([('a.cbz', True)], status='processing')
+    assert job['success'] is False
+    print("✓ Unfinished job is not a success yet")
+
+
+if __name__ == '__main__':
+    try:
+        test_success_flag()
+        print("\n✅ All job success flag tests passed!")
+        sys.exit(0)
+    except Exception as e:
+        print(f"\n❌ Test failed: {e}")
+        import traceback
+        traceback.print_exc()
+        sys.exit(1)
+    finally:
+        shutil.rmtree(temp_dir, ignore_errors=True)
@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""
+Test that json_response() serializes payloads with orjson into JSON responses.
+"""
+
+import sys
+import os
+import tempfile
+import shutil
+
+# Create temp directory first
+temp_dir = tempfile.mkdtemp(prefix='test_json_response_')
+watched_dir = os.path.join(temp_dir, 'comics')
+os.makedirs(watched_dir)
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
+
+# Set up environment before importing modules
+os.environ['WATCHED_DIR'] = watched_dir
+
+import unified_store
+unified_store.CONFIG_DIR = temp_dir
+unified_store.STORE_DIR = os.path.join(temp_dir, 'store')
+unified_store.DB_PATH = os.path.join(unified_store.STORE_DIR, 'comicmaintainer.db')
+unified_store._db_initialized = False
+
+import web_app
+
+
+def test_json_response():
+    """Test that json_response round-trips payloads"""
+    print("\n" + "=" * 60)
+    print("TEST: json_response")
+    print("=" * 60)
+
+    payload = {
+        'files': [{'name': 'Batman #001.cbz', 'processed': True, 'size': 1024}],
+        'page': 1,
+        'unicode': 'Astérix',
+    }
+
+    with web_app.app.app_context():
+        response = web_app.json_response(payload)
+        assert response.status_code == 200
+        assert response.mimetype == 'application/json'
+        assert response.get_json() == payload
+        assert b' ' not in response.get_data().replace(b'Batman #001', b'')
+        print("✓ Payload round-trips as compact JSON")
+
+        response = web_app.json_response(payload, status=202)
+        assert response.status_code == 202
+        assert response.get_json() == payload
+        print("✓ Status code passed through")
+
+    unified_store.clear_all_files()
+    client = web_app.app.test_client()
+    response = client.get('/api/files')
+    assert response.status_code == 200
+    assert response.mimetype == 'application/json'
+    assert response.get_json()['files'] == []
+    print("✓ /api/files served through json_response")
+
+
+if __name__ == '__main__':
+    try:
+        test_json_response()
+        print("\n✅ All JSON response tests passed!")
+        sys.exit(0)
+    except Exception as e:
+        print(f"\n❌ Test failed: {e}")
+        import traceback
+        traceback.print_exc()
+        sys.exit(1)
+    finally:
+        shutil.rmtree(temp_dir, ignore_errors=True)
@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+Test that the logs endpoint tail-reads the log file instead of loading it whole.
+"""
+
+import sys
+import os
+import tempfile
+import shutil
+
+# Create temp directory first
+temp_dir = tempfile.mkdtemp(prefix='test_log_tail_')
+watched_dir = os.path.join(temp_dir, 'comics')
+os.makedirs(watched_dir)
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
+
+# Set up environment before importing modules
+os.environ['WATCHED_DIR'] = watched_dir
+os.environ['CONFIG_DIR'] = temp_dir
+
+import unified_store
+unified_store.CONFIG_DIR = temp_dir
+unified_store.STORE_DIR = os.path.join(temp_dir, 'store')
+unified_store.DB_PATH = os.path.join(unified_store.STORE_DIR, 'comicmaintainer.db')
+unified_store._db_initialized = False
+
+import web_app
+
+
+def _write_log(name, lines):
+    path = os.path.join(temp_dir, name)
+    with open(path, 'w', encoding='utf-8') as f:
+        f.writelines(lines)
+    return path
+
+
+def test_read_log_tail():
+    """Test that read_log_tail returns exactly the last lines"""
+    print("\n" + "=" * 60)
+    print("TEST: read_log_tail")
+    print("=" * 60)
+
+    # Lines much longer than the per-line estimate force the window to grow
+    lines = [f"line {i} " + "x" * (i * 37 % 1500) + "\n" for i in range(300)]
+    lines[150] = "naïve ünïcode line\n"
+    path = _write_log('long.log', lines)
+
+    for count in (1, 10, 151, 299, 300, 1000):
+        tail = web_app.read_log_tail(path, count)
+        expected = lines[-count:]
+        assert [line.decode('utf-8') for line in tail] == expected, f"Wrong tail for {count} lines"
+    print("✓ Last N lines returned for short, long and oversized requests")
+
+    assert len(web_app.read_log_tail(path, 0)) == 300
+    print("✓ lines=0 returns the whole file")
+
+    path = _write_log('unterminated.log', ["first\n", "second\n", "last"])
+    assert web_app.read_log_tail(path, 2) == [b"second\n", b"last"]
+    assert web_app.read_log_tail(_write_log('empty.log', []), 5) == []
+    print("✓ Unterminated last line and empty file handled")
+
+
+def test_logs_endpoint():
+    """Test that /api/logs only counts all lines when asked to"""
+    print("\n" + "=" * 60)
+    print("TEST: /api/logs")
+    print("=" * 60)
+
+    os.makedirs(web_app.LOG_DIR, exist_ok=True)
+    log_file = os.path.join(web_app.LOG_DIR, "ComicMaintainer.log")
+    with open(log_file, 'a', encoding='utf-8') as f:
+        f.writelines(f"entry {i}\n" for i in range(50))
+    with open(log_file, 'rb') as f:
+        total = sum(1 for _ in f)
+
+    client = web_app.app.test_client()
+    data = client.get('/api/logs?lines=5').get_json()
+    assert data['logs'].splitlines() == [f"entry {i}" for i in range(45, 50)], data['logs']
+    assert data['returned_lines'] == 5
+    assert 'total_lines' not in data
+    print("✓ Tail returned without counting the whole file")
+
+    data = client.get('/api/logs?lines=5&count_total=1').get_json()
+    assert data['total_lines'] == total, data
+    print("✓ total_lines included with count_total=1")
+
+
+if __name__ == '__main__':
+    try:
+        test_read_log_tail()
+        test_logs_endpoint()
+        print("\n✅ All log tail tests passed!")
+        sys.exit(0)
+    except Exception as e:
+        print(f"\n❌ Test failed: {e}")
+        import traceback
+        traceback.print_exc()
+        sys.exit(1)
+    finally:
+        shutil.rmtree(temp_dir, ignore_errors=True)
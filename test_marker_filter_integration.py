@@ -95,6 +95,8 @@ def test_marker_filter_integration():
             for file_data in results:
                 filepath = file_data['filepath']
                 assert filepath in processed_files, f"File {filepath} should be marked as processed"
+                assert file_data['processed'] is True
+                assert file_data['duplicate'] == (filepath in duplicate_files)
             print(f"✓ Query marked files (page 1): {elapsed:.4f}s - {len(results)} files")
             
             # Test 3: Get unmarked files
@@ -110,6 +112,7 @@ def test_marker_filter_integration():
             for file_data in results:
                 filepath = file_data['filepath']
                 assert filepath not in processed_files, f"File {filepath} should NOT be marked as processed"
+                assert file_data['processed'] is False
             print(f"✓ Query unmarked files (page 1): {elapsed:.4f}s - {len(results)} files")
             
             # Test 4: Get duplicate files
@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+"""
+Test that process_file.py accepts several files in one run and keeps going
+past a file that fails.
+"""
+
+import sys
+import os
+import subprocess
+import tempfile
+import shutil
+
+# Create temp directory first
+temp_dir = tempfile.mkdtemp(prefix='test_process_file_batch_')
+watched_dir = os.path.join(temp_dir, 'comics')
+os.makedirs(watched_dir)
+
+PROCESS_SCRIPT = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'src', 'process_file.py')
+
+
+def run_script(*args):
+    env = dict(os.environ, CONFIG_DIR=temp_dir, WATCHED_DIR=watched_dir)
+    return subprocess.run([sys.executable, PROCESS_SCRIPT, *args],
+                          env=env, capture_output=True, text=True, timeout=120)
+
+
+def test_batch():
+    """Test that every file in a batch is attempted"""
+    print("\n" + "=" * 60)
+    print("TEST: process_file.py with several files")
+    print("=" * 60)
+
+    paths = []
+    for name in ('first.cbz', 'second.cbz', 'third.cbz'):
+        path = os.path.join(watched_dir, name)
+        with open(path, 'w') as f:
+            f.write('not an archive')
+        paths.append(path)
+
+    result = run_script(*paths, '--fixtitle')
+    assert result.returncode == 1, result.returncode
+    for path in paths:
+        assert f"Processing file: {path}" in result.stdout, path
+    print("✓ All files attempted in one run")
+
+    assert "Failed to process 3 of 3 file(s)" in result.stdout, result.stdout[-2000:]
+    print("✓ Failures counted and reported with a non-zero exit status")
+
+    result = run_script('--fixtitle')
+    assert result.returncode == 1 and "Usage:" in result.stdout
+    print("✓ Usage printed when no file is given")
+
+
+if __name__ == '__main__':
+    try:
+        test_batch()
+        print("\n✅ All process_file batch tests passed!")
+        sys.exit(0)
+    except Exception as e:
+        print(f"\n❌ Test failed: {e}")
+        import traceback
+        traceback.print_exc()
+        sys.exit(1)
+    finally:
+        shutil.rmtree(temp_dir, ignore_errors=True)
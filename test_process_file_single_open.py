@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+Test that process_file() opens each archive once, reusing the tags it read for
+the already-normalized check, the rename and the processing history.
+"""
+
+import sys
+import os
+import tempfile
+import shutil
+import types
+
+# Create temp directory first
+temp_dir = tempfile.mkdtemp(prefix='test_process_single_open_')
+series_dir = os.path.join(temp_dir, 'comics', 'My Series')
+os.makedirs(series_dir)
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
+
+# Set up environment before importing modules
+os.environ['CONFIG_DIR'] = temp_dir
+
+import unified_store
+unified_store.CONFIG_DIR = temp_dir
+unified_store.STORE_DIR = os.path.join(temp_dir, 'store')
+unified_store.DB_PATH = os.path.join(unified_store.STORE_DIR, 'comicmaintainer.db')
+unified_store._db_initialized = False
+
+import process_file
+
+
+class FakeArchive:
+    """Stands in for ComicArchive, keeping tags in memory and counting I/O"""
+    stored = {}
+    opens = []
+    reads = []
+
+    def __init__(self, path):
+        FakeArchive.opens.append(path)
+
+    def read_tags(self, style):
+        FakeArchive.reads.append(style)
+        fields = dict(title=None, series=None, issue=None, publisher=None, year=None, volume=None)
+        fields.update(FakeArchive.stored)
+        return types.SimpleNamespace(**fields)
+
+    def write_tags(self, tags, style):
+        FakeArchive.stored = dict(vars(tags))
+
+
+def test_single_open():
+    """Test archive opens and tag reads for dirty and clean files"""
+    print("\n" + "=" * 60)
+    print("TEST: process_file opens the archive once")
+    print("=" * 60)
+
+    path = os.path.join(series_dir, 'My Series ch 3.cbz')
+    with open(path, 'w') as f:
+        f.write('test content')
+
+    original = process_file.ComicArchive
+    process_file.ComicArchive = FakeArchive
+    try:
+        final = process_file.process_file(path)
+        assert os.path.basename(final) == 'My Series - Chapter 0003.cbz', final
+        assert FakeArchive.stored['title'] == 'Chapter 3'
+        assert len(FakeArchive.opens) == 1, FakeArchive.opens
+        assert len(FakeArchive.reads) == 2, "Expected one read plus one read-back after writing"
+        print("✓ File needing changes opened once")
+
+        history = unified_store.get_processing_history()
+        assert history and history[0]['after_title'] == 'Chapter 3', history
+        print("✓ History recorded from the tags in hand")
+
+        FakeArchive.opens.clear()
+        FakeArchive.reads.clear()
+        assert process_file.process_file(final) == final
+        assert len(FakeArchive.opens) == 1 and len(FakeArchive.reads) == 1
+        print("✓ Already-normalized file opened and read once")
+    finally:
+        process_file.ComicArchive = original
+
+
+if __name__ == '__main__':
+    try:
+        test_single_open()
+        print("\n✅ All process_file single open tests passed!")
+        sys.exit(0)
+    except Exception as e:
+        print(f"\n❌ Test failed: {e}")
+        import traceback
+        traceback.print_exc()
+        sys.exit(1)
+    finally:
+        shutil.rmtree(temp_dir, ignore_errors=True)
@@ -242,7 +242,7 @@ def test_production_migration():
         'idx_files_last_modified',
         'idx_files_added_timestamp',
         'idx_markers_filepath',
-        'idx_markers_type'
+        'idx_markers_type_filepath'
     }
     assert expected_indexes.issubset(indexes), "Missing indexes"
     print(f"✓ Indexes present: {len(indexes)} indexes")
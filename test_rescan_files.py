@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""
+Test that POST /api/files/rescan picks up files added and removed outside the app
+without waiting for the background sync.
+"""
+
+import sys
+import os
+import tempfile
+import shutil
+
+# Create temp directory first
+temp_dir = tempfile.mkdtemp(prefix='test_rescan_files_')
+watched_dir = os.path.join(temp_dir, 'comics')
+os.makedirs(os.path.join(watched_dir, 'series'))
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
+
+# Set up environment before importing modules
+os.environ['WATCHED_DIR'] = watched_dir
+os.environ['CONFIG_DIR'] = temp_dir
+
+import unified_store
+unified_store.CONFIG_DIR = temp_dir
+unified_store.STORE_DIR = os.path.join(temp_dir, 'store')
+unified_store.DB_PATH = os.path.join(unified_store.STORE_DIR, 'comicmaintainer.db')
+unified_store._db_initialized = False
+
+import web_app
+
+
+def _make_file(*parts):
+    path = os.path.join(watched_dir, *parts)
+    with open(path, 'w') as f:
+        f.write('test content')
+    return path
+
+
+def test_rescan():
+    """Test that a rescan adds new files and drops deleted ones"""
+    print("\n" + "=" * 60)
+    print("TEST: /api/files/rescan")
+    print("=" * 60)
+
+    client = web_app.app.test_client()
+    kept = _make_file('series', 'kept.cbz')
+    gone = _make_file('series', 'gone.cbz')
+    response = client.post('/api/files/rescan')
+    assert response.status_code == 200
+    assert set(unified_store.get_all_files()) >= {kept, gone}
+    print("✓ Initial rescan lists existing files")
+
+    added = _make_file('series', 'added.cbz')
+    os.remove(gone)
+    response = client.post('/api/files/rescan')
+    data = response.get_json()
+    assert data['success'] is True and data['added'] == 1 and data['removed'] == 1, data
+
+    files = set(unified_store.get_all_files())
+    assert added in files and kept in files and gone not in files, files
+    print("✓ Added and removed files picked up right away")
+
+
+if __name__ == '__main__':
+    try:
+        test_rescan()
+        print("\n✅ All rescan tests passed!")
+        sys.exit(0)
+    except Exception as e:
+        print(f"\n❌ Test failed: {e}")
+        import traceback
+        traceback.print_exc()
+        sys.exit(1)
+    finally:
+        shutil.rmtree(temp_dir, ignore_errors=True)
@@ -0,0 +1,174 @@
+#!/usr/bin/env python3
+"""
+Test that /api/scan-unmarked reports counts consistent with the processed markers,
+including right after a file or marker change.
+"""
+
+import sys
+import os
+import tempfile
+import shutil
+
+# Create temp directory first
+temp_dir = tempfile.mkdtemp(prefix='test_scan_unmarked_')
+watched_dir = os.path.join(temp_dir, 'comics')
+os.makedirs(watched_dir)
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
+
+# Set up environment before importing modules
+os.environ['WATCHED_DIR'] = watched_dir
+
+import unified_store
+unified_store.CONFIG_DIR = temp_dir
+unified_store.STORE_DIR = os.path.join(temp_dir, 'store')
+unified_store.DB_PATH = os.path.join(unified_store.STORE_DIR, 'comicmaintainer.db')
+unified_store._db_initialized = False
+
+import web_app
+import markers
+
+
+def test_scan_unmarked_counts():
+    """Test that marked/unmarked/total counts match the markers"""
+    print("\n" + "=" * 60)
+    print("TEST: scan-unmarked counts")
+    print("=" * 60)
+
+    unified_store.clear_all_files()
+    paths = []
+    for i in range(10):
+        path = os.path.join(watched_dir, f'comic_{i:02d}.cbz')
+        with open(path, 'w') as f:
+            f.write('test content')
+        paths.append(path)
+    unified_store.batch_add_files(paths)
+    for path in paths[:4]:
+        web_app.mark_file_processed(path)
+
+    client = web_app.app.test_client()
+    data = client.get('/api/scan-unmarked').get_json()
+    assert data == {'unmarked_count': 6, 'marked_count': 4, 'total_count': 10}, data
+    print("✓ Counts match processed markers")
+
+    # Pending file changes are visible to the scan
+    web_app.record_file_change('remove', old_path=paths[9])
+    data = client.get('/api/scan-unmarked').get_json()
+    assert data == {'unmarked_count': 5, 'marked_count': 4, 'total_count': 9}, data
+    print("✓ Pending file changes flushed before counting")
+
+    # Marker changes show up in both endpoints right away
+    markers.unmark_file_processed(paths[0])
+    data = client.get('/api/scan-unmarked').get_json()
+    assert data == {'unmarked_count': 6, 'marked_count': 3, 'total_count': 9}, data
+    assert client.get('/api/files').get_json()['unmarked_count'] == 6
+    print("✓ Marker change reflected in the counts")
+
+
+def test_filter_unmarked_files():
+    """Test that unmarked filtering reads the processed markers once"""
+    print("\n" + "=" * 60)
+    print("TEST: filter_unmarked_existing_files")
+    print("=" * 60)
+
+    paths = [os.path.join(watched_dir, f'filter_{i}.cbz') for i in range(6)]
+    for path in paths[:5]:
+        with open(path, 'w') as f:
+            f.write('test content')
+    for path in paths[:2]:
+        web_app.mark_file_processed(path)
+
+    calls = []
+    original = web_app.get_processed_files
+    web_app.get_processed_files = lambda: calls.append(1) or original()
+    try:
+        unmarked = web_app.filter_unmarked_existing_files(paths)
+    finally:
+        web_app.get_processed_files = original
+
+    assert unmarked == paths[2:5], unmarked
+    assert calls == [1], f"Expected one marker query, got {len(calls)}"
+    print("✓ Processed and missing files dropped with one marker query")
+
+    relative = os.path.relpath(paths[0])
+    assert web_app.filter_unmarked_existing_files([relative]) == []
+    print("✓ Relative paths matched against absolute markers")
+
+
+def test_marker_cache():
+    """Test that marker sets are reused until the markers change"""
+    print("\n" + "=" * 60)
+    print("TEST: marker set cache")
+    print("=" * 60)
+
+    import markers
+
+    first = markers.get_all_marker_data()
+    loads = []
+    original = markers.get_all_markers_by_type
+    markers.get_all_markers_by_type = lambda types: loads.append(list(types)) or original(types)
+    try:
+        second = markers.get_all_marker_data()
+        assert second['processed'] is first['processed']
+        assert markers.get_processed_files() is first['processed']
+        assert loads == [], loads
+        print("✓ Unchanged markers served from the cache")
+
+        path = os.path.join(watched_dir, 'cache_new.cbz')
+        loads.clear()
+        markers.mark_file_processed(path)
+        assert os.path.abspath(path) in markers.get_processed_files()
+        assert loads == [['processed']], loads
+        print("✓ Marker write invalidates the cached set")
+
+        # Writes from another process only show up as a version bump
+        unified_store.remove_marker(os.path.abspath(path), 'processed')
+        assert os.path.abspath(path) not in markers.get_all_marker_data()['processed']
+        print("✓ Direct store writes are picked up")
+    finally:
+        markers.get_all_markers_by_type = original
+
+
+def test_marker_cache_across_processes():
+    """Test that a marker written by another worker process invalidates this one's cache"""
+    print("\n" + "=" * 60)
+    print("TEST: marker cache across processes")
+    print("=" * 60)
+
+    import subprocess
+    import markers
+
+    path = os.path.abspath(os.path.join(watched_dir, 'other_worker.cbz'))
+    assert path not in markers.get_processed_files()
+
+    # A separate interpreter stands in for another Gunicorn worker (or the watcher)
+    script = (
+        "import sys; sys.path.insert(0, 'src')\n"
+        "import unified_store\n"
+        f"unified_store.STORE_DIR = {unified_store.STORE_DIR!r}\n"
+        f"unified_store.DB_PATH = {unified_store.DB_PATH!r}\n"
+        f"unified_store.add_marker({path!r}, 'processed')\n"
+    )
+    subprocess.run([sys.executable, '-c', script], check=True, cwd=os.path.dirname(os.path.abspath(__file__)))
+
+    assert path in markers.get_processed_files(), "Marker from another process not visible"
+    assert path in markers.get_all_marker_data()['processed']
+    print("✓ Cached marker sets reload after another process writes")
+
+
+if __name__ == '__main__':
+    try:
+        test_scan_unmarked_counts()
+        test_filter_unmarked_files()
+        test_marker_cache()
+        test_marker_cache_across_processes()
+        print("\n✅ All scan-unmarked tests passed!")
+        sys.exit(0)
+    except Exception as e:
+        print(f"\n❌ Test failed: {e}")
+        import traceback
+        traceback.print_exc()
+        sys.exit(1)
+    finally:
+        shutil.rmtree(temp_dir, ignore_errors=True)
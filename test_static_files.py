@@ -4,6 +4,7 @@ Test that static files (CSS, JS) are served correctly with proper cache headers.
 """
 import os
 import sys
+import gzip
 import tempfile
 
 # Add src directory to path
@@ -15,6 +16,7 @@ os.environ.setdefault('WEB_PORT', '5000')
 
 # Import Flask test client
 from web_app import app
+from version import __version__
 
 # Cache duration constants (in seconds)
 CACHE_DURATION_ONE_YEAR = 31536000  # 365 days
@@ -33,6 +35,8 @@ def test_index_page_loads():
         assert b'/static/css/main.css' in response.data
         # Check that JS script is present
         assert b'/static/js/main.js' in response.data
+        # Long-cached assets are linked with the app version so upgrades are picked up
+        assert f'/static/js/main.js?v={__version__}'.encode() in response.data
         print("✓ Index page loads correctly with external CSS and JS references")
 
 def test_css_file_served():
@@ -61,6 +65,27 @@ def test_js_file_served():
         assert b'function' in response.data or b'const' in response.data
         print("✓ JS file is served with proper cache headers")
 
+def test_gzip_static_files():
+    """Test that CSS/JS are gzip-compressed for clients that accept it"""
+    with app.test_client() as client:
+        plain = client.get('/static/js/main.js')
+        response = client.get('/static/js/main.js', headers={'Accept-Encoding': 'gzip, deflate'})
+        assert response.status_code == 200
+        assert response.headers.get('Content-Encoding') == 'gzip'
+        assert gzip.decompress(response.data) == plain.data
+        assert len(response.data) < len(plain.data) / 2
+        assert response.headers['ETag'] != plain.headers['ETag']
+        assert 'Accept-Encoding' in response.headers['Vary']
+        print(f"✓ JS gzip-compressed ({len(plain.data)} -> {len(response.data)} bytes)")
+        
+        revalidated = client.get('/static/js/main.js', headers={
+            'Accept-Encoding': 'gzip',
+            'If-None-Match': response.headers['ETag']
+        })
+        assert revalidated.status_code == 304
+        assert plain.headers.get('Content-Encoding') is None
+        print("✓ Compressed copy revalidates with its own ETag; plain clients get identity")
+
 def test_icon_file_cache():
     """Test that icon files have shorter cache duration"""
     with app.test_client() as client:
@@ -88,6 +113,7 @@ if __name__ == '__main__':
     test_index_page_loads()
     test_css_file_served()
     test_js_file_served()
+    test_gzip_static_files()
     test_icon_file_cache()
     test_html_size_reduction()
     print("\n✓ All tests passed!")
@@ -61,10 +61,26 @@ def test_unified_database_structure():
         'idx_files_last_modified',
         'idx_files_added_timestamp',
         'idx_markers_filepath',
-        'idx_markers_type'
+        'idx_files_file_size',
+        'idx_markers_type_filepath'
     }
     assert expected_indexes.issubset(indexes), f"Missing indexes. Expected {expected_indexes}, got {indexes}"
     print(f"✓ All required indexes present")
+    assert 'idx_markers_type' not in indexes, "Redundant idx_markers_type still present"
+    print("✓ Redundant marker type index dropped")
+    
+    # Marker filters are answered from the covering index, size sort from its index
+    cursor.execute('''
+        EXPLAIN QUERY PLAN
+        SELECT f.filepath FROM files f
+        INNER JOIN markers m ON f.filepath = m.filepath AND m.marker_type = 'processed'
+    ''')
+    plan = ' '.join(row[-1] for row in cursor.fetchall())
+    assert 'COVERING INDEX idx_markers_type_filepath' in plan, plan
+    cursor.execute("EXPLAIN QUERY PLAN SELECT filepath FROM files ORDER BY file_size LIMIT 10")
+    plan = ' '.join(row[-1] for row in cursor.fetchall())
+    assert 'idx_files_file_size' in plan and 'TEMP B-TREE' not in plan, plan
+    print("✓ Filter and size-sort queries use indexes")
     
     conn.close()
     
@@ -138,6 +154,34 @@ def test_marker_operations():
     assert not unified_store.has_marker(test_file, marker_type), "Marker still exists after removal"
     print(f"✓ Removed marker successfully")
     
+    # Test apply_marker_changes (mixed batch in one transaction)
+    renamed_file = "/test/unified/marker_file_renamed.cbz"
+    unified_store.add_marker(test_file, marker_type)
+    changed = unified_store.apply_marker_changes([
+        ('remove', test_file, marker_type),
+        ('add', renamed_file, marker_type),
+        ('add', renamed_file, 'duplicate'),
+    ])
+    assert changed == 3, f"Expected 3 marker changes, got {changed}"
+    assert not unified_store.has_marker(test_file, marker_type), "Old marker still exists after batch"
+    assert unified_store.has_marker(renamed_file, marker_type), "New marker missing after batch"
+    assert unified_store.has_marker(renamed_file, 'duplicate'), "Duplicate marker missing after batch"
+    unified_store.apply_marker_changes([
+        ('remove', renamed_file, marker_type),
+        ('remove', renamed_file, 'duplicate'),
+    ])
+    print(f"✓ Applied batched marker changes")
+    
+    # All markers of one file in a single lookup
+    unified_store.add_marker(test_file, 'processed')
+    unified_store.add_marker(test_file, 'web_modified')
+    markers = unified_store.get_file_markers(test_file)
+    assert markers == {'processed', 'web_modified'}, f"Unexpected markers: {markers}"
+    assert unified_store.get_file_markers(renamed_file) == set()
+    unified_store.remove_marker(test_file, 'processed')
+    unified_store.remove_marker(test_file, 'web_modified')
+    print(f"✓ Retrieved all markers of a file in one lookup")
+    
     print("✅ Marker operations test PASSED")
 
 
@@ -214,9 +258,102 @@ def test_metadata_operations():
     assert timestamp is not None, "Last sync timestamp is None"
     print(f"✓ Last sync timestamp: {timestamp}")
     
+    # Store version counters move on file and marker changes only
+    files_version, markers_version = unified_store.get_store_version()
+    unified_store.add_file("/test/unified/version_file.cbz", last_modified=time.time(), file_size=1)
+    assert unified_store.get_store_version() == (files_version + 1, markers_version)
+    unified_store.add_marker("/test/unified/version_file.cbz", "processed")
+    assert unified_store.get_store_version() == (files_version + 1, markers_version + 1)
+    unified_store.set_metadata('test_key', 'other_value')
+    assert unified_store.get_store_version() == (files_version + 1, markers_version + 1)
+    print("✓ Store version tracks file and marker changes")
+    
     print("✅ Metadata operations test PASSED")
 
 
+def test_file_counters():
+    """Test that trigger-maintained file counts match counting the tables"""
+    print("\n" + "=" * 60)
+    print("TEST: File Counters")
+    print("=" * 60)
+    
+    def assert_counts(step):
+        with unified_store.get_db_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute('SELECT COUNT(*) FROM files')
+            total = cursor.fetchone()[0]
+            cursor.execute('''
+                SELECT COUNT(*) FROM files WHERE filepath NOT IN (
+                    SELECT filepath FROM markers WHERE marker_type = 'processed'
+                )
+            ''')
+            unmarked = cursor.fetchone()[0]
+        assert unified_store.get_file_count() == total, f"File count wrong after {step}"
+        assert unified_store.get_unmarked_file_count() == unmarked, f"Unmarked count wrong after {step}"
+    
+    base = "/test/counters"
+    assert_counts("setup")
+    unified_store.add_marker(f"{base}/a.cbz", "processed")  # marker before its file
+    unified_store.batch_add_files([f"{base}/{name}.cbz" for name in "abcd"])
+    assert_counts("batch add")
+    unified_store.add_file(f"{base}/a.cbz", last_modified=time.time(), file_size=2)  # replace
+    unified_store.add_marker(f"{base}/b.cbz", "processed")
+    unified_store.add_marker(f"{base}/b.cbz", "processed")  # duplicate marker
+    unified_store.add_marker(f"{base}/c.cbz", "duplicate")
+    assert_counts("markers")
+    unified_store.rename_file(f"{base}/b.cbz", f"{base}/b2.cbz")
+    assert_counts("rename")
+    unified_store.apply_marker_changes([
+        ('remove', f"{base}/b.cbz", 'processed'),
+        ('add', f"{base}/b2.cbz", 'processed'),
+    ])
+    unified_store.apply_file_changes([
+        ('remove', f"{base}/a.cbz", None),
+        ('rename', f"{base}/c.cbz", f"{base}/c2.cbz"),
+        ('add', None, f"{base}/e.cbz"),
+    ])
+    assert_counts("batched changes")
+    unified_store.remove_marker(f"{base}/b2.cbz", "processed")
+    unified_store.batch_remove_files([f"{base}/d.cbz"])
+    assert_counts("removals")
+    print("✓ Counts follow adds, replaces, renames, markers and removals")
+    
+    # Databases from before the counters are seeded on first open
+    with unified_store.get_db_connection() as conn:
+        conn.execute("DELETE FROM metadata WHERE key IN ('file_count', 'processed_file_count')")
+        unified_store._init_count_triggers(conn.cursor())
+        conn.commit()
+    assert_counts("seeding")
+    print("✓ Counts seeded for existing databases")
+    
+    print("✅ File counters test PASSED")
+
+
+def test_processing_failures():
+    """Test that only the most recent processing failures are kept"""
+    print("\n" + "=" * 60)
+    print("TEST: Processing Failures")
+    print("=" * 60)
+    
+    original_max = unified_store.PROCESSING_FAILURES_MAX
+    unified_store.PROCESSING_FAILURES_MAX = 5
+    try:
+        for i in range(8):
+            assert unified_store.add_processing_failure(f"/test/failed/{i}.cbz", f"error {i}")
+        
+        failures = unified_store.get_processing_failures()
+        assert [f['filepath'] for f in failures] == [f"/test/failed/{i}.cbz" for i in range(7, 2, -1)], failures
+        assert failures[0]['error'] == "error 7" and failures[0]['timestamp'] > 0
+        print("✓ Oldest failures dropped, newest returned first")
+        
+        assert len(unified_store.get_processing_failures(limit=2)) == 2
+        print("✓ Limit respected")
+    finally:
+        unified_store.PROCESSING_FAILURES_MAX = original_max
+    
+    print("✅ Processing failures test PASSED")
+
+
 def test_backward_compatibility():
     """Test that file_store and marker_store modules still work via import"""
     print("\n" + "=" * 60)
@@ -346,6 +483,8 @@ def main():
         test_marker_operations()
         test_combined_operations()
         test_metadata_operations()
+        test_file_counters()
+        test_processing_failures()
         test_backward_compatibility()
         test_migration()
         
@@ -0,0 +1,205 @@
+#!/usr/bin/env python3
+"""
+Test that the watcher processes files from a burst of events in parallel on its
+pool, ignores repeat events for a file that is already being processed, and runs
+the bundled process_file module in-process, recording files that fail.
+"""
+
+import sys
+import os
+import tempfile
+import shutil
+import time
+import types
+
+# Create temp directory first
+temp_dir = tempfile.mkdtemp(prefix='test_watcher_parallel_')
+watched_dir = os.path.join(temp_dir, 'comics')
+os.makedirs(watched_dir)
+
+# process_file.py stand-in: sleeps, then records which file it was given
+process_script = os.path.join(temp_dir, 'fake_process.py')
+runs_log = os.path.join(temp_dir, 'runs.log')
+with open(process_script, 'w') as f:
+    f.write(
+        "import sys, time\n"
+        "time.sleep(0.5)\n"
+        f"open({runs_log!r}, 'a').write(sys.argv[1] + '\\n')\n"
+    )
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
+
+# Set up environment before importing modules
+os.environ['WATCHED_DIR'] = watched_dir
+os.environ['CONFIG_DIR'] = temp_dir
+os.environ['PROCESS_SCRIPT'] = process_script
+os.environ['MAX_WORKERS'] = '4'
+
+import unified_store
+unified_store.CONFIG_DIR = temp_dir
+unified_store.STORE_DIR = os.path.join(temp_dir, 'store')
+unified_store.DB_PATH = os.path.join(unified_store.STORE_DIR, 'comicmaintainer.db')
+unified_store._db_initialized = False
+
+import watcher
+
+
+def test_parallel_processing():
+    """Test that a burst of created files is processed concurrently"""
+    print("\n" + "=" * 60)
+    print("TEST: watcher processes a burst of files in parallel")
+    print("=" * 60)
+
+    assert not watcher.RUN_IN_PROCESS, "A custom PROCESS_SCRIPT must run as a script"
+
+    handler = watcher.ChangeHandler()
+    handler._is_file_stable = lambda path: True
+
+    paths = [os.path.join(watched_dir, f'issue_{i}.cbz') for i in range(4)]
+    for path in paths:
+        open(path, 'w').close()
+
+    start = time.time()
+    for path in paths:
+        handler.on_created(types.SimpleNamespace(src_path=path, is_directory=False))
+        # Processing modifies the file; the repeat event must not queue it again
+        handler.on_modified(types.SimpleNamespace(src_path=path, is_directory=False))
+    handler._executor.shutdown(wait=True)
+    elapsed = time.time() - start
+
+    with open(runs_log) as f:
+        runs = f.read().split()
+    assert sorted(runs) == sorted(paths), f"Unexpected runs: {runs}"
+    print("✓ Each file processed exactly once")
+
+    assert elapsed < 0.5 * len(paths), f"Processing looks serial: {elapsed:.2f}s"
+    print(f"✓ {len(paths)} files processed in {elapsed:.2f}s")
+
+    assert not handler._in_flight
+    assert all(not handler._should_process(path) for path in paths)
+    print("✓ Finished files leave the in-flight set and are debounced")
+
+
+def test_event_during_stability_check():
+    """Test that an event arriving while a file is checked is not lost"""
+    print("\n" + "=" * 60)
+    print("TEST: watcher rechecks a file changed during its stability check")
+    print("=" * 60)
+
+    path = os.path.join(watched_dir, 'still_copying.cbz')
+    unstable_path = os.path.join(watched_dir, 'abandoned.cbz')
+    open(path, 'w').close()
+    open(unstable_path, 'w').close()
+
+    checks = []
+    def is_file_stable(checked):
+        checks.append(checked)
+        if checked == unstable_path:
+            return False
+        if checks.count(checked) == 1:
+            # The copy's last write lands while the first check is running
+            handler.on_modified(types.SimpleNamespace(src_path=checked, is_directory=False))
+            return False
+        return True
+
+    handler = watcher.ChangeHandler()
+    handler._is_file_stable = is_file_stable
+    handler.on_created(types.SimpleNamespace(src_path=path, is_directory=False))
+    handler.on_created(types.SimpleNamespace(src_path=unstable_path, is_directory=False))
+    handler._executor.shutdown(wait=True)
+
+    with open(runs_log) as f:
+        runs = f.read().split()
+    assert checks.count(path) == 2 and runs.count(path) == 1, (checks, runs)
+    print("✓ File checked again and processed after the repeat event")
+
+    assert checks.count(unstable_path) == 1 and unstable_path not in runs
+    assert not handler._in_flight and not handler._dirty
+    print("✓ Unstable file without further events is not retried")
+
+
+def test_in_process():
+    """Test that the bundled process_file runs in-process and marks the result"""
+    print("\n" + "=" * 60)
+    print("TEST: watcher runs the bundled process_file in-process")
+    print("=" * 60)
+
+    path = os.path.join(watched_dir, 'in_process.cbz')
+    renamed = os.path.join(watched_dir, 'In Process - Chapter 0001.cbz')
+    open(path, 'w').close()
+
+    calls = []
+    def fake_process_file(filepath):
+        calls.append(filepath)
+        return renamed
+
+    original = watcher.process_file.process_file
+    watcher.process_file.process_file = fake_process_file
+    watcher.RUN_IN_PROCESS = True
+    try:
+        handler = watcher.ChangeHandler()
+        handler._is_file_stable = lambda path: True
+        handler.on_created(types.SimpleNamespace(src_path=path, is_directory=False))
+        handler._executor.shutdown(wait=True)
+    finally:
+        watcher.process_file.process_file = original
+        watcher.RUN_IN_PROCESS = False
+
+    assert calls == [path], calls
+    with open(runs_log) as f:
+        assert path not in f.read().split(), "Bundled processor must not start a subprocess"
+    print("✓ process_file called in-process, no subprocess started")
+
+    assert watcher.MARKER_TYPE_PROCESSED in watcher.get_file_marker_types(renamed)
+    print("✓ Final path marked as processed")
+
+
+def test_failures_recorded():
+    """Test that files failing to process are recorded for the web interface"""
+    print("\n" + "=" * 60)
+    print("TEST: watcher records processing failures")
+    print("=" * 60)
+
+    # Moves go through the same processing path as created files
+    src_path = os.path.join(watched_dir, 'broken.part.cbz')
+    path = os.path.join(watched_dir, 'broken.cbz')
+    open(src_path, 'w').close()
+    os.rename(src_path, path)
+
+    def failing_process_file(filepath):
+        raise ValueError("Not a valid archive")
+
+    original = watcher.process_file.process_file
+    watcher.process_file.process_file = failing_process_file
+    watcher.RUN_IN_PROCESS = True
+    try:
+        handler = watcher.ChangeHandler()
+        handler._is_file_stable = lambda path: True
+        handler.on_moved(types.SimpleNamespace(src_path=src_path, dest_path=path, is_directory=False))
+        handler._executor.shutdown(wait=True)
+    finally:
+        watcher.process_file.process_file = original
+        watcher.RUN_IN_PROCESS = False
+
+    failures = unified_store.get_processing_failures()
+    assert failures and failures[0]['filepath'] == path, failures
+    assert failures[0]['error'] == "Not a valid archive"
+    print("✓ Failure recorded with its error")
+
+
+if __name__ == '__main__':
+    try:
+        test_parallel_processing()
+        test_event_during_stability_check()
+        test_in_process()
+        test_failures_recorded()
+        print("\n✅ All watcher parallel tests passed!")
+        sys.exit(0)
+    except Exception as e:
+        print(f"\n❌ Test failed: {e}")
+        import traceback
+        traceback.print_exc()
+        sys.exit(1)
+    finally:
+        shutil.rmtree(temp_dir, ignore_errors=True)
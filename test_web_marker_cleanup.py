@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+"""
+Test that web modified markers are cleaned up promptly after a burst of
+markers instead of waiting for the next scheduled cleanup.
+"""
+
+import sys
+import os
+import time
+import tempfile
+import shutil
+
+# Create temp directory first
+temp_dir = tempfile.mkdtemp(prefix='test_web_marker_cleanup_')
+watched_dir = os.path.join(temp_dir, 'comics')
+os.makedirs(watched_dir)
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
+
+# Set up environment before importing modules
+os.environ['WATCHED_DIR'] = watched_dir
+
+import unified_store
+unified_store.CONFIG_DIR = temp_dir
+unified_store.STORE_DIR = os.path.join(temp_dir, 'store')
+unified_store.DB_PATH = os.path.join(unified_store.STORE_DIR, 'comicmaintainer.db')
+unified_store._db_initialized = False
+
+import web_app
+
+
+def test_cleanup_after_burst():
+    """Test that crossing the threshold wakes the cleanup thread"""
+    print("\n" + "=" * 60)
+    print("TEST: web marker cleanup after burst")
+    print("=" * 60)
+
+    burst = web_app.WEB_MARKER_CLEANUP_THRESHOLD * 2
+    for i in range(burst):
+        web_app.mark_file_web_modified_wrapper(os.path.join(watched_dir, f'comic_{i:04d}.cbz'))
+    print(f"✓ Wrote {burst} web modified markers")
+
+    deadline = time.time() + 5
+    count = burst
+    while time.time() < deadline:
+        count = len(unified_store.get_markers('web_modified'))
+        if count <= 100:
+            break
+        time.sleep(0.05)
+
+    assert count == 100, f"Expected cleanup to keep 100 markers, found {count}"
+    print("✓ Cleanup ran without waiting for the 5 minute interval")
+
+
+if __name__ == '__main__':
+    try:
+        test_cleanup_after_burst()
+        print("\n✅ All web marker cleanup tests passed!")
+        sys.exit(0)
+    except Exception as e:
+        print(f"\n❌ Test failed: {e}")
+        import traceback
+        traceback.print_exc()
+        sys.exit(1)
+    finally:
+        shutil.rmtree(temp_dir, ignore_errors=True)